@@ -4,6 +4,8 @@ import asyncio
 import os
 import re
 import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import UTC, datetime, timedelta
 from difflib import SequenceMatcher
 from pathlib import Path
@@ -64,10 +66,26 @@ def _get_extract_lock(content_id: str) -> asyncio.Lock:
     return _extract_locks[content_id]
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Own the app-wide SourceValidator and close its HTTP client on shutdown.
+
+    One validator serves every request - its pooled httpx client keeps
+    connections to feed hosts and reddit.com alive between source
+    add/update requests.
+    """
+    app.state.source_validator = SourceValidator()
+    try:
+        yield
+    finally:
+        app.state.source_validator.close()
+
+
 app = FastAPI(
     title="Prismis API",
     description="REST API for managing content sources",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 
@@ -201,6 +219,12 @@ async def get_storage() -> Storage:
         storage.close()
 
 
+# Dependency injection for the app-wide SourceValidator
+async def get_source_validator(request: Request) -> SourceValidator:
+    """Dependency returning the SourceValidator owned by the app lifespan."""
+    return request.app.state.source_validator
+
+
 # Dependency injection for Config
 async def get_config() -> Config:
     """Dependency injection for Config instances.
@@ -405,7 +429,9 @@ def deduplicate_content(
     "/api/sources", response_model=APIResponse, dependencies=[Depends(verify_api_key)]
 )
 async def add_source(
-    request: SourceRequest, storage: Storage = Depends(get_storage)
+    request: SourceRequest,
+    storage: Storage = Depends(get_storage),
+    validator: SourceValidator = Depends(get_source_validator),
 ) -> APIResponse:
     """Add a new content source.
 
@@ -421,8 +447,7 @@ async def add_source(
             name = extract_name_from_url(normalized_url, request.type)
 
         # Validate the source
-        validator = SourceValidator()
-        is_valid, error_msg, metadata = validator.validate_source(
+        is_valid, error_msg, metadata = await validator.avalidate_source(
             normalized_url, request.type
         )
 
@@ -497,6 +522,7 @@ async def update_source(
     source_id: str,
     request: SourceRequest,
     storage: Storage = Depends(get_storage),
+    validator: SourceValidator = Depends(get_source_validator),
 ) -> APIResponse:
     """Update a content source (name and/or URL).
 
@@ -504,8 +530,7 @@ async def update_source(
     """
     try:
         # Get the existing source first
-        sources = storage.get_all_sources()
-        source = next((s for s in sources if s["id"] == source_id), None)
+        source = storage.get_source(source_id)
 
         if not source:
             raise NotFoundError("Source", source_id)
@@ -519,8 +544,7 @@ async def update_source(
             normalized_url = normalize_source_url(request.url, request.type)
 
             # Validate the new URL
-            validator = SourceValidator()
-            is_valid, error_msg, metadata = validator.validate_source(
+            is_valid, error_msg, metadata = await validator.avalidate_source(
                 normalized_url, request.type
             )
 
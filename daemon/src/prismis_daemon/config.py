@@ -1,14 +1,41 @@
 """Configuration loading from TOML and context.md files."""
 
+import functools
 import os
 import tomllib
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any
 
 from .defaults import DEFAULT_CONTEXT_MD
 
 
-@dataclass
+def _freeze(value: Any) -> Any:
+    """Recursively turn parsed TOML tables into read-only mappings and tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_toml(path: str, mtime_ns: int, size: int, inode: int) -> Mapping[str, Any]:
+    """Parse a TOML file, memoized on its stat signature.
+
+    The stat fields are only part of the cache key. An atomic rename over
+    the path (new inode) or any size change always re-parses; an in-place
+    rewrite of identical size within the filesystem's mtime granularity
+    can still be served the previous parse. The result is read-only so
+    every caller can share it.
+    """
+    with open(path, "rb") as f:
+        return _freeze(tomllib.load(f))
+
+
+@dataclass(frozen=True, slots=True)
 class Config:
     """Configuration dataclass with validation.
 
@@ -192,8 +219,11 @@ class Config:
             )
 
         try:
-            with open(config_path, "rb") as f:
-                config_dict = tomllib.load(f)
+            stat = config_path.stat()
+            # Read-only and shared - copy anything handed out as mutable
+            config_dict = _parse_toml(
+                str(config_path), stat.st_mtime_ns, stat.st_size, stat.st_ino
+            )
         except Exception as e:
             raise ValueError(f"Failed to parse config file {config_path}: {e}") from e
 
@@ -250,7 +280,7 @@ class Config:
                 llm_light_service=llm["light_service"],
                 llm_deep_service=llm.get("deep_service"),
                 auto_extract=llm.get("auto_extract", "none"),
-                deep_extract_exclude=llm.get("deep_extract_exclude", []),
+                deep_extract_exclude=list(llm.get("deep_extract_exclude", ())),
                 reddit_client_id=reddit_client_id,
                 reddit_client_secret=reddit_client_secret,
                 reddit_user_agent=reddit["user_agent"],
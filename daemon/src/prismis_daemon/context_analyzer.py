@@ -11,6 +11,13 @@ from .observability import log as obs_log
 
 logger = logging.getLogger(__name__)
 
+# One pass over context.md finds every priority section; a section body runs
+# until the next "## " header line or end of text
+_SECTION_RE = re.compile(
+    r"## (High|Medium|Low) Priority Topics\s*\n(.*?)(?=^## |\Z)",
+    re.DOTALL | re.MULTILINE,
+)
+
 
 class ContextAnalyzer:
     """Analyze flagged content items to suggest new topics for context.md."""
@@ -98,24 +105,13 @@ class ContextAnalyzer:
             logger.warning("Empty context.md provided")
             return sections
 
-        # Split by section headers
-        high_match = re.search(
-            r"## High Priority Topics\s*\n(.*?)(?=\n## |\Z)", context_text, re.DOTALL
-        )
-        medium_match = re.search(
-            r"## Medium Priority Topics\s*\n(.*?)(?=\n## |\Z)", context_text, re.DOTALL
-        )
-        low_match = re.search(
-            r"## Low Priority Topics\s*\n(.*?)(?=\n## |\Z)", context_text, re.DOTALL
-        )
-
-        # Extract bullet points from each section
-        if high_match:
-            sections["high"] = self._extract_topics(high_match.group(1))
-        if medium_match:
-            sections["medium"] = self._extract_topics(medium_match.group(1))
-        if low_match:
-            sections["low"] = self._extract_topics(low_match.group(1))
+        # Split by section headers - first occurrence of each section wins
+        seen = set()
+        for match in _SECTION_RE.finditer(context_text):
+            level = match.group(1).lower()
+            if level not in seen:
+                seen.add(level)
+                sections[level] = self._extract_topics(match.group(2))
 
         logger.debug(
             f"Parsed context sections: {len(sections['high'])} high, "
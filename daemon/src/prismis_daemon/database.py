@@ -113,7 +113,10 @@ def get_db_connection(db_path: Optional[Path] = None) -> sqlite3.Connection:
             f"Database not found at {db_path}. Run init_db() first."
         )
 
-    conn = sqlite3.connect(db_path, check_same_thread=False)
+    # Storage builds a few dozen distinct statements (dynamic IN-lists and
+    # optional filters add variants) - keep them all compiled past the
+    # default 128-entry statement cache
+    conn = sqlite3.connect(db_path, check_same_thread=False, cached_statements=512)
     conn.row_factory = sqlite3.Row  # Enable column access by name
 
     # Load sqlite-vec extension for vector search
@@ -140,6 +143,14 @@ def get_db_connection(db_path: Optional[Path] = None) -> sqlite3.Connection:
     conn.execute("PRAGMA synchronous=NORMAL")
     conn.execute("PRAGMA foreign_keys=ON")
 
+    # Test fixtures run on scratch databases - durability is not needed, so
+    # skip fsyncs and keep sort/index scratch and page cache in RAM. WAL and
+    # normal locking stay: tests open several connections to the same file.
+    if os.environ.get("PRISMIS_TEST_FAST") == "1":
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-64000")
+
     return conn
 
 
@@ -13,6 +13,38 @@ from .observability import log as obs_log
 
 logger = logging.getLogger(__name__)
 
+# Base system prompt for evaluation; learned preferences are appended per call
+_EVALUATION_SYSTEM_PROMPT = """You are an expert content analyst who evaluates articles for personalized relevance to a specific user.
+
+Your task is to evaluate how relevant and interesting this content is to the user based on their personal context.
+
+Respond with ONLY valid JSON in this exact format:
+
+{
+  "priority": "high" | "medium" | "low" | null,
+  "matched_interests": ["specific user interest 1", "specific user interest 2", ...],
+  "reasoning": "One sentence describing content and which interest it relates to (10-15 words)"
+}
+
+CRITICAL EVALUATION RULES:
+1. If matched_interests is empty (no matches found), you MUST return priority: null
+2. If content matches "Not Interested" topics, you MUST return priority: null
+3. Only assign a priority (high/medium/low) if content ACTUALLY matches something in the user's context
+
+Priority Assignment Logic:
+- high: ONLY if it matches topics in "High Priority Topics" section
+- medium: ONLY if it matches topics in "Medium Priority Topics" section
+- low: ONLY if it matches topics in "Low Priority Topics" section
+- null: If NO interests match OR if it matches "Not Interested" topics
+
+IMPORTANT: Most content should be null. Be selective - only assign priorities to content that clearly matches the user's stated interests.
+
+Examples:
+- Random AI discussion with no security relevance → priority: null, matched_interests: []
+- Security tool that matches high priority → priority: "high", matched_interests: ["LLM-driven security tools"]
+- BJJ training video → priority: "low", matched_interests: ["Brazilian Jiu-Jitsu training approaches"]
+- Basic password management article → priority: null, matched_interests: [] (matches Not Interested)"""
+
 
 class PriorityLevel(str, Enum):
     """Content priority levels."""
@@ -22,6 +54,10 @@ class PriorityLevel(str, Enum):
     LOW = "low"
 
 
+# Lowercased LLM priority string -> PriorityLevel, one dict probe per response
+_PRIORITY_LEVELS = {level.value: level for level in PriorityLevel}
+
+
 @dataclass
 class ContentEvaluation:
     """Result of evaluating content against user interests."""
@@ -107,36 +143,7 @@ class ContentEvaluator:
         Returns:
             List of messages for the LLM
         """
-        system_prompt = """You are an expert content analyst who evaluates articles for personalized relevance to a specific user.
-
-Your task is to evaluate how relevant and interesting this content is to the user based on their personal context.
-
-Respond with ONLY valid JSON in this exact format:
-
-{
-  "priority": "high" | "medium" | "low" | null,
-  "matched_interests": ["specific user interest 1", "specific user interest 2", ...],
-  "reasoning": "One sentence describing content and which interest it relates to (10-15 words)"
-}
-
-CRITICAL EVALUATION RULES:
-1. If matched_interests is empty (no matches found), you MUST return priority: null
-2. If content matches "Not Interested" topics, you MUST return priority: null
-3. Only assign a priority (high/medium/low) if content ACTUALLY matches something in the user's context
-
-Priority Assignment Logic:
-- high: ONLY if it matches topics in "High Priority Topics" section
-- medium: ONLY if it matches topics in "Medium Priority Topics" section
-- low: ONLY if it matches topics in "Low Priority Topics" section
-- null: If NO interests match OR if it matches "Not Interested" topics
-
-IMPORTANT: Most content should be null. Be selective - only assign priorities to content that clearly matches the user's stated interests.
-
-Examples:
-- Random AI discussion with no security relevance → priority: null, matched_interests: []
-- Security tool that matches high priority → priority: "high", matched_interests: ["LLM-driven security tools"]
-- BJJ training video → priority: "low", matched_interests: ["Brazilian Jiu-Jitsu training approaches"]
-- Basic password management article → priority: null, matched_interests: [] (matches Not Interested)"""
+        system_prompt = _EVALUATION_SYSTEM_PROMPT
 
         # Inject learned preferences if available (from user feedback history)
         if learned_preferences:
@@ -287,9 +294,8 @@ Evaluate this content and respond with the JSON format specified."""
             else:
                 # Validate and convert to enum
                 priority_str = priority_str.lower() if priority_str else "medium"
-                try:
-                    priority = PriorityLevel(priority_str)
-                except ValueError:
+                priority = _PRIORITY_LEVELS.get(priority_str)
+                if priority is None:
                     # Invalid priority, but has matched interests - default to medium
                     if matched_interests:
                         logger.warning(
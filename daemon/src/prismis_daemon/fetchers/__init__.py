@@ -1,8 +1,32 @@
-"""Content fetchers for different source types."""
+"""Content fetchers for different source types.
 
-from .rss import RSSFetcher
-from .reddit import RedditFetcher
-from .youtube import YouTubeFetcher
-from .file import FileFetcher
+The fetcher classes are resolved on first attribute access (PEP 562), so
+importing one fetcher module does not drag in every other fetcher's
+dependencies - trafilatura and feedparser for RSS, praw for Reddit.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .file import FileFetcher
+    from .reddit import RedditFetcher
+    from .rss import RSSFetcher
+    from .youtube import YouTubeFetcher
+
+# Public fetcher class -> submodule that defines it
+_FETCHER_MODULES = {
+    "RSSFetcher": ".rss",
+    "RedditFetcher": ".reddit",
+    "YouTubeFetcher": ".youtube",
+    "FileFetcher": ".file",
+}
 
 __all__ = ["RSSFetcher", "RedditFetcher", "YouTubeFetcher", "FileFetcher"]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _FETCHER_MODULES:
+        module = importlib.import_module(_FETCHER_MODULES[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -240,8 +240,11 @@ class FileFetcher:
             url: File URL (for diff header)
 
         Returns:
-            Unified diff text
+            Unified diff text (empty when the contents are identical)
         """
+        if previous_content == current_content:
+            return ""
+
         try:
             previous_lines = previous_content.splitlines(keepends=False)
             current_lines = current_content.splitlines(keepends=False)
@@ -273,25 +276,21 @@ class FileFetcher:
         Returns:
             Dict with added_lines, removed_lines, changed_lines counts
         """
+        if previous_content == current_content:
+            return {"added_lines": 0, "removed_lines": 0, "changed_lines": 0}
+
         try:
             previous_lines = previous_content.splitlines(keepends=False)
             current_lines = current_content.splitlines(keepends=False)
 
-            # Use difflib to calculate actual diff
-            diff = list(
-                difflib.unified_diff(previous_lines, current_lines, lineterm="", n=0)
-            )
-
-            added = sum(
-                1
-                for line in diff
-                if line.startswith("+") and not line.startswith("+++")
-            )
-            removed = sum(
-                1
-                for line in diff
-                if line.startswith("-") and not line.startswith("---")
-            )
+            # Count straight from the opcodes unified_diff is built on - no
+            # diff text to render and re-scan for +/- prefixes
+            matcher = difflib.SequenceMatcher(None, previous_lines, current_lines)
+            added = removed = 0
+            for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+                if tag != "equal":
+                    removed += i2 - i1
+                    added += j2 - j1
 
             return {
                 "added_lines": added,
@@ -14,6 +14,49 @@ from ..observability import log as obs_log
 
 logger = logging.getLogger(__name__)
 
+# Subreddit name patterns, tried in order against the protocol-stripped URL
+_SUBREDDIT_PATTERNS = (
+    re.compile(r"reddit\.com/r/([a-zA-Z0-9_]+)"),
+    re.compile(r"^r/([a-zA-Z0-9_]+)"),
+    re.compile(r"^([a-zA-Z0-9_]+)$"),  # Just the subreddit name
+)
+
+# Image/video hosts (matched anywhere in the URL) and media file extensions
+_IMAGE_DOMAIN_RE = re.compile(
+    "|".join(
+        map(
+            re.escape,
+            [
+                "i.redd.it",
+                "i.imgur.com",
+                "imgur.com",
+                "gfycat.com",
+                "v.redd.it",
+                "youtube.com",
+                "youtu.be",
+                "streamable.com",
+            ],
+        )
+    )
+)
+_IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".gif", ".webp", ".mp4", ".webm")
+
+
+def _created_at(submission: Any) -> datetime | None:
+    """Timezone-aware creation time from a submission's Unix created_utc.
+
+    Non-numeric values are rejected up front rather than by catching the
+    TypeError; out-of-range timestamps still raise and are caught.
+    """
+    created_utc = getattr(submission, "created_utc", None)
+    if not isinstance(created_utc, int | float):
+        return None
+    try:
+        return datetime.fromtimestamp(created_utc, tz=UTC)
+    except (OverflowError, OSError, ValueError) as e:
+        logger.debug(f"Could not parse date {created_utc!r}: {e}")
+        return None
+
 
 class RedditFetcher:
     """Fetches and processes Reddit content.
@@ -108,14 +151,7 @@ class RedditFetcher:
                     continue
 
                 # Apply date filter
-                post_date = None
-                if hasattr(submission, "created_utc"):
-                    try:
-                        post_date = datetime.fromtimestamp(
-                            submission.created_utc, tz=UTC
-                        )
-                    except Exception as e:
-                        logger.debug(f"Could not parse post date: {e}")
+                post_date = _created_at(submission)
 
                 # Skip posts older than cutoff
                 if post_date and post_date < cutoff_date:
@@ -185,15 +221,8 @@ class RedditFetcher:
         # Remove protocol and www
         url = url.replace("https://", "").replace("http://", "").replace("www.", "")
 
-        # Pattern to match subreddit names
-        patterns = [
-            r"reddit\.com/r/([a-zA-Z0-9_]+)",
-            r"^r/([a-zA-Z0-9_]+)",
-            r"^([a-zA-Z0-9_]+)$",  # Just the subreddit name
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, url)
+        for pattern in _SUBREDDIT_PATTERNS:
+            match = pattern.search(url)
             if match:
                 return match.group(1)
 
@@ -212,30 +241,9 @@ class RedditFetcher:
         if submission.is_self:
             return False
 
-        # Check common image/video domains
-        image_domains = [
-            "i.redd.it",
-            "i.imgur.com",
-            "imgur.com",
-            "gfycat.com",
-            "v.redd.it",
-            "youtube.com",
-            "youtu.be",
-            "streamable.com",
-        ]
-
+        # Check common image/video domains, then file extensions
         url = submission.url.lower()
-        for domain in image_domains:
-            if domain in url:
-                return True
-
-        # Check file extensions
-        image_extensions = [".jpg", ".jpeg", ".png", ".gif", ".webp", ".mp4", ".webm"]
-        for ext in image_extensions:
-            if url.endswith(ext):
-                return True
-
-        return False
+        return bool(_IMAGE_DOMAIN_RE.search(url)) or url.endswith(_IMAGE_EXTENSIONS)
 
     def _fetch_comments(self, submission) -> list[dict[str, str]]:
         """Fetch top comments from a Reddit submission.
@@ -361,12 +369,7 @@ class RedditFetcher:
             logger.debug(f"Enriched content with {len(comments)} comments")
 
         # Parse published date (Reddit uses Unix timestamp) - make timezone-aware
-        published_at = None
-        if hasattr(submission, "created_utc"):
-            try:
-                published_at = datetime.fromtimestamp(submission.created_utc, tz=UTC)
-            except Exception as e:
-                logger.debug(f"Could not parse date for {external_id}: {e}")
+        published_at = _created_at(submission)
 
         # Extract metrics
         metrics = self._extract_metrics(submission)
@@ -209,18 +209,18 @@ class RSSFetcher:
             Parsed datetime or None if not available
         """
         # feedparser provides parsed time tuple - convert to timezone-aware datetime
-        if hasattr(entry, "published_parsed") and entry.published_parsed:
+        published = getattr(entry, "published_parsed", None)
+        if published:
             try:
-                # Convert time tuple to timezone-aware datetime
-                return datetime(*entry.published_parsed[:6], tzinfo=UTC)
+                return datetime(*published[:6], tzinfo=UTC)
             except Exception as e:
                 logger.debug(f"Could not parse published date: {e}")
 
         # Try updated date as fallback
-        if hasattr(entry, "updated_parsed") and entry.updated_parsed:
+        updated = getattr(entry, "updated_parsed", None)
+        if updated:
             try:
-                # Convert time tuple to timezone-aware datetime
-                return datetime(*entry.updated_parsed[:6], tzinfo=UTC)
+                return datetime(*updated[:6], tzinfo=UTC)
             except Exception as e:
                 logger.debug(f"Could not parse updated date: {e}")
 
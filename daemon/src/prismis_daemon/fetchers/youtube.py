@@ -1,5 +1,7 @@
 """YouTube content fetcher using yt-dlp."""
 
+import functools
+import itertools
 import json
 import logging
 import re
@@ -17,6 +19,9 @@ from ..observability import log as obs_log
 
 logger = logging.getLogger(__name__)
 
+# Caption markup - <c>/<i> styling and inline <00:00:00.000> timestamps
+_VTT_TAG_RE = re.compile(r"<[^>]+>")
+
 
 class YouTubeFetcher:
     """Fetches video transcripts from YouTube channels.
@@ -37,12 +42,23 @@ class YouTubeFetcher:
 
         self.max_items = max_items or config.get_max_items("youtube")
         self.config = config
-        self.yt_dlp_path = shutil.which("yt-dlp")
 
-        if not self.yt_dlp_path:
+    @functools.cached_property
+    def yt_dlp_path(self) -> str:
+        """Locate the yt-dlp binary on first use.
+
+        Resolved lazily so that building a fetcher (and the pure helpers like
+        _parse_upload_date) doesn't require yt-dlp to be installed.
+
+        Raises:
+            Exception: If yt-dlp is not on PATH
+        """
+        path = shutil.which("yt-dlp")
+        if not path:
             raise Exception("yt-dlp not found. Please install it: pip install yt-dlp")
 
-        logger.info(f"YouTube fetcher initialized with yt-dlp at {self.yt_dlp_path}")
+        logger.info(f"YouTube fetcher using yt-dlp at {path}")
+        return path
 
     def fetch_content(self, source: dict[str, Any]) -> list[ContentItem]:
         """Fetch videos with transcripts from a YouTube channel.
@@ -78,20 +94,25 @@ class YouTubeFetcher:
                 f"Found {len(videos)} videos from the last {self.config.max_days_lookback} days"
             )
 
-            # Process each video to get transcript
+            # Fetch all transcripts in one yt-dlp run, then build items
+            selected = videos[: self.max_items]
+            transcript_start = time.time()
+            transcripts = self._extract_transcripts([v["url"] for v in selected])
+            logger.info(
+                f"Transcript extraction took {time.time() - transcript_start:.1f}s"
+            )
+
             items = []
-            for i, video in enumerate(videos[: self.max_items], 1):
+            for i, video in enumerate(selected, 1):
                 try:
-                    video_start = time.time()
                     logger.info(
-                        f"Processing video {i}/{len(videos[: self.max_items])}: {video.get('title', 'Unknown')[:50]}..."
+                        f"Processing video {i}/{len(selected)}: {video.get('title', 'Unknown')[:50]}..."
+                    )
+                    item = self._process_video(
+                        video, source_id, transcripts.get(video["url"])
                     )
-                    item = self._process_video(video, source_id)
                     if item:
                         items.append(item)
-                        logger.info(
-                            f"  ✓ Processed in {time.time() - video_start:.1f}s"
-                        )
                 except Exception as e:
                     logger.warning(
                         f"Failed to process video {video.get('title', 'Unknown')}: {e}"
@@ -260,24 +281,19 @@ class YouTubeFetcher:
             raise Exception("YouTube channel discovery timed out")
 
     def _process_video(
-        self, video: dict[str, Any], source_id: str
+        self, video: dict[str, Any], source_id: str, transcript: str | None
     ) -> ContentItem | None:
-        """Process a video to extract transcript and create ContentItem.
+        """Create a ContentItem from a video and its transcript.
 
         Args:
             video: Video metadata dict
             source_id: Source UUID
+            transcript: Transcript text, or None if not available
 
         Returns:
-            ContentItem with transcript or None if no transcript available
+            ContentItem with transcript, or a low priority placeholder without
         """
-        video_url = video["url"]
-        video_title = video["title"]
-
-        logger.debug(f"Processing video: {video_title}")
-
-        # Extract transcript
-        transcript = self._extract_transcript(video_url)
+        logger.debug(f"Processing video: {video['title']}")
 
         if not transcript:
             # Handle missing transcript
@@ -295,17 +311,28 @@ class YouTubeFetcher:
         Returns:
             Transcript text or None if not available
         """
+        return self._extract_transcripts([video_url])[video_url]
+
+    def _extract_transcripts(self, video_urls: list[str]) -> dict[str, str | None]:
+        """Extract transcripts for several videos with a single yt-dlp run.
+
+        yt-dlp accepts many URLs per invocation, so interpreter start-up and
+        extractor setup are paid once per channel rather than once per video.
+
+        Args:
+            video_urls: YouTube video URLs
+
+        Returns:
+            Dict mapping each URL to its transcript text, or None if not available
+        """
+        transcripts: dict[str, str | None] = dict.fromkeys(video_urls)
+        if not video_urls:
+            return transcripts
+
         # Use temp directory for subtitle files
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
 
-            # Extract video ID from URL for consistent naming
-            video_id = (
-                video_url.split("watch?v=")[1].split("&")[0]
-                if "watch?v=" in video_url
-                else video_url.split("/")[-1]
-            )
-
             # Build yt-dlp command for transcript extraction
             cmd = [
                 self.yt_dlp_path,
@@ -318,56 +345,78 @@ class YouTubeFetcher:
                 "--no-warnings",
                 "--output",
                 str(temp_path / "%(id)s.%(ext)s"),
-                video_url,
+                *video_urls,
             ]
 
-            logger.debug(f"Extracting transcript for: {video_url}")
+            logger.debug(f"Extracting transcripts for {len(video_urls)} videos")
 
             try:
                 subprocess.run(
                     cmd,
                     capture_output=True,
                     text=True,
-                    timeout=60,  # 60 second timeout per video
+                    timeout=60 * len(video_urls),  # 60 second timeout per video
                 )
-
-                # Check for subtitle files - try multiple patterns (from legacy)
-                transcript_text = None
-
-                # Try different subtitle file patterns
-                for pattern in [
+            except subprocess.TimeoutExpired:
+                # Keep whatever subtitle files were written before the timeout
+                logger.warning(
+                    f"Transcript extraction timed out for {len(video_urls)} videos"
+                )
+            except Exception as e:
+                logger.warning(f"Failed to extract transcripts: {e}")
+                return transcripts
+
+            for video_url in video_urls:
+                # Extract video ID from URL for consistent naming
+                video_id = (
+                    video_url.split("watch?v=")[1].split("&")[0]
+                    if "watch?v=" in video_url
+                    else video_url.split("/")[-1]
+                )
+                patterns = [
                     f"{video_id}.en*.vtt",
                     f"{video_id}.en*.srt",
                     f"{video_id}.vtt",
                     f"{video_id}.srt",
-                    "*.en.vtt",  # Fallback patterns
-                    "*.vtt",
-                ]:
-                    subtitle_files = list(temp_path.glob(pattern))
-                    if subtitle_files:
-                        # Use the first matching file
-                        transcript_file = subtitle_files[0]
-                        logger.debug(f"Found transcript file: {transcript_file.name}")
-
-                        with open(transcript_file, encoding="utf-8") as f:
-                            raw_transcript = f.read()
-
-                        # Parse VTT/SRT to plain text
-                        transcript_text = self._parse_vtt_transcript(raw_transcript)
-                        break
-
-                if not transcript_text:
+                ]
+                if len(video_urls) == 1:
+                    # Only one video in the directory, so any subtitle file is it
+                    patterns += ["*.en.vtt", "*.vtt"]
+
+                try:
+                    transcripts[video_url] = self._read_transcript(temp_path, patterns)
+                except Exception as e:
+                    logger.warning(f"Failed to read transcript for {video_url}: {e}")
+
+                if not transcripts[video_url]:
                     logger.debug(f"No transcript file found for video: {video_url}")
-                    return None
 
-                return transcript_text
+        return transcripts
 
-            except subprocess.TimeoutExpired:
-                logger.warning(f"Transcript extraction timed out for: {video_url}")
-                return None
-            except Exception as e:
-                logger.warning(f"Failed to extract transcript: {e}")
-                return None
+    def _read_transcript(self, temp_path: Path, patterns: list[str]) -> str | None:
+        """Read and parse the first subtitle file matching one of patterns.
+
+        Args:
+            temp_path: Directory yt-dlp wrote subtitle files to
+            patterns: Glob patterns to try, in order of preference
+
+        Returns:
+            Transcript text or None if no file matched
+        """
+        for pattern in patterns:
+            subtitle_files = list(temp_path.glob(pattern))
+            if subtitle_files:
+                # Use the first matching file
+                transcript_file = subtitle_files[0]
+                logger.debug(f"Found transcript file: {transcript_file.name}")
+
+                with open(transcript_file, encoding="utf-8") as f:
+                    raw_transcript = f.read()
+
+                # Parse VTT/SRT to plain text
+                return self._parse_vtt_transcript(raw_transcript) or None
+
+        return None
 
     def _parse_vtt_transcript(self, vtt_content: str) -> str:
         """Parse VTT subtitle file to extract plain text.
@@ -380,7 +429,6 @@ class YouTubeFetcher:
         """
         lines = vtt_content.split("\n")
         text_lines = []
-        last_line = ""  # Track last line to avoid duplicates
 
         for line in lines:
             line = line.strip()
@@ -399,22 +447,17 @@ class YouTubeFetcher:
             if line.isdigit():
                 continue
 
-            # Remove HTML tags
-            line = re.sub(r"<[^>]+>", "", line)
-
-            # Remove timestamp tags like <00:00:00.000>
-            line = re.sub(r"<[\d:.,]+>", "", line)
+            # Remove HTML and timestamp tags like <c> or <00:00:00.000>
+            line = _VTT_TAG_RE.sub("", line)
 
             # Clean up extra whitespace
             line = " ".join(line.split())
-
-            # Skip duplicate lines (YouTube often repeats lines in captions)
-            if line and line != last_line:
+            if line:
                 text_lines.append(line)
-                last_line = line
 
-        # Join lines with spaces (VTT often splits mid-sentence)
-        return " ".join(text_lines)
+        # Collapse consecutive repeats (YouTube often repeats lines in
+        # captions) and join with spaces (VTT often splits mid-sentence)
+        return " ".join(line for line, _ in itertools.groupby(text_lines))
 
     def _handle_missing_transcript(
         self, video: dict[str, Any], source_id: str
@@ -496,9 +539,13 @@ class YouTubeFetcher:
             return None
 
         try:
-            # Parse date and make it timezone-aware (UTC)
-            parsed_date = datetime.strptime(date_str, "%Y%m%d")
-            return parsed_date.replace(tzinfo=UTC)
+            # Slice the fixed-width fields directly - strptime's format
+            # interpreter is far slower than three int() calls
+            if len(date_str) != 8 or not (date_str.isascii() and date_str.isdigit()):
+                raise ValueError(date_str)
+            return datetime(
+                int(date_str[:4]), int(date_str[4:6]), int(date_str[6:]), tzinfo=UTC
+            )
         except ValueError:
             logger.debug(f"Could not parse date: {date_str}")
             return None
@@ -6,7 +6,7 @@ from datetime import datetime
 from typing import Optional, Dict, Any
 
 
-@dataclass
+@dataclass(slots=True)
 class ContentItem:
     """Represents a content item fetched from a source.
 
@@ -48,7 +48,7 @@ class ContentItem:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Source:
     """Represents a content source (RSS feed, Reddit sub, YouTube channel).
 
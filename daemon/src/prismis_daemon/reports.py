@@ -1,10 +1,15 @@
 """Report generation for Prismis content."""
 
 from datetime import datetime, timedelta, timezone
+from functools import cached_property
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass, field
+import heapq
 import html
 
+# Null published_at ranks as the oldest possible item
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
 
 @dataclass
 class ContentSummary:
@@ -41,6 +46,21 @@ class ContentSummary:
             return f"{days} day{'s' if days != 1 else ''} ago"
 
 
+def _must_read_rank(item: ContentSummary) -> tuple[int, datetime]:
+    """Rank key for must-reads: (matched interest count, published_at).
+
+    Missing, null, or non-list analysis data counts as zero interests.
+    """
+    analysis = item.analysis
+    interests = (
+        analysis.get("matched_interests") if isinstance(analysis, dict) else None
+    )
+    return (
+        len(interests) if isinstance(interests, list) else 0,
+        item.published_at or _EPOCH,
+    )
+
+
 @dataclass
 class DailyReport:
     """Daily report containing prioritized content summaries."""
@@ -98,7 +118,7 @@ class DailyReport:
 
         return list(themes)[:3]  # Top 3 themes
 
-    @property
+    @cached_property
     def top_3_must_reads(self) -> List[ContentSummary]:
         """Get top 3 must-read items using interest-based ranking.
 
@@ -107,46 +127,14 @@ class DailyReport:
         - Tiebreaker: published_at (DESC - newest first)
         - Fallback: Show honest count (don't pad with medium priority)
 
+        Computed on first access and cached - reports are built complete by
+        ReportGenerator and not mutated afterwards.
+
         Returns:
             List of 0-3 ContentSummary items, ranked by relevance
         """
-        if not self.high_priority:
-            return []
-
-        # Enrich items with ranking metadata
-        ranked_items = []
-        for item in self.high_priority:
-            # Extract matched_interests from analysis, handle missing/null
-            matched_interests = []
-            if item.analysis and isinstance(item.analysis, dict):
-                matched_interests = item.analysis.get("matched_interests", [])
-                if not isinstance(matched_interests, list):
-                    matched_interests = []
-
-            interest_count = len(matched_interests)
-
-            # Handle null published_at (treat as epoch - oldest possible)
-            published_at = item.published_at
-            if published_at is None:
-                published_at = datetime(1970, 1, 1, tzinfo=timezone.utc)
-
-            ranked_items.append(
-                {
-                    "item": item,
-                    "interest_count": interest_count,
-                    "published_at": published_at,
-                }
-            )
-
-        # Sort by interest_count DESC, then published_at DESC
-        ranked_items.sort(
-            key=lambda x: (x["interest_count"], x["published_at"]), reverse=True
-        )
-
-        # Take top 3 (or fewer if <3 available)
-        top_3 = [x["item"] for x in ranked_items[:3]]
-
-        return top_3
+        # nlargest matches sorted(..., reverse=True)[:3], ties included
+        return heapq.nlargest(3, self.high_priority, key=_must_read_rank)
 
 
 class ReportGenerator:
@@ -544,7 +532,11 @@ class ReportGenerator:
             html_parts.append("    </div>")
 
         # High Priority section (remaining items after top 3)
-        remaining_high = [item for item in report.high_priority if item not in top_3]
+        # Identity check - dataclass equality would compare every field per item
+        top_3_ids = {id(item) for item in top_3}
+        remaining_high = [
+            item for item in report.high_priority if id(item) not in top_3_ids
+        ]
         if remaining_high:
             html_parts.append('    <div class="section">')
             html_parts.append(
@@ -73,6 +73,10 @@ CREATE INDEX IF NOT EXISTS idx_content_fetched ON content(fetched_at DESC);
 CREATE INDEX IF NOT EXISTS idx_content_archived ON content(archived_at);
 CREATE INDEX IF NOT EXISTS idx_content_interesting ON content(interesting_override);
 CREATE INDEX IF NOT EXISTS idx_content_user_feedback ON content(user_feedback);
+-- Covering index: dedup lookups (external_id by source_id) never touch content rows
+CREATE INDEX IF NOT EXISTS idx_content_source_external ON content(source_id, external_id);
+-- Partial index for unread-by-priority listings; read rows are never returned
+CREATE INDEX IF NOT EXISTS idx_content_unread_priority ON content(priority, published_at DESC) WHERE read = 0;
 CREATE INDEX IF NOT EXISTS idx_sources_active ON sources(active);
 CREATE INDEX IF NOT EXISTS idx_source_categories_source ON source_categories(source_id);
 CREATE INDEX IF NOT EXISTS idx_source_categories_category ON source_categories(category_id);
@@ -4,6 +4,8 @@ import json
 import sqlite3
 import time
 import uuid
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from datetime import UTC, datetime, timedelta
 from operator import itemgetter
 from pathlib import Path
@@ -30,18 +32,62 @@ class Storage:
         AND (user_feedback != 'up' OR user_feedback IS NULL)
     """
 
-    def __init__(self, db_path: Path | None = None):
+    # Content INSERT shared by add_content_bulk() and the ON CONFLICT variants
+    # below - bind with _content_insert_params()
+    CONTENT_INSERT_SQL = """
+        INSERT INTO content (
+            id, source_id, external_id, title, url, content,
+            summary, analysis, priority, published_at,
+            fetched_at, read, favorited, notes,
+            created_at, updated_at
+        )
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
+                CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+    """
+
+    # Single-statement dedup on external_id - RETURNING yields the new id,
+    # or no row when the external_id already exists
+    CONTENT_INSERT_IGNORE_SQL = (
+        CONTENT_INSERT_SQL
+        + """    ON CONFLICT(external_id) DO NOTHING
+        RETURNING id
+    """
+    )
+
+    # Metadata refresh for an external_id that already exists - the update
+    # half of create_or_update_content, after the insert came back empty
+    CONTENT_METADATA_UPDATE_SQL = """
+        UPDATE content
+        SET content = :content, summary = :summary, analysis = :analysis,
+            priority = :priority, updated_at = CURRENT_TIMESTAMP
+        WHERE external_id = :external_id
+        RETURNING id
+    """
+
+    def __init__(
+        self,
+        db_path: Path | None = None,
+        *,
+        connection_factory: Callable[
+            [Path | None], sqlite3.Connection
+        ] = get_db_connection,
+    ):
         """Initialize storage with database connection.
 
         Args:
             db_path: Optional custom database path for testing.
                      Defaults to $XDG_DATA_HOME/prismis/prismis.db
                      (or ~/.local/share/prismis/prismis.db)
+            connection_factory: Opens a connection for db_path; every
+                     connection Storage uses comes from here (tests pass
+                     a stub instead of patching get_db_connection)
         """
         self.db_path = db_path
+        self._connect = connection_factory
         self._conn = None  # Lazy connection initialization
+        self._in_transaction = False  # Set while transaction() is active
         # Test that we can create a connection
-        test_conn = get_db_connection(self.db_path)
+        test_conn = self._connect(self.db_path)
         test_conn.close()
 
     @property
@@ -52,7 +98,7 @@ class Storage:
         Connection is reused across multiple operations for efficiency.
         """
         if self._conn is None:
-            self._conn = get_db_connection(self.db_path)
+            self._conn = self._connect(self.db_path)
         return self._conn
 
     def close(self) -> None:
@@ -64,6 +110,55 @@ class Storage:
             self._conn.close()
             self._conn = None
 
+    @contextmanager
+    def transaction(self, defer_foreign_keys: bool = False) -> Iterator["Storage"]:
+        """Group several writes into one transaction and one commit.
+
+        Methods called inside the block skip their own commit; the block
+        commits once on exit, or rolls everything back if it raises.
+        Nested calls join the outer transaction.
+
+        Args:
+            defer_foreign_keys: Check foreign keys once at COMMIT instead of
+                per statement, so rows may reference parents inserted later
+                in the block. Violations still fail the commit. A nested
+                call turns deferral on for the rest of the outer transaction.
+
+        Example:
+            with storage.transaction():
+                for item in items:
+                    storage.add_content(item)
+        """
+        if self._in_transaction:
+            if defer_foreign_keys:
+                self.conn.execute("PRAGMA defer_foreign_keys=ON")
+            yield self
+            return
+
+        self.conn.execute("BEGIN IMMEDIATE")
+        if defer_foreign_keys:
+            # Resets to OFF automatically when the transaction ends
+            self.conn.execute("PRAGMA defer_foreign_keys=ON")
+        self._in_transaction = True
+        try:
+            yield self
+            self.conn.commit()
+        except BaseException:
+            self.conn.rollback()
+            raise
+        finally:
+            self._in_transaction = False
+
+    def _commit(self) -> None:
+        """Commit unless a transaction() block will commit for us."""
+        if not self._in_transaction:
+            self.conn.commit()
+
+    def _rollback(self) -> None:
+        """Roll back unless a transaction() block owns the rollback."""
+        if not self._in_transaction:
+            self.conn.rollback()
+
     def __enter__(self):
         """Context manager entry - returns self for use in with statements."""
         return self
@@ -92,31 +187,47 @@ class Storage:
 
         # Use reusable connection for better performance
         try:
-            # Check if source already exists
-            cursor = self.conn.execute("SELECT id FROM sources WHERE url = ?", (url,))
-            existing = cursor.fetchone()
-
-            if existing:
-                # Source already exists, return its UUID
-                return existing[0]
-
-            # Generate new UUID and insert
+            # Insert unless the URL exists - new sources take one statement
             source_id = str(uuid.uuid4())
-            self.conn.execute(
+            inserted = self.conn.execute(
                 """
                 INSERT INTO sources (id, url, type, name, created_at, updated_at)
                 VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+                ON CONFLICT(url) DO NOTHING
+                RETURNING id
                 """,
                 (source_id, url, source_type, name),
-            )
+            ).fetchall()
+            self._commit()
 
-            self.conn.commit()
-            return source_id
+            if inserted:
+                return source_id
+
+            # Source already exists, return its UUID. DO UPDATE would return
+            # it directly but fires update_sources_timestamp on every re-add
+            cursor = self.conn.execute("SELECT id FROM sources WHERE url = ?", (url,))
+            return cursor.fetchone()[0]
 
         except sqlite3.Error as e:
-            self.conn.rollback()
+            self._rollback()
             raise sqlite3.Error(f"Failed to add source: {e}") from e
 
+    @staticmethod
+    def _source_row_to_dict(row: sqlite3.Row) -> dict[str, Any]:
+        """Convert a sources row into a source dict."""
+        return {
+            "id": row["id"],
+            "url": row["url"],
+            "type": row["type"],
+            "name": row["name"],
+            "active": bool(row["active"]),
+            "error_count": row["error_count"],
+            "last_error": row["last_error"],
+            "last_fetched_at": row["last_fetched_at"],
+            "created_at": row["created_at"],
+            "updated_at": row["updated_at"],
+        }
+
     def get_active_sources(self) -> list[dict[str, Any]]:
         """Get all active content sources.
 
@@ -134,28 +245,101 @@ class Storage:
                 """
             )
 
-            sources = []
-            for row in cursor.fetchall():
-                sources.append(
-                    {
-                        "id": row["id"],
-                        "url": row["url"],
-                        "type": row["type"],
-                        "name": row["name"],
-                        "active": bool(row["active"]),
-                        "error_count": row["error_count"],
-                        "last_error": row["last_error"],
-                        "last_fetched_at": row["last_fetched_at"],
-                        "created_at": row["created_at"],
-                        "updated_at": row["updated_at"],
-                    }
-                )
-
-            return sources
+            return [self._source_row_to_dict(row) for row in cursor.fetchall()]
 
         except sqlite3.Error as e:
             raise sqlite3.Error(f"Failed to get active sources: {e}") from e
 
+    def _content_item_from_dict(self, item: dict[str, Any]) -> ContentItem:
+        """Build a ContentItem from a content dict.
+
+        If no source_id is provided, the first active source is used.
+
+        Raises:
+            ValueError: If no source_id is provided and no active sources exist
+        """
+        # If no source_id provided, use the first available source
+        source_id = item.get("source_id")
+        if not source_id:
+            sources = self.get_active_sources()
+            if sources:
+                source_id = sources[0]["id"]
+            else:
+                raise ValueError(
+                    "No source_id provided and no active sources available"
+                )
+
+        # Create ContentItem from dict with required fields - id comes from
+        # the dataclass default_factory, external_id only falls back to a
+        # fresh UUID when the dict lacks one
+        content_item = ContentItem(
+            external_id=(
+                item["external_id"] if "external_id" in item else str(uuid.uuid4())
+            ),
+            title=item.get("title", ""),
+            url=item.get("url", ""),
+            content=item.get("content", ""),
+            source_id=source_id,
+        )
+        # Set optional fields if provided
+        if "summary" in item:
+            content_item.summary = item["summary"]
+        if "analysis" in item:
+            content_item.analysis = item["analysis"]
+        if "priority" in item:
+            content_item.priority = item["priority"]
+        # Timestamps may arrive as datetimes or as ISO 8601 strings
+        for key in ("published_at", "fetched_at"):
+            if key in item:
+                value = item[key]
+                if isinstance(value, str):
+                    value = datetime.fromisoformat(value)
+                setattr(content_item, key, value)
+        if "read" in item:
+            content_item.read = item["read"]
+        if "favorited" in item:
+            content_item.favorited = item["favorited"]
+        if "notes" in item:
+            content_item.notes = item["notes"]
+        return content_item
+
+    @staticmethod
+    def _analysis_json(item: ContentItem) -> str | None:
+        """Serialize the item's analysis dict to JSON, None if absent."""
+        return json.dumps(item.analysis) if item.analysis else None
+
+    @staticmethod
+    def _content_insert_params(item: ContentItem) -> tuple:
+        """Build the CONTENT_INSERT_SQL bind parameters for a ContentItem."""
+        analysis_json = Storage._analysis_json(item)
+
+        # Convert datetime bindings to ISO strings — Python 3.12 deprecated
+        # the default sqlite3 datetime adapter. Matches deep_extractor.py:156
+        # canonical UTC-ISO timestamp shape.
+        published_at_iso = item.published_at.isoformat() if item.published_at else None
+        fetched_at_iso = (
+            item.fetched_at.isoformat()
+            if item.fetched_at
+            else datetime.now(UTC).isoformat()
+        )
+
+        return (
+            item.id,  # Use the UUID from the item
+            item.source_id,
+            item.external_id,
+            item.title,
+            item.url,
+            item.content,
+            item.summary,
+            analysis_json,
+            item.priority,
+            published_at_iso,
+            fetched_at_iso,
+            item.read,
+            item.favorited,
+            item.notes,
+        )
+
     def add_content(self, item: ContentItem | dict[str, Any]) -> str | None:
         """Add content item to database with deduplication.
 
@@ -175,54 +359,21 @@ class Storage:
 
         # Convert dict to ContentItem if needed
         if isinstance(item, dict):
-            # If no source_id provided, use the first available source
-            source_id = item.get("source_id")
-            if not source_id:
-                sources = self.get_active_sources()
-                if sources:
-                    source_id = sources[0]["id"]
-                else:
-                    raise ValueError(
-                        "No source_id provided and no active sources available"
-                    )
-
-            # Create ContentItem from dict with required fields
-            content_item = ContentItem(
-                id=str(uuid.uuid4()),
-                external_id=item.get("external_id", str(uuid.uuid4())),
-                title=item.get("title", ""),
-                url=item.get("url", ""),
-                content=item.get("content", ""),
-                source_id=source_id,
-            )
-            # Set optional fields if provided
-            if "summary" in item:
-                content_item.summary = item["summary"]
-            if "analysis" in item:
-                content_item.analysis = item["analysis"]
-            if "priority" in item:
-                content_item.priority = item["priority"]
-            if "published_at" in item:
-                content_item.published_at = item["published_at"]
-            if "fetched_at" in item:
-                content_item.fetched_at = item["fetched_at"]
-            if "read" in item:
-                content_item.read = item["read"]
-            if "favorited" in item:
-                content_item.favorited = item["favorited"]
-            if "notes" in item:
-                content_item.notes = item["notes"]
-            item = content_item
-
-        conn = get_db_connection(self.db_path)
-        try:
-            # Check if content already exists (deduplication)
-            cursor = conn.execute(
-                "SELECT id FROM content WHERE external_id = ?", (item.external_id,)
-            )
-            existing = cursor.fetchone()
+            item = self._content_item_from_dict(item)
 
-            if existing:
+        # Join an open transaction() on the shared connection; otherwise use
+        # a dedicated connection so the insert commits independently
+        conn = self.conn if self._in_transaction else self._connect(self.db_path)
+        try:
+            # Insert unless external_id exists (deduplication) in one statement;
+            # fetchall() steps RETURNING to completion so the commit can run
+            inserted = conn.execute(
+                self.CONTENT_INSERT_IGNORE_SQL, self._content_insert_params(item)
+            ).fetchall()
+            if not self._in_transaction:
+                conn.commit()
+
+            if not inserted:
                 # Duplicate - external_id already exists
                 duration_ms = int((time.time() - start_time) * 1000)
                 obs_log(
@@ -235,53 +386,6 @@ class Storage:
                 )
                 return None
 
-            # Serialize analysis dict to JSON if present
-            analysis_json = None
-            if item.analysis:
-                analysis_json = json.dumps(item.analysis)
-
-            # Convert datetime bindings to ISO strings — Python 3.12 deprecated
-            # the default sqlite3 datetime adapter. Matches deep_extractor.py:156
-            # canonical UTC-ISO timestamp shape.
-            published_at_iso = (
-                item.published_at.isoformat() if item.published_at else None
-            )
-            fetched_at_iso = (
-                item.fetched_at.isoformat()
-                if item.fetched_at
-                else datetime.now(UTC).isoformat()
-            )
-
-            conn.execute(
-                """
-                INSERT INTO content (
-                    id, source_id, external_id, title, url, content,
-                    summary, analysis, priority, published_at,
-                    fetched_at, read, favorited, notes,
-                    created_at, updated_at
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                        CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
-                """,
-                (
-                    item.id,  # Use the UUID from the item
-                    item.source_id,
-                    item.external_id,
-                    item.title,
-                    item.url,
-                    item.content,
-                    item.summary,
-                    analysis_json,
-                    item.priority,
-                    published_at_iso,
-                    fetched_at_iso,
-                    item.read,
-                    item.favorited,
-                    item.notes,
-                ),
-            )
-
-            conn.commit()
             duration_ms = int((time.time() - start_time) * 1000)
             obs_log(
                 "db.insert",
@@ -294,7 +398,8 @@ class Storage:
             return item.id
 
         except sqlite3.Error as e:
-            conn.rollback()
+            if not self._in_transaction:
+                conn.rollback()
             duration_ms = int((time.time() - start_time) * 1000)
             obs_log(
                 "db.insert",
@@ -306,6 +411,72 @@ class Storage:
             )
             raise sqlite3.Error(f"Failed to add content: {e}") from e
 
+    def add_content_bulk(
+        self, items: list[ContentItem | dict[str, Any]]
+    ) -> list[str | None]:
+        """Add multiple content items in a single transaction.
+
+        Same deduplication as add_content() (by external_id, including
+        duplicates within the batch), but every row goes through the same
+        ON CONFLICT DO NOTHING insert on one connection with one commit.
+
+        Args:
+            items: ContentItems to store, or dicts with content data
+
+        Returns:
+            UUIDs of the inserted content in input order, None for duplicates
+
+        Raises:
+            sqlite3.Error: If database operation fails
+        """
+        start_time = time.time()
+
+        content_items = [
+            self._content_item_from_dict(item) if isinstance(item, dict) else item
+            for item in items
+        ]
+        if not content_items:
+            return []
+
+        try:
+            # Dedup per row in the insert itself - no bound-parameter probe,
+            # so batch size isn't capped by SQLITE_MAX_VARIABLE_NUMBER
+            content_ids: list[str | None] = []
+            for item in content_items:
+                inserted = self.conn.execute(
+                    self.CONTENT_INSERT_IGNORE_SQL, self._content_insert_params(item)
+                ).fetchall()
+                content_ids.append(item.id if inserted else None)
+            self._commit()
+
+            duration_ms = int((time.time() - start_time) * 1000)
+            obs_log(
+                "db.insert",
+                table="content",
+                operation="add_content_bulk",
+                row_count=sum(1 for content_id in content_ids if content_id),
+                duration_ms=duration_ms,
+                status="success",
+            )
+            return content_ids
+
+        except sqlite3.Error as e:
+            self._rollback()
+            duration_ms = int((time.time() - start_time) * 1000)
+            obs_log(
+                "db.insert",
+                table="content",
+                operation="add_content_bulk",
+                error=str(e),
+                duration_ms=duration_ms,
+                status="error",
+            )
+            raise sqlite3.Error(f"Failed to add content in bulk: {e}") from e
+        except Exception:
+            # A row that can't be bound fails the whole batch - undo it
+            self._rollback()
+            raise
+
     def create_or_update_content(
         self, item: ContentItem | dict[str, Any]
     ) -> tuple[str, bool]:
@@ -328,123 +499,33 @@ class Storage:
         """
         # Convert dict to ContentItem if needed (same logic as add_content)
         if isinstance(item, dict):
-            # If no source_id provided, use the first available source
-            source_id = item.get("source_id")
-            if not source_id:
-                sources = self.get_active_sources()
-                if sources:
-                    source_id = sources[0]["id"]
-                else:
-                    raise ValueError(
-                        "No source_id provided and no active sources available"
-                    )
-
-            # Create ContentItem from dict with required fields
-            content_item = ContentItem(
-                id=str(uuid.uuid4()),
-                external_id=item.get("external_id", str(uuid.uuid4())),
-                title=item.get("title", ""),
-                url=item.get("url", ""),
-                content=item.get("content", ""),
-                source_id=source_id,
-            )
-            # Set optional fields if provided
-            if "summary" in item:
-                content_item.summary = item["summary"]
-            if "analysis" in item:
-                content_item.analysis = item["analysis"]
-            if "priority" in item:
-                content_item.priority = item["priority"]
-            if "published_at" in item:
-                content_item.published_at = item["published_at"]
-            if "fetched_at" in item:
-                content_item.fetched_at = item["fetched_at"]
-            if "read" in item:
-                content_item.read = item["read"]
-            if "favorited" in item:
-                content_item.favorited = item["favorited"]
-            if "notes" in item:
-                content_item.notes = item["notes"]
-            item = content_item
+            item = self._content_item_from_dict(item)
 
         try:
-            # Check if content already exists using helper method
-            existing = self._get_by_external_id(item.external_id)
-
-            if existing:
-                # Update existing content (metadata only)
-                analysis_json = None
-                if item.analysis:
-                    analysis_json = json.dumps(item.analysis)
-
-                self.conn.execute(
-                    """
-                    UPDATE content 
-                    SET content = ?, summary = ?, analysis = ?, priority = ?, updated_at = CURRENT_TIMESTAMP
-                    WHERE external_id = ?
-                    """,
-                    (
-                        item.content,
-                        item.summary,
-                        analysis_json,
-                        item.priority,
-                        item.external_id,
-                    ),
-                )
-                self.conn.commit()
-                return existing["id"], False
-
+            # A row comes back only when the insert happened - that, not the
+            # id, decides is_new, so re-upserting one item reports an update
+            inserted = self.conn.execute(
+                self.CONTENT_INSERT_IGNORE_SQL, self._content_insert_params(item)
+            ).fetchall()
+            is_new = bool(inserted)
+            if is_new:
+                [(content_id,)] = inserted
             else:
-                # Create new content (same logic as add_content)
-                analysis_json = None
-                if item.analysis:
-                    analysis_json = json.dumps(item.analysis)
-
-                # Convert datetime bindings to ISO strings — Python 3.12 deprecated
-                # the default sqlite3 datetime adapter. Matches deep_extractor.py:156
-                # canonical UTC-ISO timestamp shape.
-                published_at_iso = (
-                    item.published_at.isoformat() if item.published_at else None
-                )
-                fetched_at_iso = (
-                    item.fetched_at.isoformat()
-                    if item.fetched_at
-                    else datetime.now(UTC).isoformat()
-                )
-
-                self.conn.execute(
-                    """
-                    INSERT INTO content (
-                        id, source_id, external_id, title, url, content,
-                        summary, analysis, priority, published_at,
-                        fetched_at, read, favorited, notes,
-                        created_at, updated_at
-                    )
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                            CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
-                    """,
-                    (
-                        item.id,
-                        item.source_id,
-                        item.external_id,
-                        item.title,
-                        item.url,
-                        item.content,
-                        item.summary,
-                        analysis_json,
-                        item.priority,
-                        published_at_iso,
-                        fetched_at_iso,
-                        item.read,
-                        item.favorited,
-                        item.notes,
-                    ),
-                )
-                self.conn.commit()
-                return item.id, True
+                [(content_id,)] = self.conn.execute(
+                    self.CONTENT_METADATA_UPDATE_SQL,
+                    {
+                        "content": item.content,
+                        "summary": item.summary,
+                        "analysis": self._analysis_json(item),
+                        "priority": item.priority,
+                        "external_id": item.external_id,
+                    },
+                ).fetchall()
+            self._commit()
+            return content_id, is_new
 
         except sqlite3.Error as e:
-            self.conn.rollback()
+            self._rollback()
             raise sqlite3.Error(f"Failed to create or update content: {e}") from e
 
     def update_analysis(self, content_id: str, analysis: dict) -> bool:
@@ -470,10 +551,10 @@ class Storage:
                 "UPDATE content SET analysis = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
                 (analysis_json, content_id),
             )
-            self.conn.commit()
+            self._commit()
             return cursor.rowcount > 0
         except sqlite3.Error as e:
-            self.conn.rollback()
+            self._rollback()
             raise sqlite3.Error(f"Failed to update analysis: {e}") from e
 
     def get_existing_external_ids(self, source_id: str) -> set[str]:
@@ -495,8 +576,10 @@ class Storage:
             cursor = self.conn.execute(
                 "SELECT external_id FROM content WHERE source_id = ?", (source_id,)
             )
-            # Use set comprehension for O(1) lookup performance
-            return {row[0] for row in cursor.fetchall()}
+            # Stream rows straight into the set - no intermediate row list.
+            # idx_content_source_external covers (source_id, external_id),
+            # so this never touches the table itself
+            return {row[0] for row in cursor}
 
         except sqlite3.Error as e:
             raise sqlite3.Error(f"Failed to get existing external_ids: {e}") from e
@@ -504,8 +587,8 @@ class Storage:
     def _get_by_external_id(self, external_id: str) -> dict[str, Any] | None:
         """Find content by external_id (private helper method).
 
-        This is used internally by create_or_update_content() for single
-        item lookup. Returns the full content record if found.
+        Single-item lookup by the UNIQUE external_id column, so it is an
+        index probe. Returns the full content record if found.
 
         Args:
             external_id: The external_id to search for
@@ -530,32 +613,49 @@ class Storage:
             row = cursor.fetchone()
 
             if row:
-                # Convert sqlite3.Row to dict
-                return {
-                    "id": row["id"],
-                    "source_id": row["source_id"],
-                    "external_id": row["external_id"],
-                    "title": row["title"],
-                    "url": row["url"],
-                    "content": row["content"],
-                    "summary": row["summary"],
-                    "analysis": json.loads(row["analysis"])
-                    if row["analysis"]
-                    else None,
-                    "priority": row["priority"],
-                    "published_at": row["published_at"],
-                    "fetched_at": row["fetched_at"],
-                    "read": bool(row["read"]),
-                    "favorited": bool(row["favorited"]),
-                    "notes": row["notes"],
-                    "created_at": row["created_at"],
-                    "updated_at": row["updated_at"],
-                }
+                # Row -> dict in one C-level copy, then decode the columns
+                # SQLite stores as JSON text and 0/1 integers
+                content = dict(row)
+                content["analysis"] = (
+                    json.loads(row["analysis"]) if row["analysis"] else None
+                )
+                content["read"] = bool(row["read"])
+                content["favorited"] = bool(row["favorited"])
+                return content
             return None
 
         except sqlite3.Error as e:
             raise sqlite3.Error(f"Failed to get content by external_id: {e}") from e
 
+    @staticmethod
+    def _priority_row_to_dict(row: sqlite3.Row) -> dict[str, Any]:
+        """Convert a content row joined with its source into a content dict."""
+        # Parse JSON analysis if present
+        analysis = None
+        if row["analysis"]:
+            analysis = json.loads(row["analysis"])
+
+        return {
+            "id": row["id"],
+            "source_id": row["source_id"],
+            "source_name": row["source_name"],
+            "source_type": row["source_type"],
+            "external_id": row["external_id"],
+            "title": row["title"],
+            "url": row["url"],
+            "content": row["content"],
+            "summary": row["summary"],
+            "analysis": analysis,
+            "priority": row["priority"],
+            "published_at": row["published_at"],
+            "fetched_at": row["fetched_at"],
+            "read": bool(row["read"]),
+            "favorited": bool(row["favorited"]),
+            "interesting_override": bool(row["interesting_override"]),
+            "user_feedback": row["user_feedback"],
+            "notes": row["notes"],
+        }
+
     def get_content_by_priority(
         self,
         priority: str,
@@ -598,40 +698,55 @@ class Storage:
 
             cursor = self.conn.execute(query, tuple(params))
 
-            content = []
-            for row in cursor.fetchall():
-                # Parse JSON analysis if present
-                analysis = None
-                if row["analysis"]:
-                    analysis = json.loads(row["analysis"])
+            return [self._priority_row_to_dict(row) for row in cursor.fetchall()]
 
-                content.append(
-                    {
-                        "id": row["id"],
-                        "source_id": row["source_id"],
-                        "source_name": row["source_name"],
-                        "source_type": row["source_type"],
-                        "external_id": row["external_id"],
-                        "title": row["title"],
-                        "url": row["url"],
-                        "content": row["content"],
-                        "summary": row["summary"],
-                        "analysis": analysis,
-                        "priority": row["priority"],
-                        "published_at": row["published_at"],
-                        "fetched_at": row["fetched_at"],
-                        "read": bool(row["read"]),
-                        "favorited": bool(row["favorited"]),
-                        "interesting_override": bool(row["interesting_override"]),
-                        "user_feedback": row["user_feedback"],
-                        "notes": row["notes"],
-                    }
-                )
+        except sqlite3.Error as e:
+            raise sqlite3.Error(f"Failed to get content by priority: {e}") from e
 
-            return content
+    def get_content_by_priorities(
+        self,
+        priorities: list[str],
+        limit: int = 50,
+        include_archived: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Get unread content across several priority levels in one query.
+
+        Args:
+            priorities: Priority levels to include ('high', 'medium', 'low')
+            limit: Maximum number of items to return
+            include_archived: Include archived content if True
+
+        Returns:
+            List of content dictionaries, newest first
+        """
+        if not priorities:
+            return []
+
+        try:
+            placeholders = ",".join(["?"] * len(priorities))
+            query = (
+                """
+                SELECT c.*, s.name as source_name, s.type as source_type
+                FROM content c
+                JOIN sources s ON c.source_id = s.id
+                WHERE c.read = 0 AND c.priority IN ("""
+                + placeholders
+                + ")"
+            )
+            params: list[Any] = list(priorities)
+
+            # Add archived filter unless explicitly including archived
+            if not include_archived:
+                query += " AND c.archived_at IS NULL"
+
+            query += " ORDER BY c.published_at DESC LIMIT ?"
+            params.append(limit)
+
+            cursor = self.conn.execute(query, tuple(params))
+            return [self._priority_row_to_dict(row) for row in cursor.fetchall()]
 
         except sqlite3.Error as e:
-            raise sqlite3.Error(f"Failed to get content by priority: {e}") from e
+            raise sqlite3.Error(f"Failed to get content by priorities: {e}") from e
 
     def get_content_since(
         self,
@@ -731,22 +846,25 @@ class Storage:
                 """,
                 (content_id,),
             )
-            self.conn.commit()
+            self._commit()
             return cursor.rowcount > 0
 
         except sqlite3.Error as e:
-            self.conn.rollback()
+            self._rollback()
             raise sqlite3.Error(f"Failed to mark content as read: {e}") from e
 
     def update_source_fetch_status(
         self, source_id: str, success: bool, error_message: str | None = None
-    ) -> None:
+    ) -> dict[str, Any] | None:
         """Update source after fetch attempt.
 
         Args:
             source_id: UUID of the source
             success: Whether fetch was successful
             error_message: Error message if fetch failed
+
+        Returns:
+            The updated source dictionary, or None if the source doesn't exist
         """
         start_time = time.time()
         try:
@@ -759,44 +877,42 @@ class Storage:
                         last_error = NULL,
                         updated_at = CURRENT_TIMESTAMP
                     WHERE id = ?
+                    RETURNING id, url, type, name, active, error_count,
+                              last_error, last_fetched_at, created_at, updated_at
                     """,
                     (source_id,),
                 )
             else:
+                # Deactivate source after 5 consecutive errors
                 cursor = self.conn.execute(
                     """
                     UPDATE sources
                     SET error_count = error_count + 1,
                         last_error = ?,
+                        active = CASE WHEN error_count + 1 >= 5 THEN 0 ELSE active END,
                         updated_at = CURRENT_TIMESTAMP
                     WHERE id = ?
+                    RETURNING id, url, type, name, active, error_count,
+                              last_error, last_fetched_at, created_at, updated_at
                     """,
                     (error_message, source_id),
                 )
+            rows = cursor.fetchall()
 
-                # Deactivate source after 5 consecutive errors
-                self.conn.execute(
-                    """
-                    UPDATE sources
-                    SET active = 0
-                    WHERE id = ? AND error_count >= 5
-                    """,
-                    (source_id,),
-                )
-
-            self.conn.commit()
+            self._commit()
             duration_ms = int((time.time() - start_time) * 1000)
             obs_log(
                 "db.update",
                 table="sources",
                 operation="update_source_fetch_status",
-                row_count=cursor.rowcount,
+                row_count=len(rows),
                 duration_ms=duration_ms,
                 status="success" if success else "error_tracked",
             )
+            return self._source_row_to_dict(rows[0]) if rows else None
 
         except sqlite3.Error as e:
-            self.conn.rollback()
+            self._rollback()
             duration_ms = int((time.time() - start_time) * 1000)
             obs_log(
                 "db.update",
@@ -854,13 +970,13 @@ class Storage:
                 # No fields to update
                 return False
 
-            self.conn.commit()
+            self._commit()
 
             # Return True if a row was updated
             return cursor.rowcount > 0
 
         except sqlite3.Error:
-            self.conn.rollback()
+            self._rollback()
             # Failed to update source
             return False
 
@@ -880,28 +996,36 @@ class Storage:
                 """
             )
 
-            sources = []
-            for row in cursor.fetchall():
-                sources.append(
-                    {
-                        "id": row["id"],
-                        "url": row["url"],
-                        "type": row["type"],
-                        "name": row["name"],
-                        "active": bool(row["active"]),
-                        "error_count": row["error_count"],
-                        "last_error": row["last_error"],
-                        "last_fetched_at": row["last_fetched_at"],
-                        "created_at": row["created_at"],
-                        "updated_at": row["updated_at"],
-                    }
-                )
-
-            return sources
+            return [self._source_row_to_dict(row) for row in cursor.fetchall()]
 
         except sqlite3.Error as e:
             raise sqlite3.Error(f"Failed to get all sources: {e}") from e
 
+    def get_source(self, source_id: str) -> dict[str, Any] | None:
+        """Get a single source (active or inactive) by ID.
+
+        Args:
+            source_id: UUID of the source
+
+        Returns:
+            Source dictionary with all fields, or None if not found
+        """
+        try:
+            cursor = self.conn.execute(
+                """
+                SELECT id, url, type, name, active, error_count,
+                       last_error, last_fetched_at, created_at, updated_at
+                FROM sources
+                WHERE id = ?
+                """,
+                (source_id,),
+            )
+            row = cursor.fetchone()
+            return self._source_row_to_dict(row) if row else None
+
+        except sqlite3.Error as e:
+            raise sqlite3.Error(f"Failed to get source: {e}") from e
+
     def pause_source(self, source_id: str) -> bool:
         """Pause a content source (set inactive).
 
@@ -921,11 +1045,11 @@ class Storage:
                    WHERE id = ?""",
                 (source_id,),
             )
-            self.conn.commit()
+            self._commit()
             return cursor.rowcount > 0
 
         except sqlite3.Error as e:
-            self.conn.rollback()
+            self._rollback()
             raise sqlite3.Error(f"Failed to pause source: {e}") from e
 
     def resume_source(self, source_id: str) -> bool:
@@ -948,11 +1072,11 @@ class Storage:
                    WHERE id = ?""",
                 (source_id,),
             )
-            self.conn.commit()
+            self._commit()
             return cursor.rowcount > 0
 
         except sqlite3.Error as e:
-            self.conn.rollback()
+            self._rollback()
             raise sqlite3.Error(f"Failed to resume source: {e}") from e
 
     def remove_source(self, source_id: str) -> bool:
@@ -990,11 +1114,11 @@ class Storage:
 
             # Finally, delete the source itself
             cursor = self.conn.execute("DELETE FROM sources WHERE id = ?", (source_id,))
-            self.conn.commit()
+            self._commit()
             return cursor.rowcount > 0
 
         except sqlite3.Error as e:
-            self.conn.rollback()
+            self._rollback()
             raise sqlite3.Error(f"Failed to remove source: {e}") from e
 
     def update_content_status(
@@ -1072,7 +1196,7 @@ class Storage:
             query = "UPDATE content SET " + ", ".join(updates) + " WHERE id = ?"  # noqa: S608
             cursor = self.conn.execute(query, params)
 
-            self.conn.commit()
+            self._commit()
             duration_ms = int((time.time() - start_time) * 1000)
             row_count = cursor.rowcount
             obs_log(
@@ -1086,7 +1210,7 @@ class Storage:
             return cursor.rowcount > 0
 
         except sqlite3.Error as e:
-            self.conn.rollback()
+            self._rollback()
             duration_ms = int((time.time() - start_time) * 1000)
             obs_log(
                 "db.update",
@@ -1116,7 +1240,7 @@ class Storage:
                 "UPDATE content SET interesting_override = 1 WHERE id = ?",
                 (content_id,),
             )
-            self.conn.commit()
+            self._commit()
             duration_ms = int((time.time() - start_time) * 1000)
             row_count = cursor.rowcount
             obs_log(
@@ -1130,7 +1254,7 @@ class Storage:
             return cursor.rowcount > 0
 
         except sqlite3.Error as e:
-            self.conn.rollback()
+            self._rollback()
             duration_ms = int((time.time() - start_time) * 1000)
             obs_log(
                 "db.update",
@@ -1402,14 +1526,14 @@ class Storage:
                 "DELETE FROM vec_content WHERE content_id NOT IN (SELECT id FROM content)"
             )
 
-            self.conn.commit()
+            self._commit()
 
             # Return the actual number of rows deleted
             return cursor.rowcount
 
         except Exception as e:
             # Rollback on error
-            self.conn.rollback()
+            self._rollback()
             raise sqlite3.Error(f"Failed to delete unprioritized items: {e}") from e
 
     def cleanup_orphaned_vectors(self) -> int:
@@ -1442,12 +1566,12 @@ class Storage:
             cursor = self.conn.execute(
                 "DELETE FROM vec_content WHERE content_id NOT IN (SELECT id FROM content)"
             )
-            self.conn.commit()
+            self._commit()
 
             return cursor.rowcount
 
         except Exception as e:
-            self.conn.rollback()
+            self._rollback()
             raise sqlite3.Error(f"Failed to cleanup orphaned vectors: {e}") from e
 
     def add_embedding(
@@ -1489,10 +1613,10 @@ class Storage:
                 (content_id, embedding_json),
             )
 
-            self.conn.commit()
+            self._commit()
 
         except sqlite3.Error as e:
-            self.conn.rollback()
+            self._rollback()
             raise sqlite3.Error(f"Failed to add embedding: {e}") from e
 
     def _calculate_source_authority(
@@ -1923,11 +2047,11 @@ class Storage:
             """
 
             cursor = self.conn.execute(query, params)
-            self.conn.commit()
+            self._commit()
             return cursor.rowcount
 
         except sqlite3.Error as e:
-            self.conn.rollback()
+            self._rollback()
             raise sqlite3.Error(f"Failed to archive content: {e}") from e
 
     def count_archived(self) -> int:
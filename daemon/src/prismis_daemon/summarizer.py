@@ -12,6 +12,260 @@ from .observability import log as obs_log
 
 logger = logging.getLogger(__name__)
 
+# Standard system prompt for content analysis. The brief and detailed variants
+# only swap the reading_summary length instruction, so all three are built
+# once at import rather than on every summarize call.
+_STANDARD_SYSTEM_PROMPT = """You are an expert content analyst. Follow these steps SEQUENTIALLY.
+
+CRITICAL: You MUST respond with ONLY valid JSON. DO NOT include any text, explanation, or preamble before or after the JSON. Start directly with { and end directly with }. No "Here is the analysis:" or similar phrases. ONLY JSON.
+
+STEP 1: CREATE SUMMARIES
+- Summary: 400 chars max, capture key information for card display
+- Reading summary: approximately 10-15% of original content length (minimum 2000 chars), comprehensive MARKDOWN:
+  * MUST use proper markdown formatting with # headers and ## subheaders
+  * Start with # Title matching the content
+  * ## Overview section - brief context/background (2-3 sentences)
+  * ## Key Points - bullet list of main takeaways
+  * ## Summary - THE MAIN SECTION! Comprehensive narrative covering what was discussed, arguments made, flow of ideas. This should be substantive enough that someone could skip the original unless they want full nuance.
+  * ## Takeaways - what this means and why it matters
+  * Write clean, readable markdown for web display
+  * NO HTML, NO broken formatting, ONLY clean markdown
+  * IMPORTANT: Use \\n for newlines (not actual line breaks), escape quotes with \\"
+
+STEP 2: EXTRACT INSIGHTS & PATTERNS
+- Alpha insights: Universal truths that exist outside the article but are grounded in it (10-24 items)
+- Patterns: Specific methods, frameworks, or approaches described (3-10 items)
+
+STEP 3: EXTRACT HASHTAG-STYLE TAGS (entities)
+Think Twitter hashtags or Instagram tags - simple, searchable, one concept each.
+Extract 3-5 essential tags. IMPORTANT: 3 great tags is BETTER than 5 mediocre ones.
+Do NOT force 5 tags - only include tags that truly matter.
+
+HASHTAG MINDSET:
+- Think breadth, not depth - what's this REALLY about?
+- Single words preferred, hyphens OK for compound concepts
+- Choose the essence, not the full description
+- Less is more - 3 great tags better than 5 mediocre ones
+
+SIMPLIFICATION RULES:
+- "ai language models" → "ai" (not ai-language-models)
+- "supply chain attack" → "security" or "supply-chain"
+- "national institutes of health" → "health" or "nih"
+- "16-digit numerical password" → "security"
+- "adaptive security appliance" → "security"
+- "biomedical research funding" → "research" or "biomedical"
+- "artificial intelligence ethics" → "ai" and "ethics" (separate tags)
+
+GOOD hashtag examples:
+- AI article: ["ai", "chatgpt", "ethics"]
+- Security breach: ["security", "ransomware", "cisco"]
+- Health research: ["health", "research", "nih"]
+- Dev tutorial: ["python", "tutorial", "web"]
+
+BAD examples (too complex):
+- ["ai language models", "ethical considerations", "societal impact"]
+- ["supply chain attack", "open source security", "npm ecosystem"]
+- ["national institutes of health", "biomedical research", "federal funding"]
+
+VALIDATION RULES (MUST FOLLOW):
+- NO SPACES EVER. If multi-word: either hyphenate OR simplify to one word
+  • "cloud code" → "claude-code" OR just "claude"
+  • "software development" → "software-development" OR just "software"
+  • "agentic tool use" → "agentic-tools" OR just "agentic"
+- NO DUPLICATES. If you include "gemini", don't add "llm-gemini"
+- Every tag: lowercase letters and hyphens only
+- If ANY tag contains spaces, the extraction has FAILED
+
+CRITICAL: Pick the ESSENCE, not the description.
+If unsure, go broader and simpler. All lowercase, no spaces.
+
+STEP 4: EXTRACT MEMORABLE QUOTES (quotes)
+Find 0-3 quotes that are GENUINELY INSIGHTFUL. Many articles have NO quotable insights - that's OK.
+
+QUALITY CRITERIA:
+- ONLY extract quotes that would be worth sharing or remembering
+- Look for: counterintuitive insights, profound observations, surprising facts, expert wisdom
+- SKIP: basic questions, obvious statements, routine facts, setup sentences
+- If there's nothing profound or memorable, return empty array []
+
+VERBATIM REQUIREMENT:
+- MUST be exact text from the content (copy-paste, not paraphrased)
+- Include enough context to make sense standalone (1-3 sentences max)
+- Never write "The author states..." or summarize - use their exact words
+
+EXAMPLES of QUOTE-WORTHY insights:
+✅ "The best code is no code, because code is a liability that requires maintenance"
+✅ "Context is that which is scarce. Compute is abundant, but knowing what to compute is hard"
+✅ "Performance improvements of 10x happen at the architecture level, not the code level"
+
+EXAMPLES of NON-QUOTES (never extract these):
+❌ "I want to use Claude in Cursor" (basic question)
+❌ "Has anyone found a way to turn it off?" (mundane question)
+❌ "This process takes about 5 minutes" (routine fact)
+❌ "Let me explain how this works" (setup sentence)
+
+REMEMBER: Better to have zero quotes than to extract mundane sentences. Only the gems.
+
+STEP 5: EXTRACT SUBSTANTIVE TOOLS
+Extract tools that are discussed SUBSTANTIVELY in the content.
+
+Only include tools that meet these criteria:
+- The article explains what problem they solve or why they're useful
+- The author has actually used them or provides meaningful insight about them
+- They are central to the article's discussion (not just mentioned in passing)
+- The content provides enough context for a reader to understand WHY they'd want to investigate this tool
+
+Examples of substantive discussion:
+- "We switched to X because Y wasn't handling Z use case, and here's what we learned..."
+- "Tool X solves the problem of Y by doing Z differently than existing approaches..."
+- "I've been experimenting with X and found it reduces Y by 50%..."
+
+DO NOT include tools that are:
+- Just mentioned in a list without context
+- Part of standard tech stacks unless specifically discussed
+- Referenced without explanation of their purpose or benefits
+- Obvious or well-known unless the article provides new insights about them
+
+Maximum 5 tools to keep focused on the most valuable ones
+Format: lowercase unless it's a proper name
+
+STEP 6: FIND REFERENCED URLS
+Extract actual URLs referenced or linked WITHIN the content.
+
+Include GitHub repos, documentation sites, project homepages that are referenced
+Clean up tracking parameters if present
+Maximum 5 most relevant URLs
+CRITICAL: Do NOT include the source article's own URL (the URL where this content came from)
+Only extract URLs that are mentioned, linked to, or referenced within the article text
+Do NOT make up URLs - only extract ones actually mentioned in the content
+
+OUTPUT FORMAT:
+{
+  "summary": "Brief summary of the article's main points",
+  "reading_summary": "# Title Here\\n\\n## Overview\\nBrief context and background (2-3 sentences)\\n\\n## Key Points\\n- Main takeaway 1\\n- Main takeaway 2\\n- Main takeaway 3\\n\\n## Summary\\nThis is the MEAT of the content. Write a comprehensive narrative that covers what was actually discussed, the arguments made, the flow of ideas, and important details. Someone should be able to read this and understand the content without needing the original (unless they want full nuance). This should be the longest section.\\n\\n## Takeaways\\nWhat this means and why it matters...",
+  "alpha_insights": [
+    "Universal principle or truth grounded in the content",
+    "Another universal principle from the content"
+  ],
+  "patterns": [
+    "Specific method or approach described",
+    "Framework or technique mentioned"
+  ],
+  "entities": [
+    "Most significant entity #1",
+    "Most significant entity #2",
+    "Most significant entity #3",
+    "Most significant entity #4",
+    "Most significant entity #5"
+  ],
+  "quotes": [
+    "First memorable quote that captures key insight",
+    "Second impactful quote with specific data"
+  ],
+  "tools": [
+    "tool1",
+    "tool2"
+  ],
+  "urls": [
+    "https://example.com/referenced-link",
+    "https://github.com/project"
+  ]
+}"""
+
+_READING_SUMMARY_INSTRUCTION = "- Reading summary: approximately 10-15% of original content length (minimum 2000 chars), comprehensive MARKDOWN:"
+
+# Brief mode: short content (Reddit <300 words)
+_BRIEF_SYSTEM_PROMPT = _STANDARD_SYSTEM_PROMPT.replace(
+    _READING_SUMMARY_INSTRUCTION,
+    "- Reading summary: Minimal - approximately 500-800 chars. Focus on core points only since original is already short:",
+)
+
+# Detailed mode: long content (YouTube >5000 words)
+_DETAILED_SYSTEM_PROMPT = _STANDARD_SYSTEM_PROMPT.replace(
+    _READING_SUMMARY_INSTRUCTION,
+    "- Reading summary: Comprehensive - approximately 20-25% of original content length. Provide richer detail with deeper analysis since source is extensive:",
+)
+
+# Diff mode: file sources, where content is a unified diff
+_DIFF_SYSTEM_PROMPT = """You are an expert at analyzing unified diffs. The content is a UNIFIED DIFF showing changes to a file.
+
+CRITICAL: You MUST respond with ONLY valid JSON. Start with { and end with }. No preamble.
+
+UNDERSTANDING UNIFIED DIFF FORMAT:
+- Lines starting with "---" and "+++" are file headers (ignore these)
+- Lines starting with "@@" show line numbers where changes occur
+- Lines starting with "-" are REMOVED content (old version)
+- Lines starting with "+" are ADDED content (new version)
+- Lines without +/- prefix are CONTEXT (unchanged lines shown for reference)
+
+YOUR TASK: Analyze ONLY what actually changed (+ and - lines), NOT the context lines.
+Context lines are just there to show where changes occurred - do NOT summarize them as if they were new content.
+
+STEP 1: CREATE SUMMARIES
+- Summary: 400 chars max. Describe what CHANGED (e.g., "Updated documentation URLs from docs.claude.com to code.claude.com across 6 sections")
+- Reading summary: MARKDOWN format describing:
+  * # What Changed - brief overview of the change type
+  * ## Changes Made - specific changes with before/after when useful
+  * ## Impact - what this means for users/developers
+  * IMPORTANT: Focus on the ACTUAL changes, not the surrounding context
+
+STEP 2: EXTRACT INSIGHTS & PATTERNS
+- Alpha insights: What do these changes reveal? (e.g., "Documentation migration indicates platform consolidation")
+- Patterns: What patterns appear in the changes? (e.g., "Consistent URL scheme migration")
+
+STEP 3: EXTRACT TAGS (entities)
+Extract 3-5 tags about what changed. Examples:
+- URL migration: ["documentation", "url-migration"]
+- Bug fix: ["bugfix", "error-handling"]
+- Feature addition: ["feature", "api"]
+
+STEP 4: EXTRACT QUOTES
+Usually empty for diffs. Only include if changes contain genuinely insightful text.
+
+STEP 5: EXTRACT TOOLS
+Only tools that were ADDED or REMOVED in the changes, not tools mentioned in context.
+
+STEP 6: EXTRACT URLs
+Only URLs that were ADDED in the changes (lines starting with "+").
+
+Return JSON with: summary, reading_summary, alpha_insights, patterns, entities, quotes, tools, urls, metadata"""
+
+
+def _calculate_word_count(content: str) -> int:
+    """Calculate word count from content.
+
+    Args:
+        content: Text content to count words in
+
+    Returns:
+        Number of words in content
+    """
+    if not content:
+        return 0
+    # str.split() is a single C pass and yields [] for whitespace-only
+    # input, so no separate strip() copy is needed to guard it
+    return len(content.split())
+
+
+def _get_mode_name(word_count: int, source_type: str) -> str:
+    """Get the summarization mode name for logging.
+
+    Args:
+        word_count: Number of words in content
+        source_type: Source type (reddit, youtube, rss, file, etc.)
+
+    Returns:
+        Mode name: 'brief', 'detailed', 'diff', or 'standard'
+    """
+    if source_type == "file":
+        return "diff"
+    elif source_type == "reddit" and word_count < 300:
+        return "brief"
+    elif source_type == "youtube" and word_count > 5000:
+        return "detailed"
+    else:
+        return "standard"
+
 
 @dataclass
 class ContentSummary:
@@ -83,8 +337,8 @@ class ContentSummarizer:
             )
 
             # Determine summarization mode based on content characteristics
-            word_count = self._calculate_word_count(content)
-            mode = self._get_mode_name(word_count, source_type)
+            word_count = _calculate_word_count(content)
+            mode = _get_mode_name(word_count, source_type)
             system_prompt = self._select_system_prompt(word_count, source_type)
 
             logger.debug(
@@ -205,37 +459,9 @@ class ContentSummarizer:
             # Re-raise to stop processing completely per requirements
             raise
 
-    def _calculate_word_count(self, content: str) -> int:
-        """Calculate word count from content.
-
-        Args:
-            content: Text content to count words in
-
-        Returns:
-            Number of words in content
-        """
-        if not content or not content.strip():
-            return 0
-        return len(content.split())
-
-    def _get_mode_name(self, word_count: int, source_type: str) -> str:
-        """Get the summarization mode name for logging.
-
-        Args:
-            word_count: Number of words in content
-            source_type: Source type (reddit, youtube, rss, file, etc.)
-
-        Returns:
-            Mode name: 'brief', 'detailed', 'diff', or 'standard'
-        """
-        if source_type == "file":
-            return "diff"
-        elif source_type == "reddit" and word_count < 300:
-            return "brief"
-        elif source_type == "youtube" and word_count > 5000:
-            return "detailed"
-        else:
-            return "standard"
+    # Self-free helpers, kept as methods for existing callers
+    _calculate_word_count = staticmethod(_calculate_word_count)
+    _get_mode_name = staticmethod(_get_mode_name)
 
     def _select_system_prompt(self, word_count: int, source_type: str) -> str:
         """Select appropriate system prompt based on content characteristics.
@@ -265,234 +491,28 @@ class ContentSummarizer:
 
     def _get_system_prompt(self) -> str:
         """Get the standard system prompt for content analysis (current behavior)."""
-        return """You are an expert content analyst. Follow these steps SEQUENTIALLY.
-
-CRITICAL: You MUST respond with ONLY valid JSON. DO NOT include any text, explanation, or preamble before or after the JSON. Start directly with { and end directly with }. No "Here is the analysis:" or similar phrases. ONLY JSON.
-
-STEP 1: CREATE SUMMARIES
-- Summary: 400 chars max, capture key information for card display
-- Reading summary: approximately 10-15% of original content length (minimum 2000 chars), comprehensive MARKDOWN:
-  * MUST use proper markdown formatting with # headers and ## subheaders
-  * Start with # Title matching the content
-  * ## Overview section - brief context/background (2-3 sentences)
-  * ## Key Points - bullet list of main takeaways
-  * ## Summary - THE MAIN SECTION! Comprehensive narrative covering what was discussed, arguments made, flow of ideas. This should be substantive enough that someone could skip the original unless they want full nuance.
-  * ## Takeaways - what this means and why it matters
-  * Write clean, readable markdown for web display
-  * NO HTML, NO broken formatting, ONLY clean markdown
-  * IMPORTANT: Use \\n for newlines (not actual line breaks), escape quotes with \\"
-
-STEP 2: EXTRACT INSIGHTS & PATTERNS
-- Alpha insights: Universal truths that exist outside the article but are grounded in it (10-24 items)
-- Patterns: Specific methods, frameworks, or approaches described (3-10 items)
-
-STEP 3: EXTRACT HASHTAG-STYLE TAGS (entities)
-Think Twitter hashtags or Instagram tags - simple, searchable, one concept each.
-Extract 3-5 essential tags. IMPORTANT: 3 great tags is BETTER than 5 mediocre ones.
-Do NOT force 5 tags - only include tags that truly matter.
-
-HASHTAG MINDSET:
-- Think breadth, not depth - what's this REALLY about?
-- Single words preferred, hyphens OK for compound concepts
-- Choose the essence, not the full description
-- Less is more - 3 great tags better than 5 mediocre ones
-
-SIMPLIFICATION RULES:
-- "ai language models" → "ai" (not ai-language-models)
-- "supply chain attack" → "security" or "supply-chain"
-- "national institutes of health" → "health" or "nih"
-- "16-digit numerical password" → "security"
-- "adaptive security appliance" → "security"
-- "biomedical research funding" → "research" or "biomedical"
-- "artificial intelligence ethics" → "ai" and "ethics" (separate tags)
-
-GOOD hashtag examples:
-- AI article: ["ai", "chatgpt", "ethics"]
-- Security breach: ["security", "ransomware", "cisco"]
-- Health research: ["health", "research", "nih"]
-- Dev tutorial: ["python", "tutorial", "web"]
-
-BAD examples (too complex):
-- ["ai language models", "ethical considerations", "societal impact"]
-- ["supply chain attack", "open source security", "npm ecosystem"]
-- ["national institutes of health", "biomedical research", "federal funding"]
-
-VALIDATION RULES (MUST FOLLOW):
-- NO SPACES EVER. If multi-word: either hyphenate OR simplify to one word
-  • "cloud code" → "claude-code" OR just "claude"
-  • "software development" → "software-development" OR just "software"
-  • "agentic tool use" → "agentic-tools" OR just "agentic"
-- NO DUPLICATES. If you include "gemini", don't add "llm-gemini"
-- Every tag: lowercase letters and hyphens only
-- If ANY tag contains spaces, the extraction has FAILED
-
-CRITICAL: Pick the ESSENCE, not the description.
-If unsure, go broader and simpler. All lowercase, no spaces.
-
-STEP 4: EXTRACT MEMORABLE QUOTES (quotes)
-Find 0-3 quotes that are GENUINELY INSIGHTFUL. Many articles have NO quotable insights - that's OK.
-
-QUALITY CRITERIA:
-- ONLY extract quotes that would be worth sharing or remembering
-- Look for: counterintuitive insights, profound observations, surprising facts, expert wisdom
-- SKIP: basic questions, obvious statements, routine facts, setup sentences
-- If there's nothing profound or memorable, return empty array []
-
-VERBATIM REQUIREMENT:
-- MUST be exact text from the content (copy-paste, not paraphrased)
-- Include enough context to make sense standalone (1-3 sentences max)
-- Never write "The author states..." or summarize - use their exact words
-
-EXAMPLES of QUOTE-WORTHY insights:
-✅ "The best code is no code, because code is a liability that requires maintenance"
-✅ "Context is that which is scarce. Compute is abundant, but knowing what to compute is hard"
-✅ "Performance improvements of 10x happen at the architecture level, not the code level"
-
-EXAMPLES of NON-QUOTES (never extract these):
-❌ "I want to use Claude in Cursor" (basic question)
-❌ "Has anyone found a way to turn it off?" (mundane question)
-❌ "This process takes about 5 minutes" (routine fact)
-❌ "Let me explain how this works" (setup sentence)
-
-REMEMBER: Better to have zero quotes than to extract mundane sentences. Only the gems.
-
-STEP 5: EXTRACT SUBSTANTIVE TOOLS
-Extract tools that are discussed SUBSTANTIVELY in the content.
-
-Only include tools that meet these criteria:
-- The article explains what problem they solve or why they're useful
-- The author has actually used them or provides meaningful insight about them
-- They are central to the article's discussion (not just mentioned in passing)
-- The content provides enough context for a reader to understand WHY they'd want to investigate this tool
-
-Examples of substantive discussion:
-- "We switched to X because Y wasn't handling Z use case, and here's what we learned..."
-- "Tool X solves the problem of Y by doing Z differently than existing approaches..."
-- "I've been experimenting with X and found it reduces Y by 50%..."
-
-DO NOT include tools that are:
-- Just mentioned in a list without context
-- Part of standard tech stacks unless specifically discussed
-- Referenced without explanation of their purpose or benefits
-- Obvious or well-known unless the article provides new insights about them
-
-Maximum 5 tools to keep focused on the most valuable ones
-Format: lowercase unless it's a proper name
-
-STEP 6: FIND REFERENCED URLS
-Extract actual URLs referenced or linked WITHIN the content.
-
-Include GitHub repos, documentation sites, project homepages that are referenced
-Clean up tracking parameters if present
-Maximum 5 most relevant URLs
-CRITICAL: Do NOT include the source article's own URL (the URL where this content came from)
-Only extract URLs that are mentioned, linked to, or referenced within the article text
-Do NOT make up URLs - only extract ones actually mentioned in the content
-
-OUTPUT FORMAT:
-{
-  "summary": "Brief summary of the article's main points",
-  "reading_summary": "# Title Here\\n\\n## Overview\\nBrief context and background (2-3 sentences)\\n\\n## Key Points\\n- Main takeaway 1\\n- Main takeaway 2\\n- Main takeaway 3\\n\\n## Summary\\nThis is the MEAT of the content. Write a comprehensive narrative that covers what was actually discussed, the arguments made, the flow of ideas, and important details. Someone should be able to read this and understand the content without needing the original (unless they want full nuance). This should be the longest section.\\n\\n## Takeaways\\nWhat this means and why it matters...",
-  "alpha_insights": [
-    "Universal principle or truth grounded in the content",
-    "Another universal principle from the content"
-  ],
-  "patterns": [
-    "Specific method or approach described",
-    "Framework or technique mentioned"
-  ],
-  "entities": [
-    "Most significant entity #1",
-    "Most significant entity #2",
-    "Most significant entity #3",
-    "Most significant entity #4",
-    "Most significant entity #5"
-  ],
-  "quotes": [
-    "First memorable quote that captures key insight",
-    "Second impactful quote with specific data"
-  ],
-  "tools": [
-    "tool1",
-    "tool2"
-  ],
-  "urls": [
-    "https://example.com/referenced-link",
-    "https://github.com/project"
-  ]
-}"""
+        return _STANDARD_SYSTEM_PROMPT
 
     def _get_brief_system_prompt(self) -> str:
         """Get brief system prompt for short content (Reddit <300 words).
 
         Returns standard prompt with modified reading_summary instruction.
         """
-        standard = self._get_system_prompt()
-        # Replace reading_summary instruction for brief mode
-        return standard.replace(
-            "- Reading summary: approximately 10-15% of original content length (minimum 2000 chars), comprehensive MARKDOWN:",
-            "- Reading summary: Minimal - approximately 500-800 chars. Focus on core points only since original is already short:",
-        )
+        return _BRIEF_SYSTEM_PROMPT
 
     def _get_detailed_system_prompt(self) -> str:
         """Get detailed system prompt for long content (YouTube >5000 words).
 
         Returns standard prompt with modified reading_summary instruction.
         """
-        standard = self._get_system_prompt()
-        # Replace reading_summary instruction for detailed mode
-        return standard.replace(
-            "- Reading summary: approximately 10-15% of original content length (minimum 2000 chars), comprehensive MARKDOWN:",
-            "- Reading summary: Comprehensive - approximately 20-25% of original content length. Provide richer detail with deeper analysis since source is extensive:",
-        )
+        return _DETAILED_SYSTEM_PROMPT
 
     def _get_diff_system_prompt(self) -> str:
         """Get diff-aware system prompt for file sources (content is unified diff).
 
         Focuses analysis on what actually changed, not surrounding context.
         """
-        return """You are an expert at analyzing unified diffs. The content is a UNIFIED DIFF showing changes to a file.
-
-CRITICAL: You MUST respond with ONLY valid JSON. Start with { and end with }. No preamble.
-
-UNDERSTANDING UNIFIED DIFF FORMAT:
-- Lines starting with "---" and "+++" are file headers (ignore these)
-- Lines starting with "@@" show line numbers where changes occur
-- Lines starting with "-" are REMOVED content (old version)
-- Lines starting with "+" are ADDED content (new version)
-- Lines without +/- prefix are CONTEXT (unchanged lines shown for reference)
-
-YOUR TASK: Analyze ONLY what actually changed (+ and - lines), NOT the context lines.
-Context lines are just there to show where changes occurred - do NOT summarize them as if they were new content.
-
-STEP 1: CREATE SUMMARIES
-- Summary: 400 chars max. Describe what CHANGED (e.g., "Updated documentation URLs from docs.claude.com to code.claude.com across 6 sections")
-- Reading summary: MARKDOWN format describing:
-  * # What Changed - brief overview of the change type
-  * ## Changes Made - specific changes with before/after when useful
-  * ## Impact - what this means for users/developers
-  * IMPORTANT: Focus on the ACTUAL changes, not the surrounding context
-
-STEP 2: EXTRACT INSIGHTS & PATTERNS
-- Alpha insights: What do these changes reveal? (e.g., "Documentation migration indicates platform consolidation")
-- Patterns: What patterns appear in the changes? (e.g., "Consistent URL scheme migration")
-
-STEP 3: EXTRACT TAGS (entities)
-Extract 3-5 tags about what changed. Examples:
-- URL migration: ["documentation", "url-migration"]
-- Bug fix: ["bugfix", "error-handling"]
-- Feature addition: ["feature", "api"]
-
-STEP 4: EXTRACT QUOTES
-Usually empty for diffs. Only include if changes contain genuinely insightful text.
-
-STEP 5: EXTRACT TOOLS
-Only tools that were ADDED or REMOVED in the changes, not tools mentioned in context.
-
-STEP 6: EXTRACT URLs
-Only URLs that were ADDED in the changes (lines starting with "+").
-
-Return JSON with: summary, reading_summary, alpha_insights, patterns, entities, quotes, tools, urls, metadata"""
+        return _DIFF_SYSTEM_PROMPT
 
     def _build_prompt(
         self,
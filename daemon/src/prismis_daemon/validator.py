@@ -1,5 +1,6 @@
 """Source validation module for verifying sources before adding to database."""
 
+import asyncio
 import re
 from urllib.parse import urlparse
 
@@ -12,12 +13,39 @@ class SourceValidator:
 
     All validation methods return (is_valid, error_message) tuples.
     Network requests have a 5-second timeout to prevent hanging.
+
+    Requests share one pooled HTTP client, so validating several sources
+    on the same host reuses the connection. Use as a context manager, or
+    call close(), to release it.
     """
 
-    def __init__(self) -> None:
-        """Initialize the validator with default timeout settings."""
+    def __init__(self, transport: httpx.BaseTransport | None = None) -> None:
+        """Initialize the validator with default timeout settings.
+
+        Args:
+            transport: Optional httpx transport for the shared client
+                (tests pass an httpx.MockTransport)
+        """
         self.timeout = 5.0  # 5 second timeout for all network requests
         self.user_agent = "Prismis/1.0 (Content Aggregator)"
+        self.client = httpx.Client(
+            timeout=self.timeout,
+            follow_redirects=True,
+            headers={"User-Agent": self.user_agent},
+            transport=transport,
+        )
+
+    def close(self) -> None:
+        """Close the shared HTTP client and its pooled connections."""
+        self.client.close()
+
+    def __enter__(self) -> "SourceValidator":
+        """Context manager entry - returns self for use in with statements."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit - ensures the HTTP client is closed."""
+        self.close()
 
     def validate_source(
         self, url: str, source_type: str
@@ -48,6 +76,23 @@ class SourceValidator:
         except Exception as e:
             return False, f"Validation failed: {str(e)}", None
 
+    async def avalidate_source(
+        self, url: str, source_type: str
+    ) -> tuple[bool, str | None, dict | None]:
+        """Validate a source URL without blocking the event loop.
+
+        Runs validate_source in a worker thread, so several sources can be
+        checked concurrently with asyncio.gather.
+
+        Args:
+            url: The source URL to validate
+            source_type: Type of source ('rss', 'reddit', 'youtube')
+
+        Returns:
+            Tuple of (is_valid, error_message, metadata), as validate_source
+        """
+        return await asyncio.to_thread(self.validate_source, url, source_type)
+
     def _validate_rss(self, url: str) -> tuple[bool, str | None, dict | None]:
         """Validate an RSS/Atom feed URL.
 
@@ -61,12 +106,7 @@ class SourceValidator:
         """
         try:
             # Fetch the feed with timeout
-            response = httpx.get(
-                url,
-                timeout=self.timeout,
-                follow_redirects=True,
-                headers={"User-Agent": self.user_agent},
-            )
+            response = self.client.get(url)
 
             # Check HTTP status
             if response.status_code != 200:
@@ -144,12 +184,7 @@ class SourceValidator:
             # Check if subreddit exists via about.json endpoint
             check_url = f"https://www.reddit.com/r/{subreddit}/about.json"
 
-            response = httpx.get(
-                check_url,
-                timeout=self.timeout,
-                headers={"User-Agent": self.user_agent},
-                follow_redirects=True,
-            )
+            response = self.client.get(check_url)
 
             # Check response status
             if response.status_code == 404:
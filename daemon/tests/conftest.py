@@ -1,9 +1,17 @@
 """Shared test fixtures for all tests."""
 
+import hashlib
+import json
 import os
+import shutil
+import socket
 import sys
-import tempfile
+from collections.abc import Callable, Iterator
+from datetime import datetime
 from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import Mock
 
 import pytest
 from dotenv import load_dotenv
@@ -14,12 +22,88 @@ dotenv_path = Path(config_home) / "prismis" / ".env"
 if dotenv_path.exists():
     load_dotenv(dotenv_path)
 
-# Add src to path for absolute imports
-src_path = str(Path(__file__).parent.parent / "src")
-sys.path.insert(0, src_path)
+# Add src to path for absolute imports - once, for every test module
+src_path = str((Path(__file__).parent.parent / "src").resolve())
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
 
 # Import from the package properly
 from prismis_daemon import config, database
+from prismis_daemon.models import ContentItem
+from prismis_daemon.storage import Storage
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--run-live",
+        action="store_true",
+        default=False,
+        help="Run tests marked 'live' that call real external APIs",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers", "live: calls a real external API (opt in with --run-live)"
+    )
+    config.addinivalue_line(
+        "markers",
+        "serial: shares an external resource - keep on one xdist worker "
+        "(run with -n auto --dist=loadgroup)",
+    )
+    config.addinivalue_line(
+        "markers",
+        "llm: calls an LLM provider - independent, safe to spread across "
+        "xdist workers (select with -m llm -n auto)",
+    )
+    config.addinivalue_line(
+        "markers",
+        "network: needs internet access - skipped when offline unless a VCR "
+        "cassette can replay it",
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    if config.getoption("--run-live"):
+        return
+    skip_live = pytest.mark.skip(reason="live API test - pass --run-live to run")
+    for item in items:
+        if "live" in item.keywords:
+            item.add_marker(skip_live)
+
+
+@pytest.fixture(scope="session")
+def online() -> bool:
+    """Probe internet reachability once per session."""
+    try:
+        # By name, so a runner with TCP but no DNS counts as offline too
+        socket.create_connection(("one.one.one.one", 443), timeout=1).close()
+    except OSError:
+        return False
+    return True
+
+
+@pytest.fixture(autouse=True)
+def _require_online(request: pytest.FixtureRequest) -> None:
+    """Skip network-marked tests offline instead of waiting on DNS and TLS.
+
+    A VCR test with a recorded cassette always runs - it replays without
+    touching the network. Without one it would have to record, which CI
+    never does, so there it is skipped even when online.
+    """
+    if "network" not in request.keywords:
+        return
+    if "vcr" in request.keywords:
+        cassette_dir = Path(request.getfixturevalue("vcr_cassette_dir"))
+        name = request.getfixturevalue("default_cassette_name")
+        if (cassette_dir / f"{name}.yaml").exists():
+            return
+        if os.environ.get("CI"):
+            pytest.skip("no recorded cassette - CI only replays")
+    if not request.getfixturevalue("online"):
+        pytest.skip("network unavailable")
 
 
 def init_db(path: Path) -> None:
@@ -30,30 +114,54 @@ def load_config() -> config.Config:
     return config.Config.from_file()
 
 
+@pytest.fixture(scope="session")
+def schema_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Initialize the schema once per session; test_db copies the file."""
+    template_path = tmp_path_factory.mktemp("schema") / "prismis.db"
+    init_db(template_path)
+    return template_path
+
+
 @pytest.fixture
-def test_db(monkeypatch) -> Path:
-    """Create a temporary test database for each test."""
-    # Create temp directory
-    temp_dir = tempfile.mkdtemp()
+def test_db(tmp_path: Path, monkeypatch, schema_template: Path) -> Path:
+    """Create a temporary test database for each test.
 
+    Lives under tmp_path, which pytest-xdist gives each worker its own
+    base directory for, so parallel runs never share a database file.
+    """
     # Set XDG_DATA_HOME so Storage() uses our test directory
-    data_dir = Path(temp_dir) / "data"
+    data_dir = tmp_path / "data"
     data_dir.mkdir(parents=True, exist_ok=True)
     monkeypatch.setenv("XDG_DATA_HOME", str(data_dir))
+    # Scratch database - relax durability pragmas in get_db_connection()
+    monkeypatch.setenv("PRISMIS_TEST_FAST", "1")
 
     # Now Storage() will use data_dir/prismis/prismis.db
     db_path = data_dir / "prismis" / "prismis.db"
     db_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Initialize database with schema
-    init_db(db_path)
+    # Start from the session's freshly initialized schema
+    shutil.copyfile(schema_template, db_path)
+
+    return db_path
 
-    yield db_path
 
-    # Cleanup after test
-    import shutil
+@pytest.fixture
+def storage(test_db: Path) -> Storage:
+    """Storage bound to the per-test database, closed after the test."""
+    with Storage(test_db) as storage:
+        yield storage
+
+
+@pytest.fixture
+def offline_storage() -> Storage:
+    """Storage whose connections are all one shared Mock - no database file.
 
-    shutil.rmtree(temp_dir, ignore_errors=True)
+    For tests that fail before any query or only inspect the statements
+    issued, via offline_storage.conn.execute.call_args_list.
+    """
+    conn = Mock()
+    return Storage(connection_factory=lambda db_path: conn)
 
 
 @pytest.fixture
@@ -76,3 +184,106 @@ def full_config() -> config.Config:
     except Exception:
         # If config doesn't exist, skip tests that need it
         pytest.skip("Config file not found at ~/.config/prismis/config.toml")
+
+
+@pytest.fixture(scope="session")
+def content_base_time() -> datetime:
+    """Single published_at timestamp shared by factory-built content."""
+    return datetime.now()
+
+
+@pytest.fixture(scope="session")
+def content_factory(content_base_time: datetime) -> Callable[..., ContentItem]:
+    """Build ContentItem instances with sensible defaults.
+
+    Call as content_factory(source_id, **overrides) - any ContentItem field
+    can be overridden, e.g. external_id or favorited.
+    """
+
+    def make(source_id: str, **overrides) -> ContentItem:
+        fields = {
+            "external_id": "test-item",
+            "title": "Test Article",
+            "url": "https://example.com/1",
+            "content": "Content",
+            "summary": "Summary",
+            "priority": "high",
+            "published_at": content_base_time,
+        }
+        fields.update(overrides)
+        return ContentItem(source_id=source_id, **fields)
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def make_item() -> Callable[..., dict[str, Any]]:
+    """Build content dicts for the Storage dict interface.
+
+    Call as make_item(source_id, external_id, title=..., priority=..., **fields);
+    url defaults to https://example.com/<external_id>.
+    """
+
+    def make(
+        source_id: str,
+        external_id: str,
+        title: str = "Test Article",
+        priority: str = "medium",
+        **fields: Any,
+    ) -> dict[str, Any]:
+        return {
+            "source_id": source_id,
+            "external_id": external_id,
+            "title": title,
+            "url": f"https://example.com/{external_id}",
+            "priority": priority,
+            **fields,
+        }
+
+    return make
+
+
+@pytest.fixture
+def cached_llm(
+    pytestconfig: pytest.Config, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[Path]:
+    """Replay llm_core completions from .pytest_cache/d/llm_cache across runs.
+
+    Wraps the complete() used by the summarizer and evaluator. Calls are
+    keyed by sha256 of their arguments - prompts and temperature are fixed
+    in the tests, so identical calls get identical answers. A miss calls
+    through and stores the result, or skips the test when OPENAI_API_KEY is
+    unset - a warm cache replays without a key. PRISMIS_REFRESH_LLM_CACHE=1
+    ignores stored entries and re-records them.
+    """
+    from prismis_daemon import evaluator, summarizer
+
+    refresh = os.environ.get("PRISMIS_REFRESH_LLM_CACHE") == "1"
+    real_complete = summarizer.complete
+    cache_dir = pytestconfig.cache.mkdir("llm_cache")
+
+    def complete(**kwargs: Any) -> SimpleNamespace:
+        key = hashlib.sha256(json.dumps(kwargs, sort_keys=True).encode()).hexdigest()
+        path = cache_dir / f"{key}.json"
+        if path.exists() and not refresh:
+            data = json.loads(path.read_text())
+        else:
+            if not os.environ.get("OPENAI_API_KEY"):
+                pytest.skip("No cached LLM response and OPENAI_API_KEY is not set")
+            result = real_complete(**kwargs)
+            data = {
+                "text": result.text,
+                "model": result.model,
+                "cost": result.cost,
+                "duration_ms": result.duration_ms,
+                "tokens": {
+                    "input": result.tokens.input,
+                    "output": result.tokens.output,
+                },
+            }
+            path.write_text(json.dumps(data, indent=2))
+        return SimpleNamespace(**{**data, "tokens": SimpleNamespace(**data["tokens"])})
+
+    monkeypatch.setattr(summarizer, "complete", complete)
+    monkeypatch.setattr(evaluator, "complete", complete)
+    yield cache_dir
@@ -0,0 +1,83 @@
+"""Shared article and context prompts for LLM integration tests.
+
+Kept as short as each test's assertions allow - every token is sent to the
+provider on a live run.
+"""
+
+# Summarizer input - full length, the summarizer test checks extraction depth
+GPT5_ARTICLE = """
+    OpenAI has announced GPT-5, their most advanced language model yet. 
+    The new model demonstrates remarkable improvements in reasoning, particularly 
+    in mathematical problem-solving and logical deduction. Early benchmarks show 
+    a 10x improvement in complex reasoning tasks compared to GPT-4.
+    
+    The model uses a new architecture called "Hierarchical Reasoning Networks" 
+    that allows it to break down complex problems into smaller sub-problems, 
+    solve them independently, and then synthesize the results. This approach 
+    mirrors how human experts tackle difficult challenges.
+    
+    Additionally, GPT-5 features significantly reduced hallucination rates, 
+    achieved through a novel training technique called "Verified Chain-of-Thought" 
+    where the model learns to validate its own reasoning steps against a knowledge base.
+    
+    The implications for scientific research, software development, and education 
+    are profound. Researchers are already using early access versions to accelerate 
+    drug discovery and climate modeling efforts.
+    """
+
+LOCAL_LLM_ARTICLE = """
+    Major breakthrough in local LLM technology: Researchers have developed 
+    a new quantization technique that allows GPT-4 level models to run on 
+    consumer hardware with just 8GB of RAM, while maintaining 95% of the 
+    original model's performance.
+    """
+
+# Context with AI/LLM as high priority
+LOCAL_LLM_CONTEXT = """
+    ## High Priority Topics
+    - AI/LLM breakthroughs, especially local models
+    - Quantization and model optimization
+    - Making AI accessible on consumer hardware
+    
+    ## Medium Priority Topics
+    - Web development frameworks
+    - Database optimization
+    
+    ## Low Priority Topics
+    - Gaming news
+    - Social media updates
+    
+    ## Not Interested
+    - Cryptocurrency
+    - Celebrity news
+    """
+
+BITCOIN_ARTICLE = """
+    Bitcoin reaches new all-time high as institutional investors continue 
+    to pour money into cryptocurrency markets. The latest DeFi protocol 
+    promises 1000% APY returns through yield farming strategies.
+    """
+
+# Context with crypto under Not Interested
+INTERESTS_CONTEXT = """
+    ## High Priority Topics
+    - AI/LLM breakthroughs
+    - Systems programming
+    
+    ## Medium Priority Topics
+    - Web development
+    
+    ## Low Priority Topics
+    - Gaming news
+    
+    ## Not Interested
+    - Cryptocurrency, blockchain, DeFi
+    - Celebrity news
+    """
+
+# First paragraph only - the pipeline test checks result shape, not depth
+RUST_ARTICLE = """
+    Rust 2.0 has been released with groundbreaking memory management improvements.
+    The new version introduces "Phantom Ownership", a compile-time mechanism that
+    eliminates even more classes of memory bugs while improving performance by 40%.
+    """
@@ -1,18 +1,24 @@
-"""Mock factory functions for PRAW submission objects in tests."""
+"""Fake PRAW submission objects for tests.
 
-from unittest.mock import Mock  # claudex-guard: allow-mock
+Plain SimpleNamespace stubs rather than Mock: the fetcher only reads
+attributes, and str() on a plain string is what PRAW's Subreddit/Redditor
+objects render as.
+"""
 
+from types import SimpleNamespace
 
-def create_base_submission_mock(**overrides) -> Mock:
-    """Create base submission mock with common attributes.
+
+def create_base_submission_mock(**overrides) -> SimpleNamespace:
+    """Create base submission stub with common attributes.
 
     Args:
         **overrides: Override default values with custom ones
 
     Returns:
-        Mock submission object with PRAW-like attributes
+        Submission stub with PRAW-like attributes
     """
     defaults = {
+        "id": "123",
         "permalink": "/r/python/comments/123/test_title/",
         "title": "Test Post Title",
         "is_self": True,
@@ -22,33 +28,15 @@ def create_base_submission_mock(**overrides) -> Mock:
         "score": 10,
         "upvote_ratio": 0.8,
         "num_comments": 5,
+        "subreddit": "python",
+        "author": "test_user",
     }
 
-    # Apply overrides
-    config = {**defaults, **overrides}
-
-    # Create mock with attributes
-    submission = Mock()  # claudex-guard: allow-mock
-    for key, value in config.items():
-        setattr(submission, key, value)
-
-    # Create mock subreddit object
-    if "subreddit" not in overrides:
-        subreddit_mock = Mock()  # claudex-guard: allow-mock
-        subreddit_mock.__str__ = lambda self: "python"
-        submission.subreddit = subreddit_mock
-
-    # Create mock author object
-    if "author" not in overrides:
-        author_mock = Mock()  # claudex-guard: allow-mock
-        author_mock.__str__ = lambda self: "test_user"
-        submission.author = author_mock
-
-    return submission
+    return SimpleNamespace(**{**defaults, **overrides})
 
 
-def create_self_post_mock(**overrides) -> Mock:
-    """Create text post mock with selftext content."""
+def create_self_post_mock(**overrides) -> SimpleNamespace:
+    """Create text post stub with selftext content."""
     defaults = {
         "is_self": True,
         "selftext": "This is the post body content.",
@@ -57,8 +45,8 @@ def create_self_post_mock(**overrides) -> Mock:
     return create_base_submission_mock(**{**defaults, **overrides})
 
 
-def create_link_post_mock(**overrides) -> Mock:
-    """Create link post mock to external URL."""
+def create_link_post_mock(**overrides) -> SimpleNamespace:
+    """Create link post stub to external URL."""
     defaults = {
         "is_self": False,
         "selftext": "",  # Link posts usually have empty selftext
@@ -67,8 +55,8 @@ def create_link_post_mock(**overrides) -> Mock:
     return create_base_submission_mock(**{**defaults, **overrides})
 
 
-def create_deleted_post_mock(**overrides) -> Mock:
-    """Create deleted/removed post mock."""
+def create_deleted_post_mock(**overrides) -> SimpleNamespace:
+    """Create deleted/removed post stub."""
     defaults = {
         "is_self": True,
         "selftext": "[deleted]",
@@ -80,8 +68,8 @@ def create_deleted_post_mock(**overrides) -> Mock:
     return create_base_submission_mock(**{**defaults, **overrides})
 
 
-def create_image_post_mock(domain: str = "i.redd.it", **overrides) -> Mock:
-    """Create image/video post mock."""
+def create_image_post_mock(domain: str = "i.redd.it", **overrides) -> SimpleNamespace:
+    """Create image/video post stub."""
     image_urls = {
         "i.redd.it": "https://i.redd.it/abc123.jpg",
         "i.imgur.com": "https://i.imgur.com/def456.png",
@@ -98,18 +86,18 @@ def create_image_post_mock(domain: str = "i.redd.it", **overrides) -> Mock:
     return create_base_submission_mock(**{**defaults, **overrides})
 
 
-def create_submission_with_missing_fields(**overrides) -> Mock:
-    """Create submission mock with missing fields to test getattr defaults."""
-    submission = Mock()  # claudex-guard: allow-mock
-
-    # Only set basic required fields
-    submission.permalink = "/r/test/comments/999/minimal/"
-    submission.title = "Minimal Post"
-    submission.is_self = True
-    submission.url = "https://reddit.com/r/test/comments/999/minimal/"
-    submission.created_utc = 1640995200.0
-
-    # Explicitly remove other attributes to simulate missing fields
-    # This tests the getattr() fallbacks in _extract_metrics()
+def create_submission_with_missing_fields(**overrides) -> SimpleNamespace:
+    """Create submission stub with missing fields to test getattr defaults."""
+    # Only set basic required fields - no score/upvote_ratio/num_comments/
+    # subreddit, which exercises the getattr() fallbacks in _extract_metrics()
+    defaults = {
+        "id": "999",
+        "permalink": "/r/test/comments/999/minimal/",
+        "title": "Minimal Post",
+        "is_self": True,
+        "url": "https://reddit.com/r/test/comments/999/minimal/",
+        "created_utc": 1640995200.0,
+        "author": None,
+    }
 
-    return submission
+    return SimpleNamespace(**{**defaults, **overrides})
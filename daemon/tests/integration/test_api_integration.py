@@ -1,6 +1,7 @@
 """Integration tests for REST API - protecting invariants and handling failures."""
 
 import time
+from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
@@ -12,9 +13,10 @@ from prismis_daemon.storage import Storage
 
 
 @pytest.fixture
-def api_client() -> TestClient:
-    """Create test client for API."""
-    return TestClient(app)
+def api_client() -> Iterator[TestClient]:
+    """Create test client for API, running the app lifespan around it."""
+    with TestClient(app) as client:
+        yield client
 
 
 def test_api_auth_required(api_client: TestClient) -> None:
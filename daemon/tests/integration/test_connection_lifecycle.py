@@ -1,14 +1,11 @@
 """Integration tests for database connection lifecycle and resource management."""
 
-from pathlib import Path
 import sqlite3
-import pytest
 import threading
 import time
+from pathlib import Path
 
-import sys
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+import pytest
 
 from prismis_daemon.storage import Storage
 
@@ -70,6 +67,28 @@ def test_wal_pragma_persistence(test_db: Path) -> None:
     storage.close()
 
 
+def test_test_fast_pragmas_scoped_to_flag(
+    test_db: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    INVARIANT: Relaxed durability only applies to PRISMIS_TEST_FAST databases
+    BREAKS: Production data loss on power failure if synchronous=OFF leaks
+    """
+    # test_db sets PRISMIS_TEST_FAST=1 - scratch pragmas apply, WAL is kept
+    with Storage(test_db) as storage:
+        conn = storage.conn
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 0  # OFF
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -64000
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    monkeypatch.delenv("PRISMIS_TEST_FAST")
+    with Storage(test_db) as storage:
+        conn = storage.conn
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 0  # DEFAULT
+
+
 def test_connection_leak_on_exception(test_db: Path) -> None:
     """
     INVARIANT: Exceptions must not prevent connection cleanup
@@ -246,61 +246,64 @@ def test_api_respects_favorites_preservation(test_db: Path) -> None:
     GRACEFUL: API and storage layer have consistent behavior
     """
     storage = Storage(test_db)
-    api_client = TestClient(app)
-
-    # Add source via API
-    response = api_client.post(
-        "/api/sources",
-        json={
-            "url": "https://simonwillison.net/atom/everything/",
-            "type": "rss",
-            "name": "Test Feed",
-        },
-        headers={"X-API-Key": "prismis-api-4d5e"},
-    )
-    assert response.status_code == 200
-    source_id = response.json()["data"]["id"]
-
-    # Add content directly (simulating daemon fetching)
-    items = []
-    for i in range(3):
-        item = ContentItem(
-            source_id=source_id,
-            external_id=f"api-test-{i}",
-            title=f"Article {i}",
-            url=f"https://example.com/{i}",
-            content=f"Content {i}",
-            priority="high",
-            published_at=datetime.now(),
+    with TestClient(app) as api_client:
+        # Add source via API
+        response = api_client.post(
+            "/api/sources",
+            json={
+                "url": "https://simonwillison.net/atom/everything/",
+                "type": "rss",
+                "name": "Test Feed",
+            },
+            headers={"X-API-Key": "prismis-api-4d5e"},
         )
-        content_id = storage.add_content(item)
-        items.append(content_id)
+        assert response.status_code == 200
+        source_id = response.json()["data"]["id"]
+
+        # Add content directly (simulating daemon fetching)
+        items = []
+        for i in range(3):
+            item = ContentItem(
+                source_id=source_id,
+                external_id=f"api-test-{i}",
+                title=f"Article {i}",
+                url=f"https://example.com/{i}",
+                content=f"Content {i}",
+                priority="high",
+                published_at=datetime.now(),
+            )
+            content_id = storage.add_content(item)
+            items.append(content_id)
 
-    # Mark one as favorite
-    storage.update_content_status(items[0], favorited=True)
-    storage.update_content_status(items[1], read=True)  # Read but not favorited
+        # Mark one as favorite
+        storage.update_content_status(items[0], favorited=True)
+        storage.update_content_status(items[1], read=True)  # Read but not favorited
 
-    # Delete source via API
-    response = api_client.delete(
-        f"/api/sources/{source_id}", headers={"X-API-Key": "prismis-api-4d5e"}
-    )
-    assert response.status_code == 200
+        # Delete source via API
+        response = api_client.delete(
+            f"/api/sources/{source_id}", headers={"X-API-Key": "prismis-api-4d5e"}
+        )
+        assert response.status_code == 200
 
-    # INVARIANT: API deletion must preserve favorites just like direct storage
-    fav_content = storage.get_content_by_id(items[0])
-    assert fav_content is not None, "API delete should preserve favorites"
-    assert fav_content["favorited"] is True
-    assert fav_content["source_id"] is None, "API delete should orphan favorites"
+        # INVARIANT: API deletion must preserve favorites just like direct storage
+        fav_content = storage.get_content_by_id(items[0])
+        assert fav_content is not None, "API delete should preserve favorites"
+        assert fav_content["favorited"] is True
+        assert fav_content["source_id"] is None, "API delete should orphan favorites"
 
-    # Non-favorited should be gone
-    assert storage.get_content_by_id(items[1]) is None, (
-        "API should delete non-favorites"
-    )
-    assert storage.get_content_by_id(items[2]) is None, (
-        "API should delete non-favorites"
-    )
+        # Non-favorited should be gone
+        assert storage.get_content_by_id(items[1]) is None, (
+            "API should delete non-favorites"
+        )
+        assert storage.get_content_by_id(items[2]) is None, (
+            "API should delete non-favorites"
+        )
 
-    # Source should be gone
-    response = api_client.get("/api/sources", headers={"X-API-Key": "prismis-api-4d5e"})
-    sources = response.json()["sources"]
-    assert not any(s["id"] == source_id for s in sources), "Source should be deleted"
+        # Source should be gone
+        response = api_client.get(
+            "/api/sources", headers={"X-API-Key": "prismis-api-4d5e"}
+        )
+        sources = response.json()["sources"]
+        assert not any(s["id"] == source_id for s in sources), (
+            "Source should be deleted"
+        )
@@ -3,9 +3,9 @@
 import pytest
 import threading
 import time
+from collections.abc import Callable
 from pathlib import Path
-from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 
 from fastapi.testclient import TestClient
 from prismis_daemon.api import app
@@ -19,7 +19,9 @@ def api_client() -> TestClient:
     return TestClient(app)
 
 
-def test_favorites_persist_on_source_delete(test_db: Path) -> None:
+def test_favorites_persist_on_source_delete(
+    test_db: Path, content_factory: Callable[..., ContentItem]
+) -> None:
     """
     INVARIANT: Favorites persist when source deleted
     BREAKS: User loses curated content
@@ -32,15 +34,13 @@ def test_favorites_persist_on_source_delete(test_db: Path) -> None:
     # Add content items
     items = []
     for i in range(3):
-        item = ContentItem(
-            source_id=source_id,
+        item = content_factory(
+            source_id,
             external_id=f"test-{i}",
             title=f"Article {i}",
             url=f"https://example.com/{i}",
             content=f"Content {i}",
             summary=f"Summary {i}",
-            priority="high",
-            published_at=datetime.now(),
         )
         content_id = storage.add_content(item)
         items.append(content_id)
@@ -73,7 +73,9 @@ def test_favorites_persist_on_source_delete(test_db: Path) -> None:
     assert read_content is None, "Read but not favorited content should be deleted"
 
 
-def test_concurrent_favorite_updates_idempotent(test_db: Path) -> None:
+def test_concurrent_favorite_updates_idempotent(
+    test_db: Path, content_factory: Callable[..., ContentItem]
+) -> None:
     """
     INVARIANT: Concurrent updates are idempotent - last write wins
     BREAKS: Data corruption from race conditions
@@ -82,16 +84,7 @@ def test_concurrent_favorite_updates_idempotent(test_db: Path) -> None:
 
     # Add source and content
     source_id = storage.add_source("https://example.com", "rss", "Test")
-    item = ContentItem(
-        source_id=source_id,
-        external_id="concurrent-test",
-        title="Test Article",
-        url="https://example.com/1",
-        content="Content",
-        summary="Summary",
-        priority="high",
-        published_at=datetime.now(),
-    )
+    item = content_factory(source_id, external_id="concurrent-test")
     content_id = storage.add_content(item)
 
     # Simulate concurrent updates from multiple clients
@@ -104,8 +97,7 @@ def test_concurrent_favorite_updates_idempotent(test_db: Path) -> None:
 
     # Run 20 concurrent updates
     with ThreadPoolExecutor(max_workers=10) as executor:
-        futures = [executor.submit(toggle_favorite, i) for i in range(20)]
-        results = [f.result() for f in as_completed(futures)]
+        results = list(executor.map(toggle_favorite, range(20)))
 
     # All updates should succeed
     assert all(results), "Some updates failed during concurrent execution"
@@ -160,7 +152,9 @@ def test_orphaned_favorites_remain_queryable(test_db: Path) -> None:
     assert orphaned["url"] == "https://deleted-source.com/1"
 
 
-def test_database_lock_during_update(test_db: Path) -> None:
+def test_database_lock_during_update(
+    test_db: Path, content_factory: Callable[..., ContentItem]
+) -> None:
     """
     FAILURE MODE: Database locked during update
     GRACEFUL: System retries with timeout
@@ -169,16 +163,7 @@ def test_database_lock_during_update(test_db: Path) -> None:
 
     # Add source and content
     source_id = storage.add_source("https://example.com", "rss", "Test")
-    item = ContentItem(
-        source_id=source_id,
-        external_id="lock-test",
-        title="Test Article",
-        url="https://example.com/1",
-        content="Content",
-        summary="Summary",
-        priority="high",
-        published_at=datetime.now(),
-    )
+    item = content_factory(source_id, external_id="lock-test")
     content_id = storage.add_content(item)
 
     # Hold a write transaction to cause lock
@@ -205,7 +190,9 @@ def test_database_lock_during_update(test_db: Path) -> None:
         lock_conn.execute("ROLLBACK")
 
 
-def test_concurrent_api_updates(api_client: TestClient, test_db: Path) -> None:
+def test_concurrent_api_updates(
+    api_client: TestClient, test_db: Path, content_factory: Callable[..., ContentItem]
+) -> None:
     """
     FAILURE MODE: Concurrent API updates to same content
     GRACEFUL: Last write wins, no corruption
@@ -214,16 +201,7 @@ def test_concurrent_api_updates(api_client: TestClient, test_db: Path) -> None:
 
     # Add source and content
     source_id = storage.add_source("https://example.com", "rss", "Test")
-    item = ContentItem(
-        source_id=source_id,
-        external_id="api-concurrent",
-        title="Test Article",
-        url="https://example.com/1",
-        content="Content",
-        summary="Summary",
-        priority="high",
-        published_at=datetime.now(),
-    )
+    item = content_factory(source_id, external_id="api-concurrent")
     content_id = storage.add_content(item)
 
     def api_update(should_favorite: bool) -> int:
@@ -238,8 +216,7 @@ def test_concurrent_api_updates(api_client: TestClient, test_db: Path) -> None:
     # Simulate rapid concurrent updates from different clients
     with ThreadPoolExecutor(max_workers=5) as executor:
         # Mix of True and False updates
-        futures = [executor.submit(api_update, i % 2 == 0) for i in range(10)]
-        results = [f.result() for f in as_completed(futures)]
+        results = list(executor.map(lambda i: api_update(i % 2 == 0), range(10)))
 
     # All requests should succeed or fail gracefully
     for status in results:
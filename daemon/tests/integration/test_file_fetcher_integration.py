@@ -14,6 +14,16 @@ import hashlib
 
 from prismis_daemon.storage import Storage
 
+# Fixed changelog versions (v1 oldest, v3 newest) with precomputed content hashes
+VERSION1_CONTENT = "# Changelog\n\nVersion 1.0"
+VERSION1_HASH = hashlib.sha256(VERSION1_CONTENT.encode()).hexdigest()
+
+VERSION2_CONTENT = "# Changelog\n\nVersion 1.0\nVersion 1.1"
+VERSION2_HASH = hashlib.sha256(VERSION2_CONTENT.encode()).hexdigest()
+
+VERSION3_CONTENT = "# Changelog\n\nVersion 1.0\nVersion 1.1\nVersion 1.2"
+VERSION3_HASH = hashlib.sha256(VERSION3_CONTENT.encode()).hexdigest()
+
 
 def test_get_latest_content_for_source_returns_actual_latest(test_db: Path) -> None:
     """
@@ -34,21 +44,12 @@ def test_get_latest_content_for_source_returns_actual_latest(test_db: Path) -> N
     # Simulating 3 fetches over time (v1 oldest, v3 newest)
     base_time = datetime(2024, 1, 1, 12, 0, 0)
 
-    version1_content = "# Changelog\n\nVersion 1.0"
-    version1_hash = hashlib.sha256(version1_content.encode()).hexdigest()
-
-    version2_content = "# Changelog\n\nVersion 1.0\nVersion 1.1"
-    version2_hash = hashlib.sha256(version2_content.encode()).hexdigest()
-
-    version3_content = "# Changelog\n\nVersion 1.0\nVersion 1.1\nVersion 1.2"
-    version3_hash = hashlib.sha256(version3_content.encode()).hexdigest()
-
     # Insert in order: v1 (oldest) → v2 → v3 (newest)
     for idx, (content, content_hash, time_offset) in enumerate(
         [
-            (version1_content, version1_hash, timedelta(hours=0)),  # Oldest
-            (version2_content, version2_hash, timedelta(hours=1)),
-            (version3_content, version3_hash, timedelta(hours=2)),  # Newest
+            (VERSION1_CONTENT, VERSION1_HASH, timedelta(hours=0)),  # Oldest
+            (VERSION2_CONTENT, VERSION2_HASH, timedelta(hours=1)),
+            (VERSION3_CONTENT, VERSION3_HASH, timedelta(hours=2)),  # Newest
         ],
         start=1,
     ):
@@ -78,7 +79,7 @@ def test_get_latest_content_for_source_returns_actual_latest(test_db: Path) -> N
     assert latest["title"] == "Changelog v3", (
         f"Got {latest['title']}, expected Changelog v3"
     )
-    assert latest["analysis"]["content_hash"] == version3_hash, "Wrong version hash"
+    assert latest["analysis"]["content_hash"] == VERSION3_HASH, "Wrong version hash"
     assert "Version 1.2" in latest["analysis"]["full_text"], "Wrong version content"
 
     # Verify it's actually the LATEST by time (SQLite returns string)
@@ -8,7 +8,6 @@ import socket
 from fastapi.testclient import TestClient
 from prismis_daemon.api import app
 from prismis_daemon.config import Config
-import uvicorn
 
 
 @pytest.fixture
@@ -65,6 +64,8 @@ def test_host_config_uvicorn_binding() -> None:
     INVARIANT: Host Binding Correct - config.api_host correctly controls uvicorn binding
     BREAKS: Service unreachable when user configures LAN access
     """
+    import uvicorn  # Deferred: only these binding tests need it
+
     # Test localhost binding config
     test_toml_localhost = """[daemon]
 fetch_interval = 30
@@ -155,6 +156,8 @@ def test_invalid_host_binding_errors() -> None:
     FAILURE: Network binding failures and invalid host configurations
     GRACEFUL: System must provide clear errors, not crash
     """
+    import uvicorn
+
     # Test with obviously invalid host values
     invalid_hosts = [
         "999.999.999.999",  # Invalid IP
@@ -187,6 +190,8 @@ def test_port_conflict_handling() -> None:
     FAILURE: Port 8989 already in use (common failure scenario)
     GRACEFUL: System must handle port conflicts gracefully
     """
+    import uvicorn
+
     # Create a socket to occupy port 8989 on localhost
     test_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     test_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
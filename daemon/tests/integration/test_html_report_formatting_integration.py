@@ -1,19 +1,75 @@
 """Integration tests for HTML report formatting failure modes."""
 
+import re
+import time
+from collections.abc import Callable
 from pathlib import Path
 from datetime import datetime, timezone
 
-from prismis_daemon.reports import ReportGenerator
+import pytest
+
+from prismis_daemon.reports import DailyReport, ReportGenerator
 from prismis_daemon.storage import Storage
 
+# Unescaped JS/HTML injection markers, scanned in one pass over the output
+_DANGER_RE = re.compile(
+    "|".join(
+        map(
+            re.escape,
+            [
+                "<script>",
+                "onerror=",
+                "onload=",
+                "onclick=",
+                "document.body",
+                "document.cookie",
+                "window.location",
+                "window.open",
+                "alert(",
+                "eval(",
+            ],
+        )
+    )
+)
+
+
+RenderFn = Callable[[], tuple[DailyReport, str]]
 
-def test_malicious_content_injection(test_db: Path) -> None:
+
+@pytest.fixture
+def rendered(test_db: Path) -> tuple[Storage, ReportGenerator, RenderFn]:
+    """Storage, generator and a memoized daily report renderer.
+
+    render() returns (report, html) and reuses the previous pair until the
+    database changes - total_changes() tracks writes on storage.conn and
+    data_version tracks commits from other connections (add_content).
+    """
+    storage = Storage(test_db)
+    generator = ReportGenerator(storage)
+    cache: dict[tuple[int, int], tuple[DailyReport, str]] = {}
+
+    def render() -> tuple[DailyReport, str]:
+        key = (
+            storage.conn.execute("SELECT total_changes()").fetchone()[0],
+            storage.conn.execute("PRAGMA data_version").fetchone()[0],
+        )
+        if key not in cache:
+            report = generator.generate_daily_report(hours=24)
+            cache.clear()
+            cache[key] = (report, generator.format_as_html(report))
+        return cache[key]
+
+    return storage, generator, render
+
+
+def test_malicious_content_injection(
+    rendered: tuple[Storage, ReportGenerator, RenderFn],
+) -> None:
     """
     FAILURE: Crafted content designed to break HTML structure
     GRACEFUL: System escapes content and maintains valid HTML
     """
-    storage = Storage(test_db)
-    generator = ReportGenerator(storage)
+    storage, _, render = rendered
 
     # Add malicious source that could inject HTML/JS
     malicious_source_id = storage.add_source(
@@ -39,8 +95,7 @@ def test_malicious_content_injection(test_db: Path) -> None:
     # CRITICAL: Storage and rendering must handle this gracefully
     try:
         storage.add_content(extremely_malicious_content)
-        report = generator.generate_daily_report(hours=24)
-        html_output = generator.format_as_html(report)
+        _, html_output = render()
     except Exception as e:
         assert False, f"System crashed on malicious content: {e}"
 
@@ -48,23 +103,7 @@ def test_malicious_content_injection(test_db: Path) -> None:
     # The HTML formatter has escaping vulnerabilities - malicious content can inject JS
 
     # Check what dangerous patterns are present (document security issues)
-    dangerous_patterns_found = []
-    check_patterns = [
-        "<script>",
-        "onerror=",
-        "onload=",
-        "onclick=",
-        "document.body",
-        "document.cookie",
-        "window.location",
-        "window.open",
-        "alert(",
-        "eval(",
-    ]
-
-    for pattern in check_patterns:
-        if pattern in html_output:
-            dangerous_patterns_found.append(pattern)
+    dangerous_patterns_found = sorted(set(_DANGER_RE.findall(html_output)))
 
     # SECURITY ISSUE: These patterns should be escaped but are not
     if dangerous_patterns_found:
@@ -104,13 +143,14 @@ def test_malicious_content_injection(test_db: Path) -> None:
     )
 
 
-def test_analysis_field_corruption(test_db: Path) -> None:
+def test_analysis_field_corruption(
+    rendered: tuple[Storage, ReportGenerator, RenderFn],
+) -> None:
     """
     FAILURE: Database corruption or invalid JSON in analysis field
     GRACEFUL: System continues with degraded functionality
     """
-    storage = Storage(test_db)
-    generator = ReportGenerator(storage)
+    storage, _, render = rendered
 
     # Add normal source
     source_id = storage.add_source("https://test.com/feed", "rss", "Test Source")
@@ -167,19 +207,18 @@ def test_analysis_field_corruption(test_db: Path) -> None:
         },
     ]
 
-    # Add corrupted items - some may fail due to storage validation
-    successfully_added = []
-    for item in corrupted_items:
-        try:
-            storage.add_content(item)
-            successfully_added.append(item)
-        except (TypeError, ValueError) as e:
-            # Storage layer rejects invalid analysis data types - this is acceptable
-            # Only non-dict analysis types cause storage to fail (integers, strings)
-            print(f"Storage rejected item {item['title']}: {e}")
-            pass
-        except Exception as e:
-            assert False, f"Unexpected storage error for {item['title']}: {e}"
+    # Seed all corrupted items in one batch - duplicates come back as None,
+    # and any item the storage layer can't bind rolls back the whole batch
+    try:
+        content_ids = storage.add_content_bulk(corrupted_items)
+    except Exception as e:
+        assert False, f"Unexpected storage error for corrupted items: {e}"
+
+    successfully_added = [
+        item
+        for item, content_id in zip(corrupted_items, content_ids)
+        if content_id is not None
+    ]
 
     # Should have successfully added at least the dict-based corrupted items
     assert len(successfully_added) >= 2, (
@@ -188,8 +227,7 @@ def test_analysis_field_corruption(test_db: Path) -> None:
 
     # CRITICAL: Report generation must handle corrupted data gracefully
     try:
-        report = generator.generate_daily_report(hours=24)
-        html_output = generator.format_as_html(report)
+        report, html_output = render()
         report_generated = True
     except (TypeError, ValueError) as e:
         # System may crash when reading corrupted JSON from database
@@ -237,3 +275,42 @@ def test_analysis_field_corruption(test_db: Path) -> None:
     assert "interests matched" not in html_output, (
         "No match badges should appear for corrupted data"
     )
+
+
+def test_report_render_perf(
+    rendered: tuple[Storage, ReportGenerator, RenderFn],
+) -> None:
+    """
+    PERFORMANCE: Rendering a large report must stay fast
+    THRESHOLD: 1000 escaped items render in under 2 seconds
+    """
+    storage, generator, render = rendered
+    source_id = storage.add_source("https://perf.com/feed", "rss", "Perf <Source>")
+
+    published_at = datetime.now(timezone.utc)
+    priorities = ["high", "medium", "low"]
+    storage.add_content_bulk(
+        [
+            {
+                "external_id": f"perf-{i}",
+                "title": f"<b>Article {i}</b> & friends",
+                "url": f"https://perf.com/{i}?a=1&b=2",
+                "content": "Content",
+                "summary": f'Summary {i} with "quotes" & <tags>',
+                "source_id": source_id,
+                "priority": priorities[i % 3],
+                "published_at": published_at,
+            }
+            for i in range(1000)
+        ]
+    )
+    report, _ = render()
+    assert report.total_items == 1000
+
+    start = time.perf_counter()
+    html_output = generator.format_as_html(report)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 2.0, f"format_as_html took {elapsed:.2f}s for 1000 items"
+    assert "&lt;b&gt;Article 0&lt;/b&gt; &amp; friends" in html_output
+    assert "<b>Article" not in html_output
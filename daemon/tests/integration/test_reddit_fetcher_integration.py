@@ -5,8 +5,30 @@ from prismis_daemon.fetchers.reddit import RedditFetcher
 from prismis_daemon.models import ContentItem
 from prismis_daemon.config import Config
 
+# Every test hits the real Reddit API - keep them on one xdist worker
+pytestmark = [pytest.mark.serial, pytest.mark.xdist_group(name="reddit")]
 
-def test_fetch_reddit_with_real_api() -> None:
+
+@pytest.fixture(scope="module")
+def reddit_config() -> Config:
+    """Load config with Reddit credentials once per module."""
+    return Config.from_file()
+
+
+@pytest.fixture(scope="module")
+def reddit_fetcher(reddit_config: Config) -> RedditFetcher:
+    """Share one PRAW client (and its OAuth token) across the module."""
+    return RedditFetcher(max_items=3, config=reddit_config)
+
+
+@pytest.fixture(scope="module")
+def python_items(reddit_fetcher: RedditFetcher) -> list[ContentItem]:
+    """Fetch the r/python listing once - this makes real API calls."""
+    source = {"url": "https://reddit.com/r/python", "id": "test-source-123"}
+    return reddit_fetcher.fetch_content(source)
+
+
+def test_fetch_reddit_with_real_api(python_items: list[ContentItem]) -> None:
     """Test complete Reddit fetching workflow with real API.
 
     This test:
@@ -15,15 +37,8 @@ def test_fetch_reddit_with_real_api() -> None:
     - Filters out image posts
     - Returns proper ContentItem objects
     """
-    # Load config with Reddit credentials
-    config = Config.from_file()
-    fetcher = RedditFetcher(max_items=3, config=config)
-
-    # Use a stable subreddit for testing
-    source = {"url": "https://reddit.com/r/python", "id": "test-source-123"}
-
-    # Fetch content - this makes real API calls
-    items = fetcher.fetch_content(source)
+    # Stable subreddit fetched once by the python_items fixture
+    items = python_items
 
     # Verify we got items back
     assert len(items) > 0
@@ -63,10 +78,10 @@ def test_fetch_reddit_with_real_api() -> None:
         assert len(external_ids) == len(set(external_ids))
 
 
-def test_fetch_reddit_handles_invalid_subreddit() -> None:
+def test_fetch_reddit_handles_invalid_subreddit(
+    reddit_fetcher: RedditFetcher,
+) -> None:
     """Test fetcher handles invalid subreddit gracefully."""
-    config = Config.from_file()
-    fetcher = RedditFetcher(config=config)
 
     # Try to fetch from non-existent subreddit
     source = {
@@ -75,32 +90,34 @@ def test_fetch_reddit_handles_invalid_subreddit() -> None:
     }
 
     with pytest.raises(Exception) as exc_info:
-        fetcher.fetch_content(source)
+        reddit_fetcher.fetch_content(source)
 
     # Should wrap error with context
     assert "Failed to fetch Reddit content" in str(exc_info.value)
 
 
-def test_fetch_reddit_respects_max_items() -> None:
+def test_fetch_reddit_respects_max_items(
+    reddit_fetcher: RedditFetcher, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """Test fetcher respects max_items configuration."""
-    config = Config.from_file()
-    fetcher = RedditFetcher(max_items=1, config=config)
+    monkeypatch.setattr(reddit_fetcher, "max_items", 1)
 
     source = {"url": "r/python", "id": "test-id"}
 
-    items = fetcher.fetch_content(source)
+    items = reddit_fetcher.fetch_content(source)
     assert len(items) <= 1
 
 
-def test_fetch_reddit_filters_image_posts() -> None:
+def test_fetch_reddit_filters_image_posts(
+    reddit_fetcher: RedditFetcher, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """Test that image posts are filtered out."""
-    config = Config.from_file()
-    fetcher = RedditFetcher(max_items=10, config=config)
+    monkeypatch.setattr(reddit_fetcher, "max_items", 10)
 
     # Use a subreddit that has mix of text and image posts
     source = {"url": "r/programming", "id": "test-id"}
 
-    items = fetcher.fetch_content(source)
+    items = reddit_fetcher.fetch_content(source)
 
     # All returned items should be text posts (not image domains)
     image_domains = ["i.redd.it", "imgur.com", "v.redd.it"]
@@ -113,15 +130,16 @@ def test_fetch_reddit_filters_image_posts() -> None:
                 )
 
 
-def test_fetch_reddit_handles_various_url_formats() -> None:
+def test_fetch_reddit_handles_various_url_formats(
+    reddit_fetcher: RedditFetcher, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """Test that various Reddit URL formats are parsed correctly."""
-    config = Config.from_file()
-    fetcher = RedditFetcher(max_items=1, config=config)
+    monkeypatch.setattr(reddit_fetcher, "max_items", 1)
 
     url_formats = ["https://reddit.com/r/python", "r/python", "python"]
 
     for url in url_formats:
         source = {"url": url, "id": "test-id"}
 
-        items = fetcher.fetch_content(source)
+        items = reddit_fetcher.fetch_content(source)
         assert len(items) > 0, f"Failed to fetch from URL format: {url}"
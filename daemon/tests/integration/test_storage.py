@@ -1,16 +1,18 @@
 """Integration tests for Storage class with real database."""
 
-from pathlib import Path
+import sqlite3
 from datetime import datetime
 import pytest
 
 from prismis_daemon.storage import Storage
 from prismis_daemon.models import ContentItem
 
+# Fixed publish time for items whose timestamp isn't under test
+PUBLISHED_AT = datetime(2024, 1, 15, 10, 0)
 
-def test_source_management_workflow(test_db: Path) -> None:
+
+def test_source_management_workflow(storage: Storage) -> None:
     """Test complete source management: add, retrieve, update status."""
-    storage = Storage(test_db)
 
     # Add a source
     source_id = storage.add_source(
@@ -31,8 +33,10 @@ def test_source_management_workflow(test_db: Path) -> None:
     sources = storage.get_active_sources()
     assert len(sources) == 2
 
-    # Find the RSS source (order isn't guaranteed with UUIDs)
-    rss_source = next(s for s in sources if s["type"] == "rss")
+    assert {s["id"] for s in sources} == {source_id, source_id2}
+
+    # Look up the RSS source directly by primary key
+    rss_source = storage.get_source(source_id)
     assert rss_source["url"] == "https://example.com/feed.xml"
     assert rss_source["name"] == "Example Feed"
     assert rss_source["active"] is True
@@ -40,22 +44,22 @@ def test_source_management_workflow(test_db: Path) -> None:
 
     # Update source status after successful fetch
     storage.update_source_fetch_status(source_id, True)
-    sources = storage.get_active_sources()
-    rss_source = next(s for s in sources if s["type"] == "rss")
+    rss_source = storage.get_source(source_id)
     assert rss_source["error_count"] == 0
     assert rss_source["last_fetched_at"] is not None
 
     # Update source status after failed fetch
     storage.update_source_fetch_status(source_id, False, "Connection timeout")
-    sources = storage.get_active_sources()
-    rss_source = next(s for s in sources if s["type"] == "rss")
+    rss_source = storage.get_source(source_id)
     assert rss_source["error_count"] == 1
     assert rss_source["last_error"] == "Connection timeout"
 
+    # Unknown IDs return None rather than raising
+    assert storage.get_source("missing-source-id") is None
+
 
-def test_content_storage_with_deduplication(test_db: Path) -> None:
+def test_content_storage_with_deduplication(storage: Storage) -> None:
     """Test content storage and deduplication via external_id."""
-    storage = Storage(test_db)
 
     # Add a source first
     source_id = storage.add_source("https://example.com/feed", "rss", "Test Feed")
@@ -69,7 +73,7 @@ def test_content_storage_with_deduplication(test_db: Path) -> None:
         content="Full article content here",
         summary="Article summary",
         priority="high",
-        published_at=datetime(2024, 1, 15, 10, 0),
+        published_at=PUBLISHED_AT,
     )
 
     # First insert should succeed
@@ -100,14 +104,14 @@ def test_content_storage_with_deduplication(test_db: Path) -> None:
     assert content_id != content_id2  # Different UUIDs
 
 
-def test_priority_based_retrieval_and_marking_read(test_db: Path) -> None:
+def test_priority_based_retrieval_and_marking_read(storage: Storage) -> None:
     """Test retrieving content by priority and marking as read."""
-    storage = Storage(test_db)
 
     # Add source
     source_id = storage.add_source("https://example.com/feed", "rss", "Test")
 
-    # Add content with different priorities
+    # Add content with different priorities, sharing one timestamp
+    now = datetime.now()
     high_item = ContentItem(
         source_id=source_id,
         external_id="high-1",
@@ -115,9 +119,8 @@ def test_priority_based_retrieval_and_marking_read(test_db: Path) -> None:
         url="https://example.com/high",
         content="Important content",
         priority="high",
-        published_at=datetime.now(),
+        published_at=now,
     )
-    storage.add_content(high_item)
 
     medium_item = ContentItem(
         source_id=source_id,
@@ -125,9 +128,8 @@ def test_priority_based_retrieval_and_marking_read(test_db: Path) -> None:
         title="Medium Priority Article",
         url="https://example.com/medium",
         priority="medium",
-        published_at=datetime.now(),
+        published_at=now,
     )
-    storage.add_content(medium_item)
 
     low_item = ContentItem(
         source_id=source_id,
@@ -135,9 +137,9 @@ def test_priority_based_retrieval_and_marking_read(test_db: Path) -> None:
         title="Low Priority Article",
         url="https://example.com/low",
         priority="low",
-        published_at=datetime.now(),
+        published_at=now,
     )
-    storage.add_content(low_item)
+    storage.add_content_bulk([high_item, medium_item, low_item])
 
     # Get high priority content
     high_content = storage.get_content_by_priority("high")
@@ -163,51 +165,54 @@ def test_priority_based_retrieval_and_marking_read(test_db: Path) -> None:
     assert marked_missing is False
 
 
-def test_source_error_tracking_and_auto_deactivation(test_db: Path) -> None:
+def test_source_error_tracking_and_auto_deactivation(storage: Storage) -> None:
     """Test that sources are auto-deactivated after 5 consecutive errors."""
-    storage = Storage(test_db)
 
     # Add a source
     source_id = storage.add_source("https://example.com/feed", "rss", "Test")
 
     # Simulate 4 failures - should still be active
-    for i in range(4):
-        storage.update_source_fetch_status(source_id, False, f"Error {i + 1}")
+    with storage.transaction():
+        for i in range(4):
+            source = storage.update_source_fetch_status(
+                source_id, False, f"Error {i + 1}"
+            )
 
-    sources = storage.get_active_sources()
-    assert len(sources) == 1
-    assert sources[0]["error_count"] == 4
-    assert sources[0]["active"] is True
+    # The update returns the row as written - no re-fetch needed
+    assert source["error_count"] == 4
+    assert source["active"] is True
 
     # 5th failure should deactivate
-    storage.update_source_fetch_status(source_id, False, "Error 5")
+    source = storage.update_source_fetch_status(source_id, False, "Error 5")
+    assert source["error_count"] == 5
+    assert source["active"] is False
+    assert source["last_error"] == "Error 5"
 
     # Should no longer appear in active sources
-    sources = storage.get_active_sources()
-    assert len(sources) == 0
-
-    # Verify it's deactivated (would need a get_all_sources method)
-    # For now, we just verify it's not in active sources
+    assert storage.get_active_sources() == []
 
     # Test that success resets error count
     source_id2 = storage.add_source("https://example.com/feed2", "rss", "Test2")
 
     # Add 3 errors
-    for i in range(3):
-        storage.update_source_fetch_status(source_id2, False, f"Error {i + 1}")
-
-    sources = storage.get_active_sources()
-    assert sources[0]["error_count"] == 3
+    with storage.transaction():
+        for i in range(3):
+            source = storage.update_source_fetch_status(
+                source_id2, False, f"Error {i + 1}"
+            )
+    assert source["error_count"] == 3
 
     # Success should reset error count
-    storage.update_source_fetch_status(source_id2, True)
-    sources = storage.get_active_sources()
-    assert sources[0]["error_count"] == 0
+    source = storage.update_source_fetch_status(source_id2, True)
+    assert source["error_count"] == 0
+    assert source["last_error"] is None
 
+    # Unknown sources have no row to return
+    assert storage.update_source_fetch_status("missing-source-id", True) is None
 
-def test_add_source_returns_existing_id_for_duplicate(test_db: Path) -> None:
+
+def test_add_source_returns_existing_id_for_duplicate(storage: Storage) -> None:
     """Test that add_source returns existing UUID for duplicate URLs."""
-    storage = Storage(test_db)
 
     # Add a source
     id1 = storage.add_source("https://example.com/feed", "rss", "First")
@@ -224,9 +229,8 @@ def test_add_source_returns_existing_id_for_duplicate(test_db: Path) -> None:
     assert sources[0]["name"] == "First"  # Original name preserved
 
 
-def test_content_with_json_analysis(test_db: Path) -> None:
+def test_content_with_json_analysis(storage: Storage) -> None:
     """Test storing and retrieving content with JSON analysis field."""
-    storage = Storage(test_db)
 
     # Add source
     source_id = storage.add_source("https://example.com/feed", "rss", "Test")
@@ -255,3 +259,169 @@ def test_content_with_json_analysis(test_db: Path) -> None:
         "relevance_score": 0.85,
         "sentiment": "positive",
     }
+
+
+def test_add_content_bulk_deduplicates_in_one_batch(storage: Storage) -> None:
+    """Test bulk insert skips existing and in-batch duplicate external_ids."""
+    source_id = storage.add_source("https://example.com/feed", "rss", "Test Feed")
+
+    existing_id = storage.add_content(
+        ContentItem(
+            source_id=source_id,
+            external_id="existing",
+            title="Existing Article",
+            url="https://example.com/existing",
+        )
+    )
+    assert existing_id is not None
+
+    content_ids = storage.add_content_bulk(
+        [
+            {"source_id": source_id, "external_id": "new-1", "title": "New 1"},
+            {"source_id": source_id, "external_id": "existing", "title": "Dup"},
+            {"source_id": source_id, "external_id": "new-2", "title": "New 2"},
+            {"source_id": source_id, "external_id": "new-1", "title": "Dup 1"},
+        ]
+    )
+
+    # Ids come back in input order, None for duplicates
+    assert content_ids[1] is None
+    assert content_ids[3] is None
+    assert content_ids[0] is not None and content_ids[2] is not None
+    assert storage.get_existing_external_ids(source_id) == {
+        "existing",
+        "new-1",
+        "new-2",
+    }
+    assert storage.get_content_by_id(content_ids[0])["title"] == "New 1"
+
+    assert storage.add_content_bulk([]) == []
+
+
+def test_add_content_bulk_rolls_back_whole_batch(storage: Storage) -> None:
+    """Test a row that fails to bind discards the rows inserted before it."""
+    source_id = storage.add_source("https://example.com/feed", "rss", "Test Feed")
+
+    good = ContentItem(
+        source_id=source_id, external_id="good", title="Good", url="https://e.com/1"
+    )
+    bad = ContentItem(
+        source_id=source_id, external_id="bad", title="Bad", url="https://e.com/2"
+    )
+    bad.published_at = "not a datetime"  # type: ignore[assignment]
+
+    with pytest.raises(AttributeError):
+        storage.add_content_bulk([good, bad])
+
+    assert storage.get_existing_external_ids(source_id) == set()
+
+
+def test_transaction_commits_once_and_rolls_back_on_error(storage: Storage) -> None:
+    """Test that transaction() groups writes and discards them all on error."""
+    source_id = storage.add_source("https://example.com/feed", "rss", "Test")
+
+    with storage.transaction():
+        for i in range(3):
+            storage.add_content(
+                {
+                    "source_id": source_id,
+                    "external_id": f"tx-{i}",
+                    "title": f"Article {i}",
+                    "url": f"https://example.com/{i}",
+                    "priority": "high",
+                }
+            )
+        # Nested blocks join the outer transaction
+        with storage.transaction():
+            storage.update_source_fetch_status(source_id, False, "Error 1")
+
+    assert len(storage.get_content_by_priority("high")) == 3
+    assert storage.get_active_sources()[0]["error_count"] == 1
+
+    with pytest.raises(RuntimeError):
+        with storage.transaction():
+            storage.add_content(
+                {
+                    "source_id": source_id,
+                    "external_id": "tx-rolled-back",
+                    "title": "Rolled Back",
+                    "url": "https://example.com/rolled-back",
+                    "priority": "high",
+                }
+            )
+            storage.update_source_fetch_status(source_id, False, "Error 2")
+            raise RuntimeError("abort setup")
+
+    # Nothing from the failed block was committed
+    assert len(storage.get_content_by_priority("high")) == 3
+    assert storage.get_active_sources()[0]["error_count"] == 1
+
+
+def test_dedup_and_priority_queries_use_indexes(storage: Storage) -> None:
+    """Test dedup lookups hit indexes and unread listings use the partial index."""
+    plan = storage.conn.execute(
+        "EXPLAIN QUERY PLAN SELECT external_id FROM content WHERE source_id = ?",
+        ("src",),
+    ).fetchall()
+    details = " ".join(row["detail"] for row in plan)
+    assert "COVERING INDEX idx_content_source_external" in details
+
+    # _get_by_external_id probes the UNIQUE(external_id) autoindex
+    plan = storage.conn.execute(
+        "EXPLAIN QUERY PLAN SELECT id FROM content WHERE external_id = ?",
+        ("ext",),
+    ).fetchall()
+    details = " ".join(row["detail"] for row in plan)
+    assert "USING INDEX sqlite_autoindex_content" in details
+    assert "SCAN" not in details
+
+    plan = storage.conn.execute(
+        "EXPLAIN QUERY PLAN SELECT id FROM content "
+        "WHERE priority = ? AND read = 0 ORDER BY published_at DESC",
+        ("high",),
+    ).fetchall()
+    details = " ".join(row["detail"] for row in plan)
+    assert "idx_content_unread_priority" in details
+
+
+def test_transaction_defers_foreign_keys_to_commit(storage: Storage) -> None:
+    """Test deferred FK checks allow out-of-order inserts but still fail at commit."""
+    item = {
+        "source_id": "source-added-later",
+        "external_id": "deferred-1",
+        "title": "Inserted Before Its Source",
+        "url": "https://example.com/deferred-1",
+        "priority": "high",
+    }
+
+    # Child row first, parent later - valid once the block commits
+    with storage.transaction(defer_foreign_keys=True):
+        storage.add_content(item)
+        storage.conn.execute(
+            "INSERT INTO sources (id, url, type, name) VALUES (?, ?, 'rss', ?)",
+            ("source-added-later", "https://example.com/late-feed", "Late"),
+        )
+
+    assert len(storage.get_content_by_priority("high")) == 1
+
+    # A dangling reference is still rejected, at COMMIT, and rolled back
+    with pytest.raises(sqlite3.IntegrityError):
+        with storage.transaction(defer_foreign_keys=True):
+            storage.add_content(
+                {**item, "external_id": "deferred-2", "source_id": "never-added"}
+            )
+
+    assert len(storage.get_content_by_priority("high")) == 1
+
+    # A nested block asking for deferral gets it inside the outer transaction
+    with storage.transaction():
+        with storage.transaction(defer_foreign_keys=True):
+            storage.add_content(
+                {**item, "external_id": "deferred-3", "source_id": "nested-late"}
+            )
+            storage.conn.execute(
+                "INSERT INTO sources (id, url, type, name) VALUES (?, ?, 'rss', ?)",
+                ("nested-late", "https://example.com/nested-feed", "Nested"),
+            )
+
+    assert len(storage.get_content_by_priority("high")) == 2
@@ -1,15 +1,15 @@
 """Integration tests for Storage.add_content dict interface with real database."""
 
-from pathlib import Path
+import sqlite3
+
 import pytest
 
 from prismis_daemon.storage import Storage
 from prismis_daemon.models import ContentItem
 
 
-def test_dict_interface_complete_workflow(test_db: Path) -> None:
+def test_dict_interface_complete_workflow(storage: Storage) -> None:
     """Test complete workflow using dict interface with real database."""
-    storage = Storage(test_db)
 
     # Add a source first
     source_id = storage.add_source("https://example.com/feed", "rss", "Test Feed")
@@ -51,9 +51,8 @@ def test_dict_interface_complete_workflow(test_db: Path) -> None:
     assert high_content[0]["notes"] == "Test notes"
 
 
-def test_mixed_dict_and_contentitem_interface(test_db: Path) -> None:
+def test_mixed_dict_and_contentitem_interface(storage: Storage) -> None:
     """Test that dict and ContentItem interfaces work together seamlessly."""
-    storage = Storage(test_db)
 
     # Add a source
     source_id = storage.add_source("https://example.com/feed", "rss", "Test Feed")
@@ -86,9 +85,8 @@ def test_mixed_dict_and_contentitem_interface(test_db: Path) -> None:
     assert len(medium_content) == 2
 
     # Find each by title
-    titles = [c["title"] for c in medium_content]
-    assert "ContentItem Test" in titles
-    assert "Dict Test" in titles
+    titles = {c["title"] for c in medium_content}
+    assert {"ContentItem Test", "Dict Test"} <= titles
 
     # Test deduplication across interfaces
     # Try to add same external_id with dict that was added with ContentItem
@@ -100,50 +98,59 @@ def test_mixed_dict_and_contentitem_interface(test_db: Path) -> None:
     assert dup_id is None  # Should be rejected
 
 
-def test_dict_without_source_id_auto_assigns(test_db: Path) -> None:
-    """Test that dict without source_id automatically uses first active source."""
-    storage = Storage(test_db)
-
-    # Add multiple sources
-    storage.add_source("https://source1.com/feed", "rss", "Source 1")
-    storage.add_source("https://source2.com/feed", "rss", "Source 2")
-
-    # Add content without specifying source_id
-    content_dict = {
-        "external_id": "auto-source-test",
-        "title": "Auto Source Assignment",
+@pytest.mark.parametrize(
+    ("source_count", "payload", "expected_exc", "match"),
+    [
+        (
+            2,
+            {"external_id": "auto-source-test", "title": "Auto Source Assignment"},
+            None,
+            None,
+        ),
+        (
+            0,
+            {"external_id": "no-sources-test", "title": "No Sources Test"},
+            ValueError,
+            "No source_id provided and no active sources available",
+        ),
+        (
+            0,
+            {
+                "external_id": "explicit-source-test",
+                "title": "Explicit Source Test",
+                "source_id": "fake-source-id",
+            },
+            sqlite3.Error,
+            "FOREIGN KEY constraint failed",
+        ),
+    ],
+    ids=["auto_assigns_active_source", "no_sources_raises", "invalid_source_hits_fk"],
+)
+def test_dict_source_id_resolution(
+    storage: Storage,
+    source_count: int,
+    payload: dict,
+    expected_exc: type[Exception] | None,
+    match: str | None,
+) -> None:
+    """Test how a dict's source_id is resolved against the sources table.
+
+    Without source_id the first active source is used, or ValueError is
+    raised when none exist. An explicit source_id is taken as-is, so an
+    unknown one fails at the foreign key rather than with ValueError.
+    """
+    source_ids = {
+        storage.add_source(f"https://source{i}.com/feed", "rss", f"Source {i}")
+        for i in range(1, source_count + 1)
     }
-    content_id = storage.add_content(content_dict)
-    assert content_id is not None
-
-    # Verify it was assigned to the first source
-    # Note: We can't guarantee order with UUIDs, so we need to check differently
-    # Let's just verify the content was added successfully
-    # The unit tests already verify the first source logic
-
 
-def test_dict_interface_with_empty_database_raises(test_db: Path) -> None:
-    """Test that dict without source_id raises error when no sources exist."""
-    storage = Storage(test_db)
+    if expected_exc is not None:
+        with pytest.raises(expected_exc, match=match):
+            storage.add_content(payload)
+        return
 
-    # Don't add any sources
-    content_dict = {"external_id": "no-sources-test", "title": "No Sources Test"}
-
-    # Should raise ValueError
-    with pytest.raises(
-        ValueError, match="No source_id provided and no active sources available"
-    ):
-        storage.add_content(content_dict)
-
-    # But works fine if we provide source_id explicitly (even if invalid - will fail at FK)
-    content_dict_with_source = {
-        "external_id": "explicit-source-test",
-        "title": "Explicit Source Test",
-        "source_id": "fake-source-id",
-    }
-
-    # This should fail with a foreign key error, not ValueError
-    with pytest.raises(Exception) as exc_info:
-        storage.add_content(content_dict_with_source)
-    # Check it's not the ValueError about missing sources
-    assert "No source_id provided" not in str(exc_info.value)
+    content_id = storage.add_content(payload)
+    assert content_id is not None
+    # Order among active sources isn't guaranteed with UUIDs - the unit
+    # tests cover which source is picked first
+    assert storage.get_content_by_id(content_id)["source_id"] in source_ids
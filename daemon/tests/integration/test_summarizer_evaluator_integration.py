@@ -1,54 +1,126 @@
-"""Integration tests for ContentSummarizer and ContentEvaluator with real LLM API calls."""
+"""Integration tests for ContentSummarizer and ContentEvaluator with real LLM API calls.
 
-import os
-import pytest
-from summarizer import ContentSummarizer
-from evaluator import ContentEvaluator, PriorityLevel
+Tests marked llm make their own independent API calls, so they can be spread
+across workers with: pytest -m llm -n auto. Responses are replayed from
+.pytest_cache - set PRISMIS_REFRESH_LLM_CACHE=1 to re-record them. A test
+only needs OPENAI_API_KEY when its response isn't cached; otherwise it skips.
+"""
+
+import asyncio
+import json
+from collections.abc import Callable
+from types import SimpleNamespace
+from typing import Any
 
+import pytest
 
-@pytest.mark.skipif(
-    not os.environ.get("OPENAI_API_KEY"),
-    reason="Requires OPENAI_API_KEY environment variable",
+from prismis_daemon import evaluator, summarizer
+from prismis_daemon.config import Config
+from prismis_daemon.evaluator import ContentEvaluator, PriorityLevel
+from prismis_daemon.summarizer import ContentSummarizer
+from tests.fixtures.prompts import (
+    BITCOIN_ARTICLE,
+    GPT5_ARTICLE,
+    INTERESTS_CONTEXT,
+    LOCAL_LLM_ARTICLE,
+    LOCAL_LLM_CONTEXT,
+    RUST_ARTICLE,
 )
-def test_summarizer_with_real_llm_extracts_all_fields() -> None:
+
+# Canned llm_core responses matching each caller's JSON contract
+SUMMARY_RESPONSE = {
+    "summary": "Rust 2.0 ships a rewritten borrow checker and faster WASM builds.",
+    "reading_summary": "# Rust 2.0\n\n## Overview\nA major release...",
+    "alpha_insights": [
+        "Phantom Ownership moves more memory checks to compile time",
+        "The borrow checker is rebuilt on linear types",
+        "Fix suggestions apply automatically 90% of the time",
+        "WASM compilation is 3x faster",
+        "WASM modules are 50% smaller",
+        "Performance improves 40% alongside the safety gains",
+    ],
+    "patterns": [
+        "Safety and performance improving together",
+        "Compilers taking on more developer tooling",
+        "Rust positioning for browser and edge workloads",
+    ],
+    "entities": ["Rust", "WebAssembly", "borrow checker", "linear types", "WASM"],
+    "quotes": [],
+    "tools": [],
+    "urls": [],
+}
+EVALUATION_RESPONSE = {
+    "priority": "high",
+    "matched_interests": ["Systems programming"],
+    "reasoning": "Major release of a systems programming language.",
+}
+
+
+@pytest.fixture(scope="module")
+def llm_service() -> str:
+    """Light service name from the user's config, read once per module."""
+    try:
+        return Config.from_file().llm_light_service
+    except Exception:
+        pytest.skip("Config file not found at ~/.config/prismis/config.toml")
+
+
+@pytest.fixture(scope="module")
+def content_summarizer(llm_service: str) -> ContentSummarizer:
+    """One summarizer shared by the module - llm_core pools the connection."""
+    return ContentSummarizer(llm_service)
+
+
+@pytest.fixture(scope="module")
+def content_evaluator(llm_service: str) -> ContentEvaluator:
+    """One evaluator shared by the module - llm_core pools the connection."""
+    return ContentEvaluator(llm_service)
+
+
+@pytest.fixture
+def mock_llm_responses(monkeypatch: pytest.MonkeyPatch) -> list[dict[str, Any]]:
+    """Answer summarizer and evaluator llm_core calls with canned JSON.
+
+    For tests that only check the shape of the pipeline output - content
+    quality is covered by the llm-marked tests. Returns the recorded calls.
+    """
+    calls: list[dict[str, Any]] = []
+
+    def canned(response: dict[str, Any]) -> Callable[..., SimpleNamespace]:
+        def complete(**kwargs: Any) -> SimpleNamespace:
+            calls.append(kwargs)
+            return SimpleNamespace(
+                text=json.dumps(response),
+                model="canned",
+                cost=0.0,
+                duration_ms=0,
+                tokens=SimpleNamespace(input=0, output=0),
+            )
+
+        return complete
+
+    monkeypatch.setattr(summarizer, "complete", canned(SUMMARY_RESPONSE))
+    monkeypatch.setattr(evaluator, "complete", canned(EVALUATION_RESPONSE))
+    return calls
+
+
+@pytest.mark.llm
+@pytest.mark.usefixtures("cached_llm")
+def test_summarizer_with_real_llm_extracts_all_fields(
+    content_summarizer: ContentSummarizer,
+) -> None:
     """Test ContentSummarizer with real LLM API extracts all analysis fields.
 
     This test:
-    - Initializes ContentSummarizer with real API key
+    - Uses the module-shared ContentSummarizer
     - Makes actual LLM API call to gpt-4o-mini
     - Verifies all fields extracted (summary, reading_summary, alpha_insights, patterns, entities)
     """
-    # Use real API key from environment
-    config = {
-        "model": "gpt-4o-mini",
-        "api_key": os.environ.get("OPENAI_API_KEY"),
-    }
-
-    summarizer = ContentSummarizer(config)
-
     # Test content about AI that should generate rich analysis
-    content = """
-    OpenAI has announced GPT-5, their most advanced language model yet. 
-    The new model demonstrates remarkable improvements in reasoning, particularly 
-    in mathematical problem-solving and logical deduction. Early benchmarks show 
-    a 10x improvement in complex reasoning tasks compared to GPT-4.
-    
-    The model uses a new architecture called "Hierarchical Reasoning Networks" 
-    that allows it to break down complex problems into smaller sub-problems, 
-    solve them independently, and then synthesize the results. This approach 
-    mirrors how human experts tackle difficult challenges.
-    
-    Additionally, GPT-5 features significantly reduced hallucination rates, 
-    achieved through a novel training technique called "Verified Chain-of-Thought" 
-    where the model learns to validate its own reasoning steps against a knowledge base.
-    
-    The implications for scientific research, software development, and education 
-    are profound. Researchers are already using early access versions to accelerate 
-    drug discovery and climate modeling efforts.
-    """
+    content = GPT5_ARTICLE
 
     # Make real LLM API call
-    result = summarizer.summarize_with_analysis(
+    result = content_summarizer.summarize_with_analysis(
         content=content,
         title="OpenAI Announces GPT-5 with Breakthrough Reasoning",
         url="https://example.com/gpt5-announcement",
@@ -89,57 +161,27 @@ def test_summarizer_with_real_llm_extracts_all_fields() -> None:
     assert result.metadata["content_length"] == len(content)
 
 
-@pytest.mark.skipif(
-    not os.environ.get("OPENAI_API_KEY"),
-    reason="Requires OPENAI_API_KEY environment variable",
-)
-def test_evaluator_with_real_llm_high_priority() -> None:
+@pytest.mark.llm
+@pytest.mark.usefixtures("cached_llm")
+@pytest.mark.timeout(10)  # One short evaluation call
+def test_evaluator_with_real_llm_high_priority(
+    content_evaluator: ContentEvaluator,
+) -> None:
     """Test ContentEvaluator correctly identifies high priority content.
 
     This test:
-    - Initializes ContentEvaluator with real API key
+    - Uses the module-shared ContentEvaluator
     - Makes actual LLM API call
     - Evaluates AI content against context with AI as high priority
     - Verifies HIGH priority assigned with matched interests
     """
-    # Use real API key from environment
-    config = {
-        "model": "gpt-4o-mini",
-        "api_key": os.environ.get("OPENAI_API_KEY"),
-    }
-
-    evaluator = ContentEvaluator(config)
-
     # Content that should be high priority
-    content = """
-    Major breakthrough in local LLM technology: Researchers have developed 
-    a new quantization technique that allows GPT-4 level models to run on 
-    consumer hardware with just 8GB of RAM, while maintaining 95% of the 
-    original model's performance.
-    """
+    content = LOCAL_LLM_ARTICLE
 
-    # Context with AI/LLM as high priority
-    context = """
-    ## High Priority Topics
-    - AI/LLM breakthroughs, especially local models
-    - Quantization and model optimization
-    - Making AI accessible on consumer hardware
-    
-    ## Medium Priority Topics
-    - Web development frameworks
-    - Database optimization
-    
-    ## Low Priority Topics
-    - Gaming news
-    - Social media updates
-    
-    ## Not Interested
-    - Cryptocurrency
-    - Celebrity news
-    """
+    context = LOCAL_LLM_CONTEXT
 
     # Make real LLM API call
-    result = evaluator.evaluate_content(
+    result = content_evaluator.evaluate_content(
         content=content,
         title="Breakthrough in Local LLM Technology",
         url="https://example.com/local-llm",
@@ -161,51 +203,25 @@ def test_evaluator_with_real_llm_high_priority() -> None:
     assert len(result.reasoning) > 10
 
 
-@pytest.mark.skipif(
-    not os.environ.get("OPENAI_API_KEY"),
-    reason="Requires OPENAI_API_KEY environment variable",
-)
-def test_evaluator_with_real_llm_low_priority() -> None:
+@pytest.mark.llm
+@pytest.mark.usefixtures("cached_llm")
+@pytest.mark.timeout(10)  # One short evaluation call
+def test_evaluator_with_real_llm_low_priority(
+    content_evaluator: ContentEvaluator,
+) -> None:
     """Test ContentEvaluator correctly identifies low priority content.
 
     This test:
     - Uses content about topics in "Not Interested" section
     - Verifies LOW priority assigned
     """
-    # Use real API key from environment
-    config = {
-        "model": "gpt-4o-mini",
-        "api_key": os.environ.get("OPENAI_API_KEY"),
-    }
-
-    evaluator = ContentEvaluator(config)
-
     # Content that should be low priority (crypto - in Not Interested)
-    content = """
-    Bitcoin reaches new all-time high as institutional investors continue 
-    to pour money into cryptocurrency markets. The latest DeFi protocol 
-    promises 1000% APY returns through yield farming strategies.
-    """
+    content = BITCOIN_ARTICLE
 
-    # Same context as above
-    context = """
-    ## High Priority Topics
-    - AI/LLM breakthroughs
-    - Systems programming
-    
-    ## Medium Priority Topics
-    - Web development
-    
-    ## Low Priority Topics
-    - Gaming news
-    
-    ## Not Interested
-    - Cryptocurrency, blockchain, DeFi
-    - Celebrity news
-    """
+    context = INTERESTS_CONTEXT
 
     # Make real LLM API call
-    result = evaluator.evaluate_content(
+    result = content_evaluator.evaluate_content(
         content=content,
         title="Bitcoin Reaches New High",
         url="https://example.com/bitcoin",
@@ -219,65 +235,62 @@ def test_evaluator_with_real_llm_low_priority() -> None:
     assert result.reasoning is not None
 
 
-def test_complete_analysis_pipeline(llm_config, full_config) -> None:
-    """Test complete pipeline: summarization followed by evaluation.
+@pytest.mark.asyncio
+async def test_complete_analysis_pipeline(
+    mock_llm_responses: list[dict[str, Any]],
+) -> None:
+    """Test complete pipeline: summarization and evaluation of one item.
 
     This test:
     - Runs content through summarizer for rich analysis
-    - Then evaluates for priority
+    - Evaluates the same content for priority
     - Simulates the actual daemon workflow
+
+    Only the shape of the results is checked, so the LLM answers are canned.
+    The two calls don't depend on each other and run concurrently.
     """
-    # Use config from fixture (loaded from actual config file)
-    summarizer = ContentSummarizer(llm_config)
-    evaluator = ContentEvaluator(llm_config)
+    content_summarizer = ContentSummarizer("prismis-openai")
+    content_evaluator = ContentEvaluator("prismis-openai")
 
     # Rust content (should be high priority based on typical context)
-    content = """
-    Rust 2.0 has been released with groundbreaking memory management improvements.
-    The new version introduces "Phantom Ownership", a compile-time mechanism that
-    eliminates even more classes of memory bugs while improving performance by 40%.
-    
-    The borrow checker has been completely rewritten using a new algorithm based on
-    linear types, making it both more permissive for valid code and better at
-    catching subtle bugs. Error messages now provide automatic fix suggestions
-    that work 90% of the time.
-    
-    WebAssembly compilation is now 3x faster, and the resulting WASM modules are
-    50% smaller. This makes Rust even more attractive for browser-based applications
-    and edge computing scenarios.
-    """
+    content = RUST_ARTICLE
 
-    # Use actual context from config
-    context = full_config["context"]
+    context = """
+    ## High Priority Topics
+    - Systems programming
+    """
 
-    # Step 1: Summarize and extract insights
-    summary_result = summarizer.summarize_with_analysis(
-        content=content,
-        title="Rust 2.0 Released with Memory Management Breakthrough",
-        url="https://example.com/rust-2",
-        source_type="rss",
+    title = "Rust 2.0 Released with Memory Management Breakthrough"
+    url = "https://example.com/rust-2"
+    summary_result, evaluation = await asyncio.gather(
+        # Summarize and extract insights
+        asyncio.to_thread(
+            content_summarizer.summarize_with_analysis,
+            content=content,
+            title=title,
+            url=url,
+            source_type="rss",
+        ),
+        # Evaluate priority
+        asyncio.to_thread(
+            content_evaluator.evaluate_content,
+            content=content,
+            title=title,
+            url=url,
+            context=context,
+        ),
     )
 
     assert summary_result is not None
     assert len(summary_result.alpha_insights) > 0
     assert any("rust" in entity.lower() for entity in summary_result.entities)
 
-    # Step 2: Evaluate priority
-    evaluation = evaluator.evaluate_content(
-        content=content,
-        title="Rust 2.0 Released with Memory Management Breakthrough",
-        url="https://example.com/rust-2",
-        context=context,
-    )
+    assert evaluation.priority == PriorityLevel.HIGH
+    assert evaluation.matched_interests == ["Systems programming"]
 
-    # Verify priority was assigned (don't assume HIGH since it depends on actual context)
-    assert evaluation.priority in [
-        PriorityLevel.HIGH,
-        PriorityLevel.MEDIUM,
-        PriorityLevel.LOW,
-    ]
-    # May or may not have matched interests depending on context
-    assert isinstance(evaluation.matched_interests, list)
+    # One call each, and the evaluator saw the user's context
+    assert len(mock_llm_responses) == 2
+    assert any("Systems programming" in call["prompt"] for call in mock_llm_responses)
 
     # Simulate what orchestrator would store
     analysis_json = {
@@ -1,7 +1,20 @@
-"""Integration tests for YouTubeFetcher with real YouTube API and yt-dlp."""
+"""Integration tests for YouTubeFetcher against a faked yt-dlp.
 
-import tempfile
+subprocess.run is replaced by mock_ytdlp, which answers discovery and
+subtitle commands from tests/fixtures/ytdlp_lexclips.json - a hand-written
+channel of five videos (ids lexclip0001-0005), not a recorded yt-dlp
+response. Only test_fetch_youtube_with_real_api runs the real binary
+(pass --run-live).
+"""
+
+import json
+import os
+import subprocess
+from collections.abc import Callable
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -53,16 +66,114 @@ backup_count = 10
 """
 
 
-def _make_config() -> Config:
-    """Load a minimal isolated Config from a temp TOML file."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        config_path = Path(tmpdir) / "config.toml"
-        config_path.write_text(_MINIMAL_TOML)
-        (Path(tmpdir) / "context.md").write_text("# context")
-        return Config.from_file(config_path)
+# Synthetic channel: ages relative to today, one video without subtitles
+YTDLP_FIXTURE = Path(__file__).parent.parent / "fixtures" / "ytdlp_lexclips.json"
+
+
+def _fake_ytdlp(
+    channel: dict[str, Any],
+) -> Callable[..., subprocess.CompletedProcess]:
+    """Build a subprocess.run stand-in that answers like yt-dlp for channel."""
+    videos = {video["id"]: video for video in channel["videos"]}
+
+    def discover(cmd: list[str]) -> subprocess.CompletedProcess:
+        if cmd[-1] != channel["channel_url"]:
+            return subprocess.CompletedProcess(
+                cmd,
+                1,
+                "",
+                f"ERROR: [youtube:tab] {cmd[-1]}: This channel does not exist",
+            )
+
+        limit = int(cmd[cmd.index("--playlist-end") + 1])
+        cutoff = None
+        if "--break-match-filters" in cmd:
+            cutoff = cmd[cmd.index("--break-match-filters") + 1].split(">=")[1]
+
+        lines = []
+        for video in channel["videos"][:limit]:
+            upload_date = (
+                datetime.now(UTC) - timedelta(days=video["age_days"])
+            ).strftime("%Y%m%d")
+            # --break-match-filters stops at the first video past the date
+            if cutoff and upload_date < cutoff:
+                return subprocess.CompletedProcess(cmd, 101, "\n".join(lines), "")
+            lines.append(
+                json.dumps(
+                    {
+                        "id": video["id"],
+                        "title": video["title"],
+                        "duration": video["duration"],
+                        "upload_date": upload_date,
+                        "view_count": video["view_count"],
+                        "webpage_url": f"https://www.youtube.com/watch?v={video['id']}",
+                    }
+                )
+            )
+        return subprocess.CompletedProcess(cmd, 0, "\n".join(lines), "")
+
+    def write_subtitles(cmd: list[str]) -> subprocess.CompletedProcess:
+        output_dir = Path(cmd[cmd.index("--output") + 1]).parent
+        for arg in cmd:
+            if "watch?v=" not in arg:
+                continue
+            video_id = arg.split("watch?v=")[1]
+            transcript = videos.get(video_id, {}).get("transcript")
+            if transcript:
+                (output_dir / f"{video_id}.en.vtt").write_text(
+                    f"WEBVTT\n\n00:00:00.000 --> 00:00:05.000\n{transcript}\n"
+                )
+        return subprocess.CompletedProcess(cmd, 0, "", "")
+
+    def run(cmd: list[str], **kwargs: Any) -> subprocess.CompletedProcess:
+        return discover(cmd) if "--simulate" in cmd else write_subtitles(cmd)
+
+    return run
+
+
+@pytest.fixture
+def mock_ytdlp(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> dict[str, Any]:
+    """Answer yt-dlp subprocess calls from the synthetic channel fixture.
+
+    A placeholder yt-dlp goes first on PATH so the fetcher's lookup succeeds
+    where the real binary isn't installed; subprocess.run never executes it.
+    """
+    channel = json.loads(YTDLP_FIXTURE.read_text())
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    (bin_dir / "yt-dlp").touch(mode=0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setattr(subprocess, "run", _fake_ytdlp(channel))
+    return channel
+
+
+@pytest.fixture(scope="module")
+def base_config(tmp_path_factory: pytest.TempPathFactory) -> Config:
+    """Load _MINIMAL_TOML once per module from an isolated config directory.
+
+    Shared across tests - use dataclasses.replace() to vary a field.
+    """
+    config_dir = tmp_path_factory.mktemp("ytcfg")
+    config_path = config_dir / "config.toml"
+    config_path.write_text(_MINIMAL_TOML)
+    (config_dir / "context.md").write_text("# context")
+    return Config.from_file(config_path)
+
+
+@pytest.fixture(scope="module")
+def youtube_fetcher(base_config: Config) -> YouTubeFetcher:
+    """One max_items=1 fetcher shared by tests that only vary the input URL.
+
+    Treat as read-only - tests needing another max_items or lookback build
+    their own fetcher so results don't depend on test order.
+    """
+    return YouTubeFetcher(max_items=1, config=base_config)
 
 
-def test_fetch_youtube_with_real_api() -> None:
+@pytest.mark.live
+@pytest.mark.network
+@pytest.mark.timeout(60)  # Real discovery plus transcript run
+def test_fetch_youtube_with_real_api(base_config: Config) -> None:
     """Test complete YouTube fetching workflow with real yt-dlp and YouTube API.
 
     This test:
@@ -71,8 +182,7 @@ def test_fetch_youtube_with_real_api() -> None:
     - Extracts real transcripts from videos
     - Returns proper ContentItem objects with all fields
     """
-    config = _make_config()
-    fetcher = YouTubeFetcher(max_items=1, config=config)
+    fetcher = YouTubeFetcher(max_items=1, config=base_config)
 
     # Use a stable YouTube channel for testing - @LexClips posts frequently
     source = {"url": "@LexClips", "id": "test-source-123"}
@@ -116,11 +226,10 @@ def test_fetch_youtube_with_real_api() -> None:
         assert len(external_ids) == len(set(external_ids))
 
 
-def test_fetch_youtube_handles_invalid_channel() -> None:
+def test_fetch_youtube_handles_invalid_channel(
+    youtube_fetcher: YouTubeFetcher, mock_ytdlp: dict[str, Any]
+) -> None:
     """Test fetcher handles invalid YouTube channel gracefully."""
-    config = Config()
-    fetcher = YouTubeFetcher(config=config)
-
     # Try to fetch from non-existent channel
     source = {
         "url": "@thisChannelDoesNotExist123456789",
@@ -128,46 +237,41 @@ def test_fetch_youtube_handles_invalid_channel() -> None:
     }
 
     # Should handle gracefully by returning empty list (not raising exception)
-    items = fetcher.fetch_content(source)
+    items = youtube_fetcher.fetch_content(source)
 
     # Should return empty list for non-existent channel
     assert isinstance(items, list)
     assert len(items) == 0
 
 
-def test_fetch_youtube_respects_max_items() -> None:
-    """Test fetcher respects max_items configuration."""
-    config = Config()
-    fetcher = YouTubeFetcher(max_items=1, config=config)
-
-    source = {"url": "@LexClips", "id": "test-id"}
-
-    items = fetcher.fetch_content(source)
-    assert len(items) <= 1
-
-
-def test_fetch_youtube_respects_date_range() -> None:
-    """Test fetcher only gets videos from configured date range."""
-    # Use very short date range to limit results
-    config = Config()
-    config.max_days_lookback = 1  # Only videos from yesterday
-
-    fetcher = YouTubeFetcher(max_items=10, config=config)
-
-    source = {"url": "@LexClips", "id": "test-id"}
-
-    items = fetcher.fetch_content(source)
-
-    # With only 1 day lookback, likely to get fewer results
-    # (this is more of a behavior verification than strict assertion)
-    assert isinstance(items, list)
-
-
-def test_fetch_youtube_handles_various_url_formats() -> None:
+@pytest.mark.parametrize(
+    ("max_items", "lookback"),
+    [(1, 30), (10, 1), (10, 10)],
+    ids=["max_items_binds", "lookback_binds", "lookback_partial"],
+)
+def test_fetch_youtube_respects_limits(
+    base_config: Config,
+    mock_ytdlp: dict[str, Any],
+    max_items: int,
+    lookback: int,
+) -> None:
+    """Test fetcher stops at max_items or the lookback window, whichever is first."""
+    config = replace(base_config, max_days_lookback=lookback)
+    fetcher = YouTubeFetcher(max_items=max_items, config=config)
+
+    items = fetcher.fetch_content({"url": "@LexClips", "id": "test-id"})
+
+    in_window = [v["id"] for v in mock_ytdlp["videos"] if v["age_days"] <= lookback]
+    fetched = [item.analysis["metrics"]["video_id"] for item in items]
+    assert fetched == in_window[:max_items]
+    cutoff = datetime.now(UTC) - timedelta(days=lookback + 1)
+    assert all(item.published_at > cutoff for item in items)
+
+
+def test_fetch_youtube_handles_various_url_formats(
+    youtube_fetcher: YouTubeFetcher, mock_ytdlp: dict[str, Any]
+) -> None:
     """Test that various YouTube channel URL formats work correctly."""
-    config = Config()
-    fetcher = YouTubeFetcher(max_items=1, config=config)
-
     # Test different URL formats that should all work
     url_formats = [
         "@LexClips",  # Handle format
@@ -175,94 +279,119 @@ def test_fetch_youtube_handles_various_url_formats() -> None:
         "https://www.youtube.com/@LexClips",  # Full URL
     ]
 
+    results = []
     for url in url_formats:
-        source = {"url": url, "id": "test-id"}
-
         try:
-            items = fetcher.fetch_content(source)
-            # Should not raise exception
-            assert isinstance(items, list)
+            results.append(youtube_fetcher.fetch_content({"url": url, "id": "test-id"}))
         except Exception as e:
             pytest.fail(f"Failed to fetch from URL format '{url}': {e}")
 
+    # Every format resolves to the same channel
+    for items in results:
+        assert [item.external_id for item in items] == [
+            item.external_id for item in results[0]
+        ]
+        assert len(items) == 1
+
 
-def test_extract_transcript_from_specific_video() -> None:
+def test_extract_transcript_from_specific_video(
+    youtube_fetcher: YouTubeFetcher, mock_ytdlp: dict[str, Any]
+) -> None:
     """Test transcript extraction from a specific video with known transcript."""
-    config = Config()
-    fetcher = YouTubeFetcher(config=config)
-
-    # Use a known video that should have transcripts
-    # This is a popular tech talk that typically has captions
-    video_url = (
-        "https://www.youtube.com/watch?v=dQw4w9WgXcQ"  # Rick Roll - has captions
-    )
-
-    try:
-        transcript = fetcher._extract_transcript(video_url)
-
-        if transcript:
-            # If transcript was extracted, verify it's reasonable
-            assert len(transcript) > 50  # Should have substantial content
-            assert isinstance(transcript, str)
-            # Should not contain VTT formatting
-            assert "WEBVTT" not in transcript
-            assert "-->" not in transcript
+    video = mock_ytdlp["videos"][0]
+    video_url = f"https://www.youtube.com/watch?v={video['id']}"
+
+    transcript = youtube_fetcher._extract_transcript(video_url)
+
+    assert transcript is not None
+    assert len(transcript) > 50  # Should have substantial content
+    # Should not contain VTT formatting
+    assert "WEBVTT" not in transcript
+    assert "-->" not in transcript
+
+
+def test_missing_transcript_falls_back_to_low_priority(
+    base_config: Config, mock_ytdlp: dict[str, Any]
+) -> None:
+    """Test videos without subtitles are kept as low priority placeholders."""
+    fetcher = YouTubeFetcher(max_items=5, config=base_config)
+
+    items = fetcher.fetch_content({"url": "@LexClips", "id": "test-id"})
+
+    no_transcript = {v["id"] for v in mock_ytdlp["videos"] if not v["transcript"]}
+    fetched = {item.analysis["metrics"]["video_id"] for item in items}
+    # The fallback must actually be exercised, not vacuously skipped
+    assert fetched & no_transcript, "expected a video without subtitles in range"
+    for item in items:
+        if item.analysis["metrics"]["video_id"] in no_transcript:
+            assert item.priority == "low"
+            assert item.notes == "No transcript available"
         else:
-            # It's OK if transcript not available - video might not have captions
-            # This tests that the method handles missing transcripts gracefully
-            pass
+            assert "No transcript available" not in item.content
 
-    except Exception as e:
-        # If extraction fails, it should be a reasonable error
-        assert "timed out" in str(e) or "not available" in str(e) or "failed" in str(e)
 
-
-def test_channel_url_normalization_integration() -> None:
+def test_channel_url_normalization_integration(
+    youtube_fetcher: YouTubeFetcher, mock_ytdlp: dict[str, Any]
+) -> None:
     """Test that URL normalization works in complete fetching workflow."""
-    config = Config()
-    fetcher = YouTubeFetcher(max_items=1, config=config)
-
     # Test that different URL formats for same channel work
     test_urls = ["@LexClips", "LexClips"]
 
     results = []
     for url in test_urls:
         try:
-            source = {"url": url, "id": f"test-{url}"}
-            items = fetcher.fetch_content(source)
+            items = youtube_fetcher.fetch_content({"url": url, "id": f"test-{url}"})
             results.append((url, len(items)))
         except Exception as e:
             results.append((url, f"Error: {e}"))
 
-    # Both formats should work (though may return different counts based on timing)
-    for _url, result in results:
-        if isinstance(result, int):
-            assert result >= 0  # Should not fail
-        else:
-            # If it failed, should be a reasonable error
-            assert "Error:" in str(result)
+    # Both formats reach the channel and honour max_items
+    assert results == [(url, 1) for url in test_urls]
 
 
-def test_youtube_fetcher_date_filtering() -> None:
+def test_youtube_fetcher_date_filtering(
+    base_config: Config, mock_ytdlp: dict[str, Any]
+) -> None:
     """Test that date filtering works correctly in video discovery."""
     # Create fetcher with very restrictive date range
-    config = Config()
-    config.max_days_lookback = 1  # Only videos from last day
-    fetcher_recent = YouTubeFetcher(max_items=1, config=config)
+    config = replace(base_config, max_days_lookback=1)  # Only videos from last day
+    fetcher_recent = YouTubeFetcher(max_items=10, config=config)
 
     # Create fetcher with longer date range
-    config_long = Config()
-    config_long.max_days_lookback = 30  # Videos from last 30 days
-    fetcher_long = YouTubeFetcher(max_items=1, config=config_long)
+    config_long = replace(base_config, max_days_lookback=30)  # Last 30 days
+    fetcher_long = YouTubeFetcher(max_items=10, config=config_long)
 
     source = {"url": "@LexClips", "id": "test-id"}
 
     items_recent = fetcher_recent.fetch_content(source)
     items_long = fetcher_long.fetch_content(source)
 
-    # Longer date range should typically return same or more items
-    assert len(items_recent) <= len(items_long)
+    # Longer date range returns the recent videos plus older ones
+    assert len(items_recent) < len(items_long)
+    assert {i.external_id for i in items_recent} <= {i.external_id for i in items_long}
+
+
+def test_transcripts_fetched_in_one_ytdlp_run(
+    base_config: Config,
+    mock_ytdlp: dict[str, Any],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    PERFORMANCE: yt-dlp start-up must not be paid once per video
+    THRESHOLD: Two invocations per channel - discovery plus one transcript run
+    """
+    commands: list[list[str]] = []
+    run = subprocess.run
+
+    def recording_run(cmd: list[str], **kwargs: Any) -> subprocess.CompletedProcess:
+        commands.append(cmd)
+        return run(cmd, **kwargs)
+
+    monkeypatch.setattr(subprocess, "run", recording_run)
+    fetcher = YouTubeFetcher(max_items=5, config=base_config)
+
+    items = fetcher.fetch_content({"url": "@LexClips", "id": "test-id"})
 
-    # Both should be valid lists
-    assert isinstance(items_recent, list)
-    assert isinstance(items_long, list)
+    assert len(items) > 1
+    assert len(commands) == 2
+    assert all(item.url in commands[1] for item in items)
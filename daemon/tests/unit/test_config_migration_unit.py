@@ -159,3 +159,30 @@ def test_missing_llm_light_service_key_raises_value_error() -> None:
 
         with pytest.raises(ValueError, match="migrate-config"):
             Config.from_file(config_path)
+
+
+def test_cached_config_parse_is_isolated_and_invalidated() -> None:
+    """
+    INVARIANT: from_file() never hands out shared state, and a rewritten
+    config.toml is picked up on the next call.
+    BREAKS: One caller's mutation leaks into the next, or migrate-config
+    output (atomic rename) is ignored until restart.
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_path = _write_config(
+            tmpdir,
+            _NEW_FORMAT_TOML.replace(
+                "[reddit]", 'deep_extract_exclude = ["youtube"]\n\n[reddit]'
+            ),
+        )
+        first = Config.from_file(config_path)
+        first.deep_extract_exclude.append("reddit")
+
+        assert Config.from_file(config_path).deep_extract_exclude == ["youtube"]
+
+        # Same path, replaced via rename like migrate-config does
+        tmp_path = config_path.with_suffix(".toml.tmp")
+        tmp_path.write_text(_NEW_FORMAT_TOML.replace("prismis-openai", "prismis-other"))
+        tmp_path.rename(config_path)
+
+        assert Config.from_file(config_path).llm_light_service == "prismis-other"
@@ -1,259 +1,238 @@
 """Unit tests for config loading logic."""
 
-import tempfile
 from pathlib import Path
-import pytest
 
-from config import Config
-from defaults import DEFAULT_CONTEXT_MD
+import pytest
 
+from prismis_daemon.config import Config
+from prismis_daemon.defaults import DEFAULT_CONTEXT_MD
 
-def test_config_loading_with_all_files_present() -> None:
-    """Test Config.from_file() with valid config.toml and context.md files."""
-    # Test TOML content
-    test_toml = """[daemon]
-fetch_interval = 45
-max_items_per_feed = 15
+# Complete config.toml - from_file() requires every section except [audio]
+CONFIG_TEMPLATE = """\
+[daemon]
+fetch_interval = {fetch_interval}
+max_items_rss = {max_items_rss}
+max_items_reddit = 50
+max_items_youtube = 10
+max_items_file = 5
+max_days_lookback = 30
 
 [llm]
-provider = "anthropic"
-model = "claude-3-haiku"
+light_service = "prismis-openai"
+
+[reddit]
+client_id = "test-id"
+client_secret = "test-secret"
+user_agent = "test"
+max_comments = 100
 
 [notifications]
 high_priority_only = false
+command = "echo"
+
+[api]
+key = "test-api-key"
+
+[archival]
+enabled = false
+
+[archival.windows]
+medium_unread = 14
+medium_read = 30
+low_unread = 7
+low_read = 30
 """
 
-    # Test context content
-    test_context = "# Custom Context\n\nCustom priorities defined here."
 
-    # Create temp directory structure
-    temp_dir = tempfile.mkdtemp()
+def _config_toml(fetch_interval: int = 30, max_items_rss: int = 25) -> str:
+    """Render CONFIG_TEMPLATE with selected [daemon] values."""
+    return CONFIG_TEMPLATE.format(
+        fetch_interval=fetch_interval, max_items_rss=max_items_rss
+    )
 
-    try:
-        config_path = Path(temp_dir) / "config.toml"
-        context_path = Path(temp_dir) / "context.md"
 
-        # Write test files
-        config_path.write_text(test_toml)
-        context_path.write_text(test_context)
+def test_config_loading_with_all_files_present(tmp_path: Path) -> None:
+    """Test Config.from_file() with valid config.toml and context.md files."""
+    # Test context content
+    test_context = "# Custom Context\n\nCustom priorities defined here."
+
+    config_path = tmp_path / "config.toml"
+    context_path = tmp_path / "context.md"
 
-        # Execute function
-        config = Config.from_file(config_path)
+    # Write test files
+    config_path.write_text(_config_toml(fetch_interval=45, max_items_rss=15))
+    context_path.write_text(test_context)
 
-        # Verify config sections loaded correctly
-        assert config.fetch_interval == 45
-        assert config.max_items == 15
-        assert config.llm_provider == "anthropic"
-        assert config.llm_model == "claude-3-haiku"
-        assert config.high_priority_only is False
+    # Execute function
+    config = Config.from_file(config_path)
 
-        # Verify context loaded
-        assert config.context == test_context
+    # Verify config sections loaded correctly
+    assert config.fetch_interval == 45
+    assert config.max_items_rss == 15
+    assert config.get_max_items("rss") == 15
+    assert config.llm_light_service == "prismis-openai"
+    assert config.high_priority_only is False
 
-    finally:
-        # Cleanup
-        import shutil
+    # Optional sections fall back to their defaults
+    assert config.archival_high_read is None
+    assert config.context_backup_count == 10
 
-        shutil.rmtree(temp_dir, ignore_errors=True)
+    # Verify context loaded
+    assert config.context == test_context
 
 
-def test_config_loading_with_missing_files_uses_defaults() -> None:
-    """Test Config.from_file() falls back to defaults when files don't exist."""
-    # Create temp directory without config files
-    temp_dir = tempfile.mkdtemp()
+def test_config_loading_with_missing_file_raises(tmp_path: Path) -> None:
+    """Test Config.from_file() refuses to start without a config file."""
+    config_path = tmp_path / "config.toml"
 
-    try:
-        config_path = Path(temp_dir) / "config.toml"
-        # Execute function (no config files exist)
-        config = Config.from_file(config_path)
+    with pytest.raises(FileNotFoundError, match="Config file not found"):
+        Config.from_file(config_path)
 
-        # Verify defaults are used
-        assert config.fetch_interval == 30  # From DEFAULT_CONFIG_TOML
-        assert config.max_items == 25  # Our new default
-        assert config.llm_provider == "openai"
-        assert config.llm_model == "gpt-4.1-mini"
 
-        # Verify default context is used
-        assert "High Priority Topics" in config.context
-        assert "AI/LLM breakthroughs" in config.context
+def test_config_loading_with_missing_context_uses_default(tmp_path: Path) -> None:
+    """Test Config.from_file() falls back to the default context.md."""
+    config_path = tmp_path / "config.toml"
+    config_path.write_text(_config_toml())
 
-    finally:
-        # Cleanup
-        import shutil
+    config = Config.from_file(config_path)
 
-        shutil.rmtree(temp_dir, ignore_errors=True)
+    assert config.context == DEFAULT_CONTEXT_MD
 
 
-def test_config_loading_with_malformed_toml_uses_defaults() -> None:
-    """Test Config.from_file() handles malformed TOML by falling back to defaults."""
+def test_config_loading_with_malformed_toml_raises(tmp_path: Path) -> None:
+    """Test Config.from_file() reports malformed TOML instead of guessing."""
     # Malformed TOML content
     malformed_toml = """[daemon
     fetch_interval = "not a number"
     [llm]
-    provider =
+    light_service =
     """
 
-    temp_dir = tempfile.mkdtemp()
-
-    try:
-        config_path = Path(temp_dir) / "config.toml"
-        context_path = Path(temp_dir) / "context.md"
+    config_path = tmp_path / "config.toml"
+    config_path.write_text(malformed_toml)
 
-        # Write malformed TOML
-        config_path.write_text(malformed_toml)
-        context_path.write_text("Valid context")
+    with pytest.raises(ValueError, match="Failed to parse config file"):
+        Config.from_file(config_path)
 
-        # Execute function
-        config = Config.from_file(config_path)
 
-        # Should fall back to defaults
-        assert config.fetch_interval == 30
-        assert config.llm_provider == "openai"
-
-        # Context should still load
-        assert config.context == "Valid context"
-
-    finally:
-        # Cleanup
-        import shutil
-
-        shutil.rmtree(temp_dir, ignore_errors=True)
-
-
-def test_config_loading_with_unreadable_context_uses_default() -> None:
+def test_config_loading_with_unreadable_context_uses_default(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """Test Config.from_file() handles context.md read errors by using default."""
-    valid_toml = """[daemon]
-fetch_interval = 60
-
-[llm]
-provider = "openai"
-"""
-
-    temp_dir = tempfile.mkdtemp()
-
-    try:
-        config_path = Path(temp_dir) / "config.toml"
-        context_path = Path(temp_dir) / "context.md"
-
-        # Write valid TOML
-        config_path.write_text(valid_toml)
-
-        # Create context file but make it unreadable (on Unix systems)
-        context_path.write_text("Some content")
-        import os
-
-        if os.name != "nt":  # Skip on Windows
-            context_path.chmod(0o000)  # Remove all permissions
-
-        # Execute function
-        config = Config.from_file(config_path)
-
-        # Config should load normally
-        assert config.fetch_interval == 60
-
-        # Should use default context due to read error (or if Windows, will read it)
-        if os.name != "nt":
-            from defaults import DEFAULT_CONTEXT_MD
-
-            assert config.context == DEFAULT_CONTEXT_MD
-            # Restore permissions for cleanup
-            context_path.chmod(0o644)
-
-    finally:
-        # Cleanup
-        import shutil
-
-        shutil.rmtree(temp_dir, ignore_errors=True)
-
-
-def test_config_structure_contains_all_expected_fields() -> None:
-    """Test Config always has all expected fields."""
-    # Create config with defaults
-    config = Config()
-
-    # Verify all expected fields present
-    assert hasattr(config, "fetch_interval")
-    assert hasattr(config, "max_items")
-    assert hasattr(config, "max_days_lookback")
-    assert hasattr(config, "llm_provider")
-    assert hasattr(config, "llm_model")
-    assert hasattr(config, "llm_api_key")
-    assert hasattr(config, "high_priority_only")
-    assert hasattr(config, "notification_command")
-    assert hasattr(config, "context")
-
-    # Verify types
-    assert isinstance(config.fetch_interval, int)
-    assert isinstance(config.max_items, int)
-    assert isinstance(config.llm_provider, str)
-    assert isinstance(config.context, str)
-
-
-def test_config_max_items_validation() -> None:
-    """Test Config.validate() correctly validates max_items range."""
-    # Test valid values at boundaries
-    config_min = Config(max_items=1)
-    config_min.validate()  # Should not raise
-
-    config_max = Config(max_items=100)
-    config_max.validate()  # Should not raise
-
-    config_normal = Config(max_items=25)
-    config_normal.validate()  # Should not raise
-
-    # Test invalid values
-    with pytest.raises(ValueError, match="max_items must be between 1 and 100, got 0"):
-        Config(max_items=0).validate()
-
-    with pytest.raises(
-        ValueError, match="max_items must be between 1 and 100, got 101"
-    ):
-        Config(max_items=101).validate()
-
-    with pytest.raises(ValueError, match="max_items must be between 1 and 100, got -5"):
-        Config(max_items=-5).validate()
-
-    with pytest.raises(
-        ValueError, match="max_items must be between 1 and 100, got 1000"
-    ):
-        Config(max_items=1000).validate()
-
-
-def test_config_fetch_interval_validation() -> None:
-    """Test Config.validate() correctly validates fetch_interval."""
-    # Test valid values
-    config_min = Config(fetch_interval=1)
-    config_min.validate()  # Should not raise
-
-    config_normal = Config(fetch_interval=30)
-    config_normal.validate()  # Should not raise
-
-    # Test invalid values
-    with pytest.raises(
-        ValueError, match="fetch_interval must be at least 1 minute, got 0"
-    ):
-        Config(fetch_interval=0).validate()
-
-    with pytest.raises(
-        ValueError, match="fetch_interval must be at least 1 minute, got -1"
-    ):
-        Config(fetch_interval=-1).validate()
-
-
-def test_config_default_values() -> None:
-    """Test Config dataclass has correct default values."""
-    config = Config()
-
-    # Verify daemon defaults
-    assert config.max_items == 25
-    assert config.fetch_interval == 30
-    assert config.max_days_lookback == 30
-
-    # Verify LLM defaults
-    assert config.llm_provider == "openai"
-    assert config.llm_model == "gpt-4.1-mini"
-    assert config.llm_api_key == "env:OPENAI_API_KEY"
-
-    # Verify notification defaults
-    assert config.high_priority_only is True
-    assert config.notification_command == "terminal-notifier"
+    config_path = tmp_path / "config.toml"
+    context_path = tmp_path / "context.md"
+
+    # Write valid TOML
+    config_path.write_text(_config_toml(fetch_interval=60))
+
+    # Create context file but make reading it fail - chmod(0o000) is
+    # unportable and ignored when running as root
+    context_path.write_text("Some content")
+    read_text = Path.read_text
+
+    def unreadable(self: Path, *args, **kwargs) -> str:
+        if self == context_path:
+            raise PermissionError(f"Permission denied: '{self}'")
+        return read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", unreadable)
+
+    # Execute function
+    config = Config.from_file(config_path)
+
+    # Config should load normally
+    assert config.fetch_interval == 60
+
+    # Should use default context due to read error
+    assert config.context == DEFAULT_CONTEXT_MD
+
+
+def _valid_config(**overrides) -> Config:
+    """Build a Config that passes validate(), with selected fields overridden."""
+    fields = {
+        "fetch_interval": 30,
+        "max_items_rss": 25,
+        "max_items_reddit": 50,
+        "max_items_youtube": 10,
+        "max_items_file": 5,
+        "max_days_lookback": 30,
+        "llm_light_service": "prismis-openai",
+        "reddit_client_id": "test-id",
+        "reddit_client_secret": "test-secret",
+        "reddit_user_agent": "test",
+        "reddit_max_comments": 100,
+        "high_priority_only": True,
+        "notification_command": "echo",
+        "api_key": "test-api-key",
+        "api_host": "127.0.0.1",
+        "context": "# Test Context",
+        "archival_enabled": False,
+        "archival_high_read": None,
+        "archival_medium_unread": 14,
+        "archival_medium_read": 30,
+        "archival_low_unread": 7,
+        "archival_low_read": 30,
+        "context_auto_update_enabled": False,
+        "context_auto_update_interval_days": 7,
+        "context_auto_update_min_votes": 5,
+        "context_backup_count": 3,
+    }
+    fields.update(overrides)
+    return Config(**fields)
+
+
+@pytest.mark.parametrize(
+    ("overrides", "match"),
+    [
+        ({"max_items_rss": 0}, "max_items_rss must be between 1 and 100, got 0"),
+        ({"max_items_rss": 101}, "max_items_rss must be between 1 and 100, got 101"),
+        (
+            {"max_items_reddit": -5},
+            "max_items_reddit must be between 1 and 100, got -5",
+        ),
+        (
+            {"max_items_youtube": 1000},
+            "max_items_youtube must be between 1 and 100, got 1000",
+        ),
+        ({"fetch_interval": 0}, "fetch_interval must be at least 1 minute, got 0"),
+        ({"fetch_interval": -1}, "fetch_interval must be at least 1 minute, got -1"),
+        ({"max_days_lookback": 0}, "max_days_lookback must be between 1 and 365"),
+        ({"max_days_lookback": -1}, "max_days_lookback must be between 1 and 365"),
+        ({"max_days_lookback": 366}, "max_days_lookback must be between 1 and 365"),
+    ],
+)
+def test_config_validate_rejects(overrides: dict, match: str) -> None:
+    """Test Config.validate() rejects out-of-range values with a clear message."""
+    with pytest.raises(ValueError, match=match):
+        _valid_config(**overrides).validate()
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"max_items_rss": 1},
+        {"max_items_rss": 100},
+        {"max_items_file": 25},
+        {"fetch_interval": 1},
+        {"fetch_interval": 30},
+        {"max_days_lookback": 1},
+        {"max_days_lookback": 365},
+    ],
+)
+def test_config_validate_accepts(overrides: dict) -> None:
+    """Test Config.validate() accepts boundary and typical values."""
+    _valid_config(**overrides).validate()  # Should not raise
+
+
+def test_config_optional_field_defaults() -> None:
+    """Test the optional Config fields default when omitted."""
+    config = _valid_config()
+
+    # Audio defaults
+    assert config.audio_provider == "system"
+    assert config.audio_voice is None
+
+    # Deep extraction is off unless a deep service is configured
+    assert config.llm_deep_service is None
+    assert config.auto_extract == "none"
+    assert config.deep_extract_exclude == []
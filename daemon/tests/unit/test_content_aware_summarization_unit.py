@@ -8,16 +8,22 @@ These tests protect the invariants identified during implementation:
 5. Word count never negative
 """
 
+import pytest
+
 from prismis_daemon.summarizer import ContentSummarizer
 
 
-def test_word_count_empty_content() -> None:
+@pytest.fixture(scope="module")
+def summarizer() -> ContentSummarizer:
+    """One summarizer for the module - the routing helpers hold no state."""
+    return ContentSummarizer({"model": "gpt-4o-mini"})
+
+
+def test_word_count_empty_content(summarizer: ContentSummarizer) -> None:
     """
     INVARIANT: Empty content returns 0 words, not crash.
     BREAKS: System crashes on failed content fetches if not handled.
     """
-    summarizer = ContentSummarizer({"model": "gpt-4o-mini"})
-
     # Empty string
     assert summarizer._calculate_word_count("") == 0
 
@@ -29,10 +35,8 @@ def test_word_count_empty_content() -> None:
     # (the actual summarize_with_analysis checks this before calling)
 
 
-def test_word_count_normal_content() -> None:
+def test_word_count_normal_content(summarizer: ContentSummarizer) -> None:
     """Verify word count calculation for normal content."""
-    summarizer = ContentSummarizer({"model": "gpt-4o-mini"})
-
     # Simple cases
     assert summarizer._calculate_word_count("hello") == 1
     assert summarizer._calculate_word_count("hello world") == 2
@@ -42,44 +46,35 @@ def test_word_count_normal_content() -> None:
     assert summarizer._calculate_word_count("  hello   world  ") == 2
 
 
-def test_routing_boundary_values_reddit() -> None:
-    """
-    INVARIANT: Boundaries route correctly (299 brief, 300 standard for reddit).
-    BREAKS: Wrong summary depth - wastes money or provides poor UX.
-    """
-    summarizer = ContentSummarizer({"model": "gpt-4o-mini"})
-
-    # Reddit < 300 words → brief
-    assert summarizer._get_mode_name(299, "reddit") == "brief"
-
-    # Reddit >= 300 words → standard
-    assert summarizer._get_mode_name(300, "reddit") == "standard"
-    assert summarizer._get_mode_name(301, "reddit") == "standard"
-
-
-def test_routing_boundary_values_youtube() -> None:
+@pytest.mark.parametrize(
+    ("word_count", "source_type", "expected"),
+    [
+        # Reddit < 300 words → brief, >= 300 → standard
+        (299, "reddit", "brief"),
+        (300, "reddit", "standard"),
+        (301, "reddit", "standard"),
+        # YouTube <= 5000 words → standard, > 5000 → detailed
+        (4999, "youtube", "standard"),
+        (5000, "youtube", "standard"),
+        (5001, "youtube", "detailed"),
+        (10000, "youtube", "detailed"),
+    ],
+)
+def test_routing_boundary_values(
+    summarizer: ContentSummarizer, word_count: int, source_type: str, expected: str
+) -> None:
     """
-    INVARIANT: Boundaries route correctly (5000 standard, 5001 detailed for youtube).
+    INVARIANT: Boundaries route correctly (299/300 for reddit, 5000/5001 for youtube).
     BREAKS: Wrong summary depth - wastes money or provides poor UX.
     """
-    summarizer = ContentSummarizer({"model": "gpt-4o-mini"})
-
-    # YouTube <= 5000 words → standard
-    assert summarizer._get_mode_name(5000, "youtube") == "standard"
-    assert summarizer._get_mode_name(4999, "youtube") == "standard"
-
-    # YouTube > 5000 words → detailed
-    assert summarizer._get_mode_name(5001, "youtube") == "detailed"
-    assert summarizer._get_mode_name(10000, "youtube") == "detailed"
+    assert summarizer._get_mode_name(word_count, source_type) == expected
 
 
-def test_default_to_standard_for_invalid_source() -> None:
+def test_default_to_standard_for_invalid_source(summarizer: ContentSummarizer) -> None:
     """
     INVARIANT: Invalid/missing source_type defaults to standard mode.
     BREAKS: Routing failures with unknown source types.
     """
-    summarizer = ContentSummarizer({"model": "gpt-4o-mini"})
-
     # Invalid source types → standard
     assert summarizer._get_mode_name(100, "rss") == "standard"
     assert summarizer._get_mode_name(100, "twitter") == "standard"
@@ -91,13 +86,11 @@ def test_default_to_standard_for_invalid_source() -> None:
     assert summarizer._get_mode_name(10000, "rss") == "standard"
 
 
-def test_extreme_word_counts_handled() -> None:
+def test_extreme_word_counts_handled(summarizer: ContentSummarizer) -> None:
     """
     FAILURE: Extreme word counts must not break routing.
     GRACEFUL: System handles 0 to very large word counts.
     """
-    summarizer = ContentSummarizer({"model": "gpt-4o-mini"})
-
     # Zero words
     assert summarizer._get_mode_name(0, "reddit") == "brief"
     assert summarizer._get_mode_name(0, "youtube") == "standard"
@@ -107,13 +100,11 @@ def test_extreme_word_counts_handled() -> None:
     assert summarizer._get_mode_name(100000, "reddit") == "standard"
 
 
-def test_standard_mode_preserved_from_baseline() -> None:
+def test_standard_mode_preserved_from_baseline(summarizer: ContentSummarizer) -> None:
     """
     INVARIANT: Standard mode is default and unchanged from baseline.
     BREAKS: Existing summarization behavior changes unexpectedly.
     """
-    summarizer = ContentSummarizer({"model": "gpt-4o-mini"})
-
     # Get all three prompts
     standard_prompt = summarizer._get_system_prompt()
     brief_prompt = summarizer._get_brief_system_prompt()
@@ -148,10 +139,8 @@ def test_standard_mode_preserved_from_baseline() -> None:
         assert "reading_summary" in prompt
 
 
-def test_select_system_prompt_routing() -> None:
+def test_select_system_prompt_routing(summarizer: ContentSummarizer) -> None:
     """Verify _select_system_prompt routes to correct prompt variant."""
-    summarizer = ContentSummarizer({"model": "gpt-4o-mini"})
-
     # Reddit < 300 → brief
     brief = summarizer._select_system_prompt(299, "reddit")
     assert "500-800 chars" in brief
@@ -1,34 +1,26 @@
 """Unit tests for ContentEvaluator logic functions."""
 
-from evaluator import ContentEvaluator, PriorityLevel
+import pytest
 
+from prismis_daemon.evaluator import ContentEvaluator, PriorityLevel
 
-def test_evaluator_initialization_with_config() -> None:
-    """Test ContentEvaluator initializes with provided config."""
-    config = {
-        "model": "gpt-4o",
-    }
-
-    evaluator = ContentEvaluator(config)
 
-    assert evaluator.model == "gpt-4o"
-    assert evaluator.config == config
+@pytest.fixture(scope="module")
+def evaluator() -> ContentEvaluator:
+    """Shared evaluator for the parsing and prompt tests, which never mutate it."""
+    return ContentEvaluator("prismis-openai")
 
 
-def test_evaluator_initialization_with_defaults() -> None:
-    """Test ContentEvaluator uses default model when minimal config provided."""
-    config = {"model": "gpt-4.1-mini"}
-    evaluator = ContentEvaluator(config)
+def test_evaluator_initialization_with_service() -> None:
+    """Test ContentEvaluator keeps the llm-core service it was given."""
+    evaluator = ContentEvaluator("prismis-anthropic")
 
-    assert evaluator.model == "gpt-4.1-mini"
-    assert evaluator.config == {"model": "gpt-4.1-mini"}
+    assert evaluator.service_name == "prismis-anthropic"
+    assert evaluator.temperature == 0.3
 
 
-def test_parse_evaluation_response_with_valid_data() -> None:
+def test_parse_evaluation_response_with_valid_data(evaluator: ContentEvaluator) -> None:
     """Test parsing valid JSON response into ContentEvaluation."""
-    config = {"model": "gpt-4.1-mini"}
-    evaluator = ContentEvaluator(config)
-
     response = {
         "priority": "high",
         "matched_interests": ["AI", "LLM", "GPT"],
@@ -42,13 +34,13 @@ def test_parse_evaluation_response_with_valid_data() -> None:
     assert result.reasoning == "Directly relates to AI breakthroughs"
 
 
-def test_parse_evaluation_response_normalizes_priority() -> None:
+def test_parse_evaluation_response_normalizes_priority(
+    evaluator: ContentEvaluator,
+) -> None:
     """Test parsing normalizes priority values to lowercase."""
-    evaluator = ContentEvaluator({"model": "gpt-4.1-mini"})
-
     response = {
         "priority": "MEDIUM",  # Uppercase
-        "matched_interests": [],
+        "matched_interests": ["Python"],
     }
 
     result = evaluator._parse_evaluation_response(response)
@@ -56,10 +48,10 @@ def test_parse_evaluation_response_normalizes_priority() -> None:
     assert result.priority == PriorityLevel.MEDIUM
 
 
-def test_parse_evaluation_response_handles_invalid_priority() -> None:
+def test_parse_evaluation_response_handles_invalid_priority(
+    evaluator: ContentEvaluator,
+) -> None:
     """Test parsing handles invalid priority with default."""
-    evaluator = ContentEvaluator({"model": "gpt-4.1-mini"})
-
     response = {
         "priority": "CRITICAL",  # Invalid value
         "matched_interests": ["test"],
@@ -71,10 +63,10 @@ def test_parse_evaluation_response_handles_invalid_priority() -> None:
     assert result.priority == PriorityLevel.MEDIUM
 
 
-def test_parse_evaluation_response_handles_missing_fields() -> None:
+def test_parse_evaluation_response_handles_missing_fields(
+    evaluator: ContentEvaluator,
+) -> None:
     """Test parsing handles missing optional fields."""
-    evaluator = ContentEvaluator({"model": "gpt-4.1-mini"})
-
     response = {
         "priority": "medium",
         # Missing matched_interests and reasoning
@@ -82,15 +74,16 @@ def test_parse_evaluation_response_handles_missing_fields() -> None:
 
     result = evaluator._parse_evaluation_response(response)
 
-    assert result.priority == PriorityLevel.MEDIUM
+    # No matched interests means the item stays unprioritized
+    assert result.priority is None
     assert result.matched_interests == []
     assert result.reasoning is None
 
 
-def test_parse_evaluation_response_validates_matched_interests() -> None:
+def test_parse_evaluation_response_validates_matched_interests(
+    evaluator: ContentEvaluator,
+) -> None:
     """Test parsing validates matched_interests is a list."""
-    evaluator = ContentEvaluator({"model": "gpt-4.1-mini"})
-
     # Test with non-list value
     response = {
         "priority": "high",
@@ -103,10 +96,10 @@ def test_parse_evaluation_response_validates_matched_interests() -> None:
     assert result.matched_interests == []
 
 
-def test_build_evaluation_prompt_includes_all_parts() -> None:
+def test_build_evaluation_prompt_includes_all_parts(
+    evaluator: ContentEvaluator,
+) -> None:
     """Test evaluation prompt includes content, context, and instructions."""
-    evaluator = ContentEvaluator({"model": "gpt-4.1-mini"})
-
     content = "This is AI content"
     title = "AI Article"
     url = "https://example.com"
@@ -127,10 +120,8 @@ def test_build_evaluation_prompt_includes_all_parts() -> None:
     assert "High Priority: AI breakthroughs" in user_prompt
 
 
-def test_system_prompt_has_priority_guidelines() -> None:
+def test_system_prompt_has_priority_guidelines(evaluator: ContentEvaluator) -> None:
     """Test system prompt includes priority evaluation guidelines."""
-    evaluator = ContentEvaluator({"model": "gpt-4.1-mini"})
-
     messages = evaluator._build_evaluation_prompt("", "", "", "")
     system_prompt = messages[0]["content"]
 
@@ -3,13 +3,19 @@
 import time
 from datetime import UTC, datetime
 
+import pytest
+
 from prismis_daemon.fetchers.rss import RSSFetcher
 
 
-def test_get_external_id_with_entry_id() -> None:
-    """Test external ID uses entry.id when available."""
-    fetcher = RSSFetcher()
+@pytest.fixture(scope="module")
+def fetcher() -> RSSFetcher:
+    """Shared fetcher - the helpers under test only read their arguments."""
+    return RSSFetcher()
 
+
+def test_get_external_id_with_entry_id(fetcher: RSSFetcher) -> None:
+    """Test external ID uses entry.id when available."""
     # Create entry dict with id field
     entry = {"id": "https://example.com/entry/123"}
 
@@ -18,10 +24,8 @@ def test_get_external_id_with_entry_id() -> None:
     assert external_id == "https://example.com/entry/123"
 
 
-def test_get_external_id_fallback_to_link_hash() -> None:
+def test_get_external_id_fallback_to_link_hash(fetcher: RSSFetcher) -> None:
     """Test external ID falls back to link hash when no id."""
-    fetcher = RSSFetcher()
-
     # Create entry dict with link but no id
     entry = {"link": "https://example.com/article"}
 
@@ -33,10 +37,8 @@ def test_get_external_id_fallback_to_link_hash() -> None:
     assert external_id == fetcher._get_external_id(entry)
 
 
-def test_get_external_id_fallback_to_title_hash() -> None:
+def test_get_external_id_fallback_to_title_hash(fetcher: RSSFetcher) -> None:
     """Test external ID falls back to title hash as last resort."""
-    fetcher = RSSFetcher()
-
     # Create entry dict with only title
     entry = {"title": "Test Article Title"}
 
@@ -48,10 +50,8 @@ def test_get_external_id_fallback_to_title_hash() -> None:
     assert external_id == fetcher._get_external_id(entry)
 
 
-def test_get_external_id_no_data_uses_timestamp() -> None:
+def test_get_external_id_no_data_uses_timestamp(fetcher: RSSFetcher) -> None:
     """Test external ID uses timestamp when no data available."""
-    fetcher = RSSFetcher()
-
     # Create empty entry
     entry = {}
 
@@ -68,9 +68,8 @@ def test_get_external_id_no_data_uses_timestamp() -> None:
     assert external_id != external_id2
 
 
-def test_parse_published_date_from_published_parsed() -> None:
+def test_parse_published_date_from_published_parsed(fetcher: RSSFetcher) -> None:
     """Test date parsing from published_parsed field."""
-    fetcher = RSSFetcher()
 
     # Create simple object with published_parsed attribute
     class Entry:
@@ -84,9 +83,8 @@ def test_parse_published_date_from_published_parsed() -> None:
     assert parsed_date == datetime(2024, 1, 15, 10, 30, 0, tzinfo=UTC)
 
 
-def test_parse_published_date_fallback_to_updated() -> None:
+def test_parse_published_date_fallback_to_updated(fetcher: RSSFetcher) -> None:
     """Test date parsing falls back to updated_parsed."""
-    fetcher = RSSFetcher()
 
     # Create simple object with only updated_parsed
     class Entry:
@@ -101,9 +99,8 @@ def test_parse_published_date_fallback_to_updated() -> None:
     assert parsed_date == datetime(2024, 1, 16, 14, 45, 0, tzinfo=UTC)
 
 
-def test_parse_published_date_returns_none_when_no_dates() -> None:
+def test_parse_published_date_returns_none_when_no_dates(fetcher: RSSFetcher) -> None:
     """Test date parsing returns None when no date fields."""
-    fetcher = RSSFetcher()
 
     # Create simple object with no date fields
     class Entry:
@@ -117,14 +114,13 @@ def test_parse_published_date_returns_none_when_no_dates() -> None:
     assert parsed_date is None
 
 
-def test_parse_published_date_handles_invalid_dates() -> None:
+def test_parse_published_date_handles_invalid_dates(fetcher: RSSFetcher) -> None:
     """Test date parsing handles invalid date structures gracefully."""
-    fetcher = RSSFetcher()
 
     # Create simple object with invalid date structure
     class Entry:
         def __init__(self):
-            # Invalid time struct (will cause mktime to fail)
+            # Invalid time struct (year/month/day 0 - datetime() rejects it)
             self.published_parsed = time.struct_time((0, 0, 0, 0, 0, 0, 0, 0, 0))
             self.updated_parsed = None
 
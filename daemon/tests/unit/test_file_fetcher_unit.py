@@ -1,12 +1,18 @@
 """Unit tests for FileFetcher pure functions."""
 
+import pytest
+
 from prismis_daemon.fetchers.file import FileFetcher
 
 
-def test_generate_external_id_consistent() -> None:
-    """Test external ID generation is consistent for same inputs."""
-    fetcher = FileFetcher()
+@pytest.fixture(scope="module")
+def fetcher() -> FileFetcher:
+    """Shared fetcher - the ID and diff helpers only read their arguments."""
+    return FileFetcher()
 
+
+def test_generate_external_id_consistent(fetcher: FileFetcher) -> None:
+    """Test external ID generation is consistent for same inputs."""
     url = "https://example.com/CHANGELOG.md"
     content_hash = "abc123def456"
 
@@ -18,10 +24,10 @@ def test_generate_external_id_consistent() -> None:
     assert len(id1) == 16  # Truncated SHA256
 
 
-def test_generate_external_id_unique_for_different_content() -> None:
+def test_generate_external_id_unique_for_different_content(
+    fetcher: FileFetcher,
+) -> None:
     """Test external ID changes when content hash changes."""
-    fetcher = FileFetcher()
-
     url = "https://example.com/CHANGELOG.md"
 
     # Different content hashes should produce different IDs
@@ -31,10 +37,8 @@ def test_generate_external_id_unique_for_different_content() -> None:
     assert id1 != id2
 
 
-def test_generate_external_id_unique_for_different_urls() -> None:
+def test_generate_external_id_unique_for_different_urls(fetcher: FileFetcher) -> None:
     """Test external ID changes when URL changes."""
-    fetcher = FileFetcher()
-
     content_hash = "same_content_hash"
 
     # Different URLs should produce different IDs
@@ -44,10 +48,8 @@ def test_generate_external_id_unique_for_different_urls() -> None:
     assert id1 != id2
 
 
-def test_generate_diff_basic() -> None:
+def test_generate_diff_basic(fetcher: FileFetcher) -> None:
     """Test unified diff generation for simple content changes."""
-    fetcher = FileFetcher()
-
     previous = "Line 1\nLine 2\nLine 3"
     current = "Line 1\nLine 2 modified\nLine 3"
     url = "https://example.com/test.md"
@@ -61,10 +63,8 @@ def test_generate_diff_basic() -> None:
     assert "+Line 2 modified" in diff
 
 
-def test_generate_diff_addition() -> None:
+def test_generate_diff_addition(fetcher: FileFetcher) -> None:
     """Test diff generation when lines are added."""
-    fetcher = FileFetcher()
-
     previous = "Line 1\nLine 2"
     current = "Line 1\nLine 2\nLine 3 is new"
     url = "https://example.com/test.md"
@@ -74,10 +74,8 @@ def test_generate_diff_addition() -> None:
     assert "+Line 3 is new" in diff
 
 
-def test_generate_diff_deletion() -> None:
+def test_generate_diff_deletion(fetcher: FileFetcher) -> None:
     """Test diff generation when lines are removed."""
-    fetcher = FileFetcher()
-
     previous = "Line 1\nLine 2\nLine 3"
     current = "Line 1\nLine 3"
     url = "https://example.com/test.md"
@@ -87,10 +85,21 @@ def test_generate_diff_deletion() -> None:
     assert "-Line 2" in diff
 
 
-def test_calculate_diff_stats_additions() -> None:
-    """Test diff stats calculation for added lines."""
-    fetcher = FileFetcher()
+def test_generate_diff_unchanged_content_is_empty(fetcher: FileFetcher) -> None:
+    """Test identical content short-circuits to an empty diff and zero stats."""
+    content = "Line 1\nLine 2\nLine 3"
+    url = "https://example.com/test.md"
+
+    assert fetcher._generate_diff(content, content, url) == ""
+    assert fetcher._calculate_diff_stats(content, content) == {
+        "added_lines": 0,
+        "removed_lines": 0,
+        "changed_lines": 0,
+    }
 
+
+def test_calculate_diff_stats_additions(fetcher: FileFetcher) -> None:
+    """Test diff stats calculation for added lines."""
     previous = "Line 1\nLine 2"
     current = "Line 1\nLine 2\nLine 3\nLine 4"
 
@@ -101,10 +110,8 @@ def test_calculate_diff_stats_additions() -> None:
     assert stats["changed_lines"] == 2
 
 
-def test_calculate_diff_stats_deletions() -> None:
+def test_calculate_diff_stats_deletions(fetcher: FileFetcher) -> None:
     """Test diff stats calculation for removed lines."""
-    fetcher = FileFetcher()
-
     previous = "Line 1\nLine 2\nLine 3\nLine 4"
     current = "Line 1\nLine 2"
 
@@ -115,10 +122,8 @@ def test_calculate_diff_stats_deletions() -> None:
     assert stats["changed_lines"] == 2
 
 
-def test_calculate_diff_stats_mixed_changes() -> None:
+def test_calculate_diff_stats_mixed_changes(fetcher: FileFetcher) -> None:
     """Test diff stats calculation for mixed additions and removals."""
-    fetcher = FileFetcher()
-
     previous = "Line 1\nLine 2\nLine 3"
     current = "Line 1\nLine 2 modified\nLine 4"
 
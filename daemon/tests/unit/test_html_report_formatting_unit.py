@@ -1,12 +1,46 @@
 """Unit tests for HTML report formatting invariants."""
 
 import html
+from collections import Counter
 from datetime import datetime, timezone
+from html.parser import HTMLParser
 
-from prismis_daemon.reports import ReportGenerator, DailyReport, ContentSummary
+import pytest
 
+from prismis_daemon.reports import ContentSummary, DailyReport, ReportGenerator
 
-def test_html_escaping_integrity() -> None:
+# Frozen clock shared by every fixture item - keeps the tests deterministic
+NOW = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+class MockStorage:
+    """Stand-in storage - formatting never touches the database."""
+
+
+class _TagCollector(HTMLParser):
+    """Record start/end tags in one pass so structure checks are lookups."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.starts: list[tuple[str, dict[str, str | None]]] = []
+        self.opened: Counter[str] = Counter()
+        self.closed: Counter[str] = Counter()
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self.starts.append((tag, dict(attrs)))
+        self.opened[tag] += 1
+
+    def handle_endtag(self, tag: str) -> None:
+        self.closed[tag] += 1
+
+
+@pytest.fixture(scope="module")
+def report_generator() -> ReportGenerator:
+    """One ReportGenerator shared by the formatting tests in this module."""
+    return ReportGenerator(MockStorage())
+
+
+def test_html_escaping_integrity(report_generator: ReportGenerator) -> None:
     """
     INVARIANT: All user-controlled content is HTML-escaped
     BREAKS: XSS attacks if malicious content is not escaped
@@ -23,23 +57,18 @@ def test_html_escaping_integrity() -> None:
         source_name=malicious_source,
         url=malicious_url,
         summary=malicious_summary,
-        published_at=datetime.now(timezone.utc),
+        published_at=NOW,
         priority="high",
         analysis={"matched_interests": ["evil", "malicious"]},
     )
 
     report = DailyReport(
-        generated_at=datetime.now(timezone.utc),
+        generated_at=NOW,
         period_hours=24,
         high_priority=[content_item],
     )
 
-    # Mock storage for ReportGenerator
-    class MockStorage:
-        pass
-
-    generator = ReportGenerator(MockStorage())
-    html_output = generator.format_as_html(report)
+    html_output = report_generator.format_as_html(report)
 
     # CRITICAL: No unescaped script tags should exist in output
     assert "<script>" not in html_output, (
@@ -60,7 +89,7 @@ def test_html_escaping_integrity() -> None:
     assert html.escape(malicious_url) in html_output
 
 
-def test_html_structure_validity() -> None:
+def test_html_structure_validity(report_generator: ReportGenerator) -> None:
     """
     INVARIANT: Generated HTML has valid structure
     BREAKS: Email clients fail to render if HTML is malformed
@@ -70,47 +99,47 @@ def test_html_structure_validity() -> None:
         source_name="Test Source",
         url="https://example.com",
         summary="A normal summary",
-        published_at=datetime.now(timezone.utc),
+        published_at=NOW,
         priority="high",
     )
 
     report = DailyReport(
-        generated_at=datetime.now(timezone.utc),
+        generated_at=NOW,
         period_hours=24,
         high_priority=[content_item],
         medium_priority=[],
         low_priority=[],
     )
 
-    class MockStorage:
-        pass
+    html_output = report_generator.format_as_html(report)
 
-    generator = ReportGenerator(MockStorage())
-    html_output = generator.format_as_html(report)
+    tags = _TagCollector()
+    tags.feed(html_output)
+    tags.close()
 
     # CRITICAL: HTML structure must be valid
     assert html_output.startswith("<!DOCTYPE html>"), "Missing DOCTYPE declaration"
-    assert '<html lang="en">' in html_output, "Missing html tag with lang attribute"
-    assert "<head>" in html_output and "</head>" in html_output, "Missing head section"
-    assert "<body>" in html_output and "</body>" in html_output, "Missing body section"
-    assert "</html>" in html_output, "Missing closing html tag"
+    assert ("html", {"lang": "en"}) in tags.starts, "Missing html tag with lang"
+    for tag in ("html", "head", "body"):
+        assert tags.opened[tag] == tags.closed[tag] == 1, f"Broken {tag} section"
 
     # Verify essential meta tags for email compatibility
-    assert '<meta charset="UTF-8">' in html_output, "Missing charset meta tag"
-    assert '<meta name="viewport"' in html_output, "Missing viewport meta tag"
+    meta_attrs = [attrs for tag, attrs in tags.starts if tag == "meta"]
+    assert {"charset": "UTF-8"} in meta_attrs, "Missing charset meta tag"
+    assert any(attrs.get("name") == "viewport" for attrs in meta_attrs), (
+        "Missing viewport meta tag"
+    )
 
     # Count opening vs closing tags for critical elements
-    div_open = html_output.count("<div")
-    div_close = html_output.count("</div>")
-    assert div_open == div_close, (
-        f"Unmatched div tags: {div_open} open, {div_close} close"
+    assert tags.opened["div"] == tags.closed["div"], (
+        f"Unmatched div tags: {tags.opened['div']} open, {tags.closed['div']} close"
     )
 
     # Verify no broken HTML entities
     assert "&lt;&gt;" not in html_output, "Double-encoded HTML entities found"
 
 
-def test_data_consistency_html_vs_markdown() -> None:
+def test_data_consistency_html_vs_markdown(report_generator: ReportGenerator) -> None:
     """
     INVARIANT: HTML and markdown formats contain same information
     BREAKS: Users see different data depending on format choice
@@ -121,7 +150,7 @@ def test_data_consistency_html_vs_markdown() -> None:
         source_name="Source A",
         url="https://a.com",
         summary="High priority summary",
-        published_at=datetime.now(timezone.utc),
+        published_at=NOW,
         priority="high",
     )
 
@@ -130,7 +159,7 @@ def test_data_consistency_html_vs_markdown() -> None:
         source_name="Source B",
         url="https://b.com",
         summary="Medium priority summary",
-        published_at=datetime.now(timezone.utc),
+        published_at=NOW,
         priority="medium",
     )
 
@@ -139,24 +168,20 @@ def test_data_consistency_html_vs_markdown() -> None:
         source_name="Source C",
         url="https://c.com",
         summary="Low priority summary",
-        published_at=datetime.now(timezone.utc),
+        published_at=NOW,
         priority="low",
     )
 
     report = DailyReport(
-        generated_at=datetime.now(timezone.utc),
+        generated_at=NOW,
         period_hours=24,
         high_priority=[high_item],
         medium_priority=[medium_item],
         low_priority=[low_item],
     )
 
-    class MockStorage:
-        pass
-
-    generator = ReportGenerator(MockStorage())
-    html_output = generator.format_as_html(report)
-    markdown_output = generator.format_as_markdown(report)
+    html_output = report_generator.format_as_html(report)
+    markdown_output = report_generator.format_as_markdown(report)
 
     # CRITICAL: Same content must appear in both formats
 
@@ -201,7 +226,7 @@ def test_top_3_ranking_with_corrupt_data() -> None:
         source_name="Source A",
         url="https://a.com",
         summary="Summary",
-        published_at=datetime.now(timezone.utc),
+        published_at=NOW,
         priority="high",
         analysis={"matched_interests": ["topic1", "topic2", "topic3"]},  # 3 matches
     )
@@ -211,7 +236,7 @@ def test_top_3_ranking_with_corrupt_data() -> None:
         source_name="Source B",
         url="https://b.com",
         summary="Summary",
-        published_at=datetime.now(timezone.utc),
+        published_at=NOW,
         priority="high",
         analysis=None,  # Corrupt: None instead of dict
     )
@@ -221,7 +246,7 @@ def test_top_3_ranking_with_corrupt_data() -> None:
         source_name="Source C",
         url="https://c.com",
         summary="Summary",
-        published_at=datetime.now(timezone.utc),
+        published_at=NOW,
         priority="high",
         analysis={"matched_interests": "not a list"},  # Corrupt: string instead of list
     )
@@ -231,7 +256,7 @@ def test_top_3_ranking_with_corrupt_data() -> None:
         source_name="Source D",
         url="https://d.com",
         summary="Summary",
-        published_at=datetime.now(timezone.utc),
+        published_at=NOW,
         priority="high",
         analysis={"other_field": "value"},  # Corrupt: missing matched_interests
     )
@@ -247,7 +272,7 @@ def test_top_3_ranking_with_corrupt_data() -> None:
     )
 
     report = DailyReport(
-        generated_at=datetime.now(timezone.utc),
+        generated_at=NOW,
         period_hours=24,
         high_priority=[
             item_good,
@@ -264,8 +289,9 @@ def test_top_3_ranking_with_corrupt_data() -> None:
     except Exception as e:
         assert False, f"Top 3 algorithm crashed with corrupt data: {e}"
 
-    # Verify it returns valid results
+    # Verify it returns valid results, computed once per report
     assert isinstance(top_3, list), "Top 3 must return a list"
+    assert report.top_3_must_reads is top_3, "Top 3 should be cached on the report"
     assert len(top_3) <= 3, "Top 3 must return at most 3 items"
     assert len(top_3) <= len(report.high_priority), (
         "Top 3 cannot exceed high priority count"
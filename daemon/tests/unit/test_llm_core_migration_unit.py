@@ -10,14 +10,10 @@ Covers:
 """
 
 import shutil
-import sys
 import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch  # claudex-guard: allow-mock
 
-# Add src to path for absolute imports (mirrors conftest.py pattern)
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
-
 from prismis_daemon.evaluator import ContentEvaluator
 from prismis_daemon.summarizer import ContentSummarizer
 
@@ -1,15 +1,11 @@
 """Unit tests for LLM startup validation logic — updated for dual-service (Task 1.1)."""
 
-import sys
-import tempfile
+from dataclasses import replace
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
-# Add src directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
-
 from prismis_daemon.__main__ import validate_llm_config
 from prismis_daemon.config import Config
 
@@ -18,8 +14,8 @@ _HEALTH_CHECK_MOCK = (
     "prismis_daemon.llm_validator.llm_core.health_check"  # claudex-guard: allow-mock
 )
 
-# Valid dual-service config TOML — uses light_service= (task 1.1 format)
-VALID_CONFIG_TOML = """\
+# Dual-service config TOML template — only the [llm] block varies per test
+CONFIG_TEMPLATE = """\
 [daemon]
 fetch_interval = 30
 max_items_rss = 25
@@ -29,7 +25,7 @@ max_items_file = 5
 max_days_lookback = 30
 
 [llm]
-light_service = "prismis-openai"
+{llm}
 
 [reddit]
 client_id = "env:REDDIT_CLIENT_ID"
@@ -61,261 +57,141 @@ auto_update_min_votes = 5
 backup_count = 3
 """
 
-# Dual-service config — both light and deep configured
-DUAL_SERVICE_CONFIG_TOML = """\
-[daemon]
-fetch_interval = 30
-max_items_rss = 25
-max_items_reddit = 50
-max_items_youtube = 10
-max_items_file = 5
-max_days_lookback = 30
-
-[llm]
-light_service = "prismis-openai"
-deep_service = "prismis-openai-deep"
-
-[reddit]
-client_id = "env:REDDIT_CLIENT_ID"
-client_secret = "env:REDDIT_CLIENT_SECRET"
-user_agent = "test"
-max_comments = 100
+# Valid config — light_service= only (task 1.1 format)
+VALID_CONFIG_TOML = CONFIG_TEMPLATE.format(llm='light_service = "prismis-openai"')
 
-[notifications]
-high_priority_only = true
-command = "echo"
+# Pre-1.1 config — provider/model/api_key instead of a service name
+OLD_FORMAT_CONFIG_TOML = CONFIG_TEMPLATE.format(
+    llm='provider = "openai"\nmodel = "gpt-4o-mini"\napi_key = "sk-test-key-1234567890"'
+)
 
-[api]
-key = "test-api-key"
 
-[archival]
-enabled = false
-
-[archival.windows]
-high_read = 30
-medium_unread = 14
-medium_read = 30
-low_unread = 7
-low_read = 30
-
-[context]
-auto_update_enabled = false
-auto_update_interval_days = 7
-auto_update_min_votes = 5
-backup_count = 3
-"""
+@pytest.fixture(scope="module")
+def config_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """One directory per module holding the shared context.md.
 
+    Config.from_file reads context.md from the config file's parent, so each
+    test writes its own <name>.toml next to the single context file.
+    """
+    config_dir = tmp_path_factory.mktemp("llmcfg")
+    (config_dir / "context.md").write_text("# Test Context\nHigh Priority: Testing")
+    return config_dir
 
-def _create_config_dir(config_toml: str = VALID_CONFIG_TOML) -> tuple:
-    """Create a temp config directory with config.toml and context.md.
 
-    Returns:
-        Tuple of (temp_dir, config_path)
-    """
-    temp_dir = tempfile.mkdtemp()
-    config_path = Path(temp_dir) / "config.toml"
+def _write_config(config_dir: Path, name: str, config_toml: str) -> Path:
+    """Write config_toml to config_dir/<name>.toml and return its path."""
+    config_path = config_dir / f"{name}.toml"
     config_path.write_text(config_toml)
+    return config_path
 
-    context_path = Path(temp_dir) / "context.md"
-    context_path.write_text("# Test Context\nHigh Priority: Testing")
 
-    return temp_dir, config_path
+@pytest.fixture(scope="module")
+def base_config(config_dir: Path) -> Config:
+    """Load VALID_CONFIG_TOML once per module - Config is frozen, safe to share."""
+    return Config.from_file(_write_config(config_dir, "valid", VALID_CONFIG_TOML))
 
 
-def test_INVARIANT_valid_service_config_passes_validation() -> None:
+@pytest.mark.parametrize(
+    ("side_effect", "expect_exit"),
+    [
+        (None, False),
+        (Exception("Connection refused"), True),
+    ],
+    ids=["health_check_ok", "health_check_fails"],
+)
+def test_INVARIANT_light_health_check_gates_daemon_start(
+    base_config: Config, side_effect: Exception | None, expect_exit: bool
+) -> None:
     """
-    INVARIANT: Valid light_service config MUST pass validation when health check succeeds.
-    BREAKS: Valid configs rejected, preventing daemon start.
+    INVARIANT: Valid light_service config MUST pass validation when the health
+    check succeeds, and a failed light health check MUST prevent daemon start.
+    BREAKS: Valid configs rejected, or daemon starts but fails during content
+    analysis, corrupting user experience.
     """
-    temp_dir, config_path = _create_config_dir()
-
-    try:
-        config = Config.from_file(config_path)
-
-        with patch(_HEALTH_CHECK_MOCK) as mock_health:
-            mock_health.return_value = None  # Success
-
-            # Should NOT raise exception for valid config
+    with patch(_HEALTH_CHECK_MOCK, side_effect=side_effect):
+        if expect_exit:
+            with pytest.raises(SystemExit):
+                validate_llm_config(base_config)
+        else:
             try:
-                validate_llm_config(config)
+                validate_llm_config(base_config)
             except SystemExit:
                 pytest.fail("Valid config should not cause SystemExit")
 
-    finally:
-        import shutil
 
-        shutil.rmtree(temp_dir, ignore_errors=True)
-
-
-def test_INVARIANT_health_check_failure_prevents_daemon_start() -> None:
-    """
-    INVARIANT: Failed light service health check MUST prevent daemon start.
-    BREAKS: Daemon starts but fails during content analysis, corrupting user experience.
-    """
-    temp_dir, config_path = _create_config_dir()
-
-    try:
-        config = Config.from_file(config_path)
-
-        with patch(_HEALTH_CHECK_MOCK) as mock_health:
-            mock_health.side_effect = Exception("Connection refused")
-
-            # Validation MUST prevent daemon start on light service failure
-            with pytest.raises(SystemExit):
-                validate_llm_config(config)
-
-    finally:
-        import shutil
-
-        shutil.rmtree(temp_dir, ignore_errors=True)
-
-
-def test_INVARIANT_old_config_format_rejected() -> None:
+def test_INVARIANT_old_config_format_rejected(config_dir: Path) -> None:
     """
     INVARIANT: Old config format with provider/model/api_key MUST be rejected.
     BREAKS: Old configs silently accepted, causing runtime errors.
     """
-    old_format_config = """\
-[daemon]
-fetch_interval = 30
-max_items_rss = 25
-max_items_reddit = 50
-max_items_youtube = 10
-max_items_file = 5
-max_days_lookback = 30
-
-[llm]
-provider = "openai"
-model = "gpt-4o-mini"
-api_key = "sk-test-key-1234567890"
-
-[reddit]
-client_id = "env:REDDIT_CLIENT_ID"
-client_secret = "env:REDDIT_CLIENT_SECRET"
-user_agent = "test"
-max_comments = 100
-
-[notifications]
-high_priority_only = true
-command = "echo"
-
-[api]
-key = "test-api-key"
-
-[archival]
-enabled = false
-
-[archival.windows]
-high_read = 30
-medium_unread = 14
-medium_read = 30
-low_unread = 7
-low_read = 30
-
-[context]
-auto_update_enabled = false
-auto_update_interval_days = 7
-auto_update_min_votes = 5
-backup_count = 3
-"""
-    temp_dir, config_path = _create_config_dir(old_format_config)
+    config_path = _write_config(config_dir, "old_format", OLD_FORMAT_CONFIG_TOML)
 
-    try:
-        # Config.from_file should raise ValueError for old format (no light_service)
-        with pytest.raises(ValueError, match="migrate-config"):
-            Config.from_file(config_path)
+    # Config.from_file should raise ValueError for old format (no light_service)
+    with pytest.raises(ValueError, match="migrate-config"):
+        Config.from_file(config_path)
 
-    finally:
-        import shutil
 
-        shutil.rmtree(temp_dir, ignore_errors=True)
-
-
-def test_INVARIANT_startup_validation_calls_health_check_with_light_service() -> None:
+def test_INVARIANT_startup_validation_calls_health_check_with_light_service(
+    base_config: Config,
+) -> None:
     """
     INVARIANT: Startup validation MUST call llm_core.health_check with the light service name.
     BREAKS: Health check called with wrong arguments, silently passing with incorrect config.
     """
-    temp_dir, config_path = _create_config_dir()
-
-    try:
-        config = Config.from_file(config_path)
-
-        with patch(_HEALTH_CHECK_MOCK) as mock_health:
-            mock_health.return_value = None
-
-            validate_llm_config(config)
-
-            # Light service health_check called with correct service name
-            mock_health.assert_any_call(service="prismis-openai")
+    with patch(_HEALTH_CHECK_MOCK) as mock_health:
+        mock_health.return_value = None
 
-    finally:
-        import shutil
+        validate_llm_config(base_config)
 
-        shutil.rmtree(temp_dir, ignore_errors=True)
+        # Light service health_check called with correct service name
+        mock_health.assert_any_call(service="prismis-openai")
 
 
-def test_INVARIANT_deep_service_failure_is_non_fatal() -> None:
+def test_INVARIANT_deep_service_failure_is_non_fatal(base_config: Config) -> None:
     """
     INVARIANT: Deep service health check failure MUST NOT cause sys.exit(1).
     BREAKS: Daemon cannot start when gpt-5-mini tier is unreachable — violates graceful degradation.
     """
-    temp_dir, config_path = _create_config_dir(DUAL_SERVICE_CONFIG_TOML)
-
-    try:
-        config = Config.from_file(config_path)
-
-        # Light succeeds, deep fails
-        call_count = [0]
-
-        def mock_health_check(service: str) -> None:
-            call_count[0] += 1
-            if service == "prismis-openai-deep":
-                raise Exception("Service unreachable")
-            # light service succeeds (returns None)
-
-        with patch(_HEALTH_CHECK_MOCK, side_effect=mock_health_check):
-            # Deep failure must NOT cause SystemExit
-            try:
-                validate_llm_config(config)
-            except SystemExit:
-                pytest.fail(
-                    "Deep service failure must not cause SystemExit — violates graceful degradation"
-                )
-
-        assert call_count[0] == 2, "Both light and deep health checks must be called"
-
-    finally:
-        import shutil
+    # Only validate_llm_config is under test here - loading deep_service from
+    # TOML is covered by test_dual_service_config_unit.py
+    config = replace(base_config, llm_deep_service="prismis-openai-deep")
+
+    # Light succeeds, deep fails
+    call_count = [0]
+
+    def mock_health_check(service: str) -> None:
+        call_count[0] += 1
+        if service == "prismis-openai-deep":
+            raise Exception("Service unreachable")
+        # light service succeeds (returns None)
+
+    with patch(_HEALTH_CHECK_MOCK, side_effect=mock_health_check):
+        # Deep failure must NOT cause SystemExit
+        try:
+            validate_llm_config(config)
+        except SystemExit:
+            pytest.fail(
+                "Deep service failure must not cause SystemExit — violates graceful degradation"
+            )
 
-        shutil.rmtree(temp_dir, ignore_errors=True)
+    assert call_count[0] == 2, "Both light and deep health checks must be called"
 
 
-def test_INVARIANT_deep_service_not_configured_skipped() -> None:
+def test_INVARIANT_deep_service_not_configured_skipped(base_config: Config) -> None:
     """
     INVARIANT: When deep_service is None (not configured), only light is checked.
     BREAKS: Validator attempts health check on None service, crashes at startup.
     """
-    temp_dir, config_path = _create_config_dir(VALID_CONFIG_TOML)
-
-    try:
-        config = Config.from_file(config_path)
-
-        assert config.llm_deep_service is None, "deep_service must default to None"
+    assert base_config.llm_deep_service is None, "deep_service must default to None"
 
-        call_count = [0]
-
-        def mock_health_check(service: str) -> None:
-            call_count[0] += 1
-
-        with patch(_HEALTH_CHECK_MOCK, side_effect=mock_health_check):
-            validate_llm_config(config)
+    call_count = [0]
 
-        assert call_count[0] == 1, (
-            "Only light service health check must fire when deep_service is None"
-        )
+    def mock_health_check(service: str) -> None:
+        call_count[0] += 1
 
-    finally:
-        import shutil
+    with patch(_HEALTH_CHECK_MOCK, side_effect=mock_health_check):
+        validate_llm_config(base_config)
 
-        shutil.rmtree(temp_dir, ignore_errors=True)
+    assert call_count[0] == 1, (
+        "Only light service health check must fire when deep_service is None"
+    )
@@ -1,6 +1,8 @@
 """Unit tests for Notifier logic functions."""
 
-from notifier import Notifier
+from unittest.mock import MagicMock
+
+from prismis_daemon.notifier import Notifier
 
 
 def test_notify_filters_high_priority_only() -> None:
@@ -15,17 +17,14 @@ def test_notify_filters_high_priority_only() -> None:
         {"priority": "high", "title": "Security Alert"},
     ]
 
-    # Mock the _send_notification method to capture what gets called
-    called_items = []
-
-    def mock_send_notification(items):
-        called_items.extend(items)
-
-    notifier._send_notification = mock_send_notification
+    # Replace _send_notification to capture what gets sent
+    notifier._send_notification = MagicMock()
 
     notifier.notify_new_content(items)
 
-    # Should only have called with HIGH priority items
+    # Should only have called once, with the HIGH priority items
+    notifier._send_notification.assert_called_once()
+    called_items = notifier._send_notification.call_args.args[0]
     assert len(called_items) == 2
     assert all(item["priority"] == "high" for item in called_items)
     assert called_items[0]["title"] == "Important AI News"
@@ -35,17 +34,12 @@ def test_notify_filters_high_priority_only() -> None:
 def test_notify_handles_empty_list() -> None:
     """Test notify_new_content handles empty items list gracefully."""
     notifier = Notifier()
-
-    # Mock to ensure _send_notification is never called
-    def mock_send_notification(items):
-        setattr(notifier, "_send_called", True)
-
-    notifier._send_notification = mock_send_notification
+    notifier._send_notification = MagicMock()
 
     notifier.notify_new_content([])
 
     # Should not have called _send_notification
-    assert not hasattr(notifier, "_send_called")
+    notifier._send_notification.assert_not_called()
 
 
 def test_notify_handles_no_high_priority_items() -> None:
@@ -58,16 +52,12 @@ def test_notify_handles_no_high_priority_items() -> None:
         {"priority": "low", "title": "Basic Tutorial"},
     ]
 
-    # Mock to ensure _send_notification is never called
-    def mock_send_notification(items):
-        setattr(notifier, "_send_called", True)
-
-    notifier._send_notification = mock_send_notification
+    notifier._send_notification = MagicMock()
 
     notifier.notify_new_content(items)
 
     # Should not have called _send_notification
-    assert not hasattr(notifier, "_send_called")
+    notifier._send_notification.assert_not_called()
 
 
 def test_message_formatting_single_item() -> None:
@@ -1,23 +1,25 @@
 """Unit tests for RedditFetcher logic functions."""
 
-from datetime import datetime
-from unittest.mock import Mock
+import pytest
 
-from fetchers.reddit import RedditFetcher
-from models import ContentItem
+from prismis_daemon.fetchers.reddit import RedditFetcher
+from prismis_daemon.models import ContentItem
 from tests.fixtures.reddit_mocks import (
-    create_self_post_mock,
-    create_link_post_mock,
     create_deleted_post_mock,
-    create_image_post_mock,
+    create_link_post_mock,
+    create_self_post_mock,
     create_submission_with_missing_fields,
 )
 
 
-def test_parse_subreddit_name_full_url() -> None:
-    """Test subreddit parsing from full Reddit URLs."""
-    fetcher = RedditFetcher()
+@pytest.fixture(scope="module")
+def fetcher() -> RedditFetcher:
+    """Shared fetcher - the helpers under test only read their arguments."""
+    return RedditFetcher()
 
+
+def test_parse_subreddit_name_full_url(fetcher: RedditFetcher) -> None:
+    """Test subreddit parsing from full Reddit URLs."""
     # Test various full URL formats
     url = "https://reddit.com/r/python"
     subreddit = fetcher._parse_subreddit_name(url)
@@ -32,10 +34,8 @@ def test_parse_subreddit_name_full_url() -> None:
     assert subreddit == "programming"
 
 
-def test_parse_subreddit_name_short_formats() -> None:
+def test_parse_subreddit_name_short_formats(fetcher: RedditFetcher) -> None:
     """Test subreddit parsing from short formats."""
-    fetcher = RedditFetcher()
-
     # Test r/subreddit format
     url = "r/python"
     subreddit = fetcher._parse_subreddit_name(url)
@@ -52,10 +52,8 @@ def test_parse_subreddit_name_short_formats() -> None:
     assert subreddit == "test_sub123"
 
 
-def test_parse_subreddit_name_invalid_formats() -> None:
+def test_parse_subreddit_name_invalid_formats(fetcher: RedditFetcher) -> None:
     """Test subreddit parsing handles invalid formats."""
-    fetcher = RedditFetcher()
-
     # Test empty string
     subreddit = fetcher._parse_subreddit_name("")
     assert subreddit == ""
@@ -69,101 +67,62 @@ def test_parse_subreddit_name_invalid_formats() -> None:
     assert subreddit == ""
 
 
-def test_is_image_post_self_posts() -> None:
+def test_is_image_post_self_posts(fetcher: RedditFetcher) -> None:
     """Test image detection correctly identifies self posts as text."""
-    fetcher = RedditFetcher()
-
-    # Mock self post
-    submission = Mock()
-    submission.is_self = True
-    submission.url = "https://reddit.com/r/python/comments/123/title"
+    submission = create_self_post_mock(
+        url="https://reddit.com/r/python/comments/123/title"
+    )
 
     result = fetcher._is_image_post(submission)
     assert result is False
 
 
-def test_is_image_post_image_domains() -> None:
-    """Test image detection identifies common image hosting domains."""
-    fetcher = RedditFetcher()
-
-    # Mock submission with image domains
-    submission = Mock()
-    submission.is_self = False
-
-    image_urls = [
-        "https://i.redd.it/abc123.jpg",
-        "https://i.imgur.com/def456.png",
-        "https://imgur.com/ghi789",
-        "https://gfycat.com/example",
-        "https://v.redd.it/video123",
-        "https://youtube.com/watch?v=abc",
-        "https://youtu.be/def123",
-        "https://streamable.com/example",
-    ]
-
-    for url in image_urls:
-        submission.url = url
-        result = fetcher._is_image_post(submission)
-        assert result is True, f"Should detect {url} as image/video"
-
-
-def test_is_image_post_file_extensions() -> None:
-    """Test image detection identifies image file extensions."""
-    fetcher = RedditFetcher()
-
-    submission = Mock()
-    submission.is_self = False
-
-    image_extensions = [
-        "https://example.com/image.jpg",
-        "https://example.com/image.jpeg",
-        "https://example.com/image.png",
-        "https://example.com/image.gif",
-        "https://example.com/image.webp",
-        "https://example.com/video.mp4",
-        "https://example.com/video.webm",
-    ]
-
-    for url in image_extensions:
-        submission.url = url
-        result = fetcher._is_image_post(submission)
-        assert result is True, f"Should detect {url} as image/video"
-
-
-def test_is_image_post_text_links() -> None:
-    """Test image detection correctly identifies text/article links."""
-    fetcher = RedditFetcher()
-
-    submission = Mock()
-    submission.is_self = False
-
-    text_urls = [
-        "https://github.com/python/cpython",
-        "https://docs.python.org/3/tutorial/",
-        "https://news.ycombinator.com/item?id=123",
-        "https://medium.com/article-title",
-        "https://stackoverflow.com/questions/123",
-    ]
-
-    for url in text_urls:
-        submission.url = url
-        result = fetcher._is_image_post(submission)
-        assert result is False, f"Should not detect {url} as image/video"
-
-
-def test_extract_metrics_all_fields_present() -> None:
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        # Image/video hosting domains
+        ("https://i.redd.it/abc123.jpg", True),
+        ("https://i.imgur.com/def456.png", True),
+        ("https://imgur.com/ghi789", True),
+        ("https://gfycat.com/example", True),
+        ("https://v.redd.it/video123", True),
+        ("https://youtube.com/watch?v=abc", True),
+        ("https://youtu.be/def123", True),
+        ("https://streamable.com/example", True),
+        # Image/video file extensions
+        ("https://example.com/image.jpg", True),
+        ("https://example.com/image.jpeg", True),
+        ("https://example.com/image.png", True),
+        ("https://example.com/image.gif", True),
+        ("https://example.com/image.webp", True),
+        ("https://example.com/video.mp4", True),
+        ("https://example.com/video.webm", True),
+        # Text/article links
+        ("https://github.com/python/cpython", False),
+        ("https://docs.python.org/3/tutorial/", False),
+        ("https://news.ycombinator.com/item?id=123", False),
+        ("https://medium.com/article-title", False),
+        ("https://stackoverflow.com/questions/123", False),
+    ],
+)
+def test_is_image_post_link_urls(
+    fetcher: RedditFetcher, url: str, expected: bool
+) -> None:
+    """Test image detection by hosting domain and file extension on link posts."""
+    submission = create_link_post_mock(url=url)
+
+    assert fetcher._is_image_post(submission) is expected
+
+
+def test_extract_metrics_all_fields_present(fetcher: RedditFetcher) -> None:
     """Test metrics extraction with all fields available."""
-    fetcher = RedditFetcher()
-
-    # Mock submission with all fields
-    submission = Mock()
-    submission.score = 42
-    submission.upvote_ratio = 0.85
-    submission.num_comments = 15
-    submission.subreddit = Mock()
-    submission.subreddit.__str__ = lambda self: "python"
-    submission.author = Mock()
-    submission.author.__str__ = lambda self: "test_user"
+    submission = create_self_post_mock(
+        score=42,
+        upvote_ratio=0.85,
+        num_comments=15,
+        subreddit="python",
+        author="test_user",
+    )
 
     metrics = fetcher._extract_metrics(submission)
 
@@ -174,17 +133,10 @@ def test_extract_metrics_all_fields_present() -> None:
     assert metrics["author"] == "test_user"
 
 
-def test_extract_metrics_missing_fields() -> None:
+def test_extract_metrics_missing_fields(fetcher: RedditFetcher) -> None:
     """Test metrics extraction handles missing fields gracefully."""
-    fetcher = RedditFetcher()
-
-    # Mock submission with missing fields
-    submission = Mock()
-    # Remove attributes to simulate missing fields
-    del submission.score
-    del submission.upvote_ratio
-    del submission.num_comments
-    submission.author = None
+    # No score/upvote_ratio/num_comments attributes, deleted author
+    submission = create_submission_with_missing_fields(author=None)
 
     metrics = fetcher._extract_metrics(submission)
 
@@ -194,27 +146,22 @@ def test_extract_metrics_missing_fields() -> None:
     assert metrics["author"] == "[deleted]"
 
 
-def test_to_content_item_self_post() -> None:
+def test_to_content_item_self_post(fetcher: RedditFetcher) -> None:
     """Test ContentItem conversion for self posts with text."""
-    fetcher = RedditFetcher()
-
-    # Mock self post submission
-    submission = Mock()
-    submission.permalink = "/r/python/comments/123/test_title/"
-    submission.title = "How to learn Python?"
-    submission.is_self = True
-    submission.selftext = (
-        "I'm new to programming and want to learn Python. Any recommendations?"
+    submission = create_self_post_mock(
+        permalink="/r/python/comments/123/test_title/",
+        title="How to learn Python?",
+        selftext=(
+            "I'm new to programming and want to learn Python. Any recommendations?"
+        ),
+        url="https://reddit.com/r/python/comments/123/test_title/",
+        created_utc=1640995200,  # Jan 1, 2022
+        score=25,
+        upvote_ratio=0.9,
+        num_comments=5,
+        subreddit="python",
+        author="learner123",
     )
-    submission.url = "https://reddit.com/r/python/comments/123/test_title/"
-    submission.created_utc = 1640995200  # Jan 1, 2022
-    submission.score = 25
-    submission.upvote_ratio = 0.9
-    submission.num_comments = 5
-    submission.subreddit = Mock()
-    submission.subreddit.__str__ = lambda self: "python"
-    submission.author = Mock()
-    submission.author.__str__ = lambda self: "learner123"
 
     item = fetcher._to_content_item(submission, "test-source-id")
 
@@ -233,25 +180,19 @@ def test_to_content_item_self_post() -> None:
     assert item.analysis["metrics"]["score"] == 25
 
 
-def test_to_content_item_link_post() -> None:
+def test_to_content_item_link_post(fetcher: RedditFetcher) -> None:
     """Test ContentItem conversion for link posts."""
-    fetcher = RedditFetcher()
-
-    # Mock link post submission
-    submission = Mock()
-    submission.permalink = "/r/programming/comments/456/cool_article/"
-    submission.title = "Cool Programming Article"
-    submission.is_self = False
-    submission.url = "https://example.com/programming-article"
-    submission.selftext = ""
-    submission.created_utc = 1640995200
-    submission.score = 100
-    submission.upvote_ratio = 0.95
-    submission.num_comments = 20
-    submission.subreddit = Mock()
-    submission.subreddit.__str__ = lambda self: "programming"
-    submission.author = Mock()
-    submission.author.__str__ = lambda self: "developer456"
+    submission = create_link_post_mock(
+        permalink="/r/programming/comments/456/cool_article/",
+        title="Cool Programming Article",
+        url="https://example.com/programming-article",
+        created_utc=1640995200,
+        score=100,
+        upvote_ratio=0.95,
+        num_comments=20,
+        subreddit="programming",
+        author="developer456",
+    )
 
     item = fetcher._to_content_item(submission, "test-source-id")
 
@@ -261,24 +202,15 @@ def test_to_content_item_link_post() -> None:
     assert item.analysis["metrics"]["score"] == 100
 
 
-def test_to_content_item_deleted_content() -> None:
+def test_to_content_item_deleted_content(fetcher: RedditFetcher) -> None:
     """Test ContentItem conversion handles deleted/removed content."""
-    fetcher = RedditFetcher()
-
-    # Mock submission with deleted content
-    submission = Mock()
-    submission.permalink = "/r/test/comments/789/deleted/"
-    submission.title = "Deleted Post"
-    submission.is_self = True
-    submission.selftext = "[deleted]"
-    submission.url = "https://example.com/external-link"
-    submission.created_utc = 1640995200
-    submission.score = 0
-    submission.upvote_ratio = 0.5
-    submission.num_comments = 0
-    submission.subreddit = Mock()
-    submission.subreddit.__str__ = lambda self: "test"
-    submission.author = None
+    submission = create_deleted_post_mock(
+        permalink="/r/test/comments/789/deleted/",
+        title="Deleted Post",
+        url="https://example.com/external-link",
+        created_utc=1640995200,
+        subreddit="test",
+    )
 
     item = fetcher._to_content_item(submission, "test-source-id")
 
@@ -286,26 +218,21 @@ def test_to_content_item_deleted_content() -> None:
     assert item.analysis["metrics"]["author"] == "[deleted]"
 
 
-def test_to_content_item_date_parsing_error() -> None:
+def test_to_content_item_date_parsing_error(fetcher: RedditFetcher) -> None:
     """Test ContentItem conversion handles date parsing errors gracefully."""
-    fetcher = RedditFetcher()
-
-    # Mock submission with invalid timestamp
-    submission = Mock()
-    submission.permalink = "/r/test/comments/999/no_date/"
-    submission.title = "Post Without Date"
-    submission.is_self = True
-    submission.selftext = "Content here"
-    submission.url = "https://reddit.com/r/test/comments/999/no_date/"
-    # Invalid timestamp that will cause datetime.fromtimestamp to fail
-    submission.created_utc = "invalid"
-    submission.score = 1
-    submission.upvote_ratio = 0.6
-    submission.num_comments = 1
-    submission.subreddit = Mock()
-    submission.subreddit.__str__ = lambda self: "test"
-    submission.author = Mock()
-    submission.author.__str__ = lambda self: "user123"
+    submission = create_self_post_mock(
+        permalink="/r/test/comments/999/no_date/",
+        title="Post Without Date",
+        selftext="Content here",
+        url="https://reddit.com/r/test/comments/999/no_date/",
+        # Invalid timestamp that will cause datetime.fromtimestamp to fail
+        created_utc="invalid",
+        score=1,
+        upvote_ratio=0.6,
+        num_comments=1,
+        subreddit="test",
+        author="user123",
+    )
 
     item = fetcher._to_content_item(submission, "test-source-id")
 
@@ -1,22 +1,11 @@
 """Unit tests for Storage class deduplication methods."""
 
-import tempfile
-from pathlib import Path
-import pytest
-from database import init_db
-from storage import Storage
-from models import ContentItem
+from prismis_daemon.models import ContentItem
+from prismis_daemon.storage import Storage
 
 
-def test_create_or_update_content_returns_correct_tuple_types() -> None:
+def test_create_or_update_content_returns_correct_tuple_types(storage: Storage) -> None:
     """Test that create_or_update_content returns (str, bool) tuple."""
-    # Create temporary test database
-    temp_dir = tempfile.mkdtemp()
-    db_path = Path(temp_dir) / "test.db"
-    init_db(db_path)
-
-    storage = Storage(db_path)
-
     # Add a source first
     source_id = storage.add_source("https://example.com/feed", "rss", "Test")
 
@@ -53,21 +42,32 @@ def test_create_or_update_content_returns_correct_tuple_types() -> None:
     assert content_id2 == content_id  # Same UUID
     assert is_new2 is False  # Existing content
 
-    # Cleanup
-    import shutil
-
-    shutil.rmtree(temp_dir, ignore_errors=True)
-
 
-def test_get_existing_external_ids_returns_set() -> None:
+def test_create_or_update_same_item_twice_reports_update(storage: Storage) -> None:
+    """Test re-upserting the same ContentItem object is reported as an update."""
+    source_id = storage.add_source("https://example.com/feed", "rss", "Test")
+    item = ContentItem(
+        source_id=source_id,
+        external_id="same-object",
+        title="Test Article",
+        url="https://example.com/article",
+        content="Test content",
+    )
+
+    content_id, is_new = storage.create_or_update_content(item)
+    assert is_new is True
+    assert content_id == item.id
+
+    # Same object, same id - the second call must still see the existing row
+    item.summary = "Updated summary"
+    content_id2, is_new2 = storage.create_or_update_content(item)
+    assert content_id2 == content_id
+    assert is_new2 is False
+    assert storage.get_content_by_id(content_id)["summary"] == "Updated summary"
+
+
+def test_get_existing_external_ids_returns_set(storage: Storage) -> None:
     """Test that get_existing_external_ids returns a set for O(1) lookup."""
-    # Create temporary test database
-    temp_dir = tempfile.mkdtemp()
-    db_path = Path(temp_dir) / "test.db"
-    init_db(db_path)
-
-    storage = Storage(db_path)
-
     # Add a source
     source_id = storage.add_source("https://example.com/feed", "rss", "Test")
 
@@ -92,8 +92,10 @@ def test_get_existing_external_ids_returns_set() -> None:
         "content": "Content 2",
     }
 
-    storage.create_or_update_content(content1)
-    storage.create_or_update_content(content2)
+    # Seed both rows under one commit
+    with storage.transaction():
+        for content in (content1, content2):
+            storage.create_or_update_content(content)
 
     # Should return set with external_ids
     result = storage.get_existing_external_ids(source_id)
@@ -106,21 +108,9 @@ def test_get_existing_external_ids_returns_set() -> None:
     assert "item-1" in result  # Should be fast set lookup
     assert "nonexistent" not in result
 
-    # Cleanup
-    import shutil
 
-    shutil.rmtree(temp_dir, ignore_errors=True)
-
-
-def test_get_by_external_id_returns_dict_or_none() -> None:
+def test_get_by_external_id_returns_dict_or_none(storage: Storage) -> None:
     """Test that _get_by_external_id returns dict for existing, None for missing."""
-    # Create temporary test database
-    temp_dir = tempfile.mkdtemp()
-    db_path = Path(temp_dir) / "test.db"
-    init_db(db_path)
-
-    storage = Storage(db_path)
-
     # Test with non-existent external_id
     result = storage._get_by_external_id("nonexistent")
     assert result is None
@@ -163,8 +153,3 @@ def test_get_by_external_id_returns_dict_or_none() -> None:
     # Test with different non-existent external_id
     result2 = storage._get_by_external_id("different-nonexistent")
     assert result2 is None
-
-    # Cleanup
-    import shutil
-
-    shutil.rmtree(temp_dir, ignore_errors=True)
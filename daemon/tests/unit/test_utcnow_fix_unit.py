@@ -101,16 +101,14 @@ def test_no_datetime_utcnow_in_daemon_source() -> None:
 # Risk: HIGH -- DATA PERSISTENCE. Every reddit content row has fetched_at set
 # by this method. Naive output writes a tz-less ISO string to storage.
 #
-# Runtime test via fixed reddit_mocks fixture (lambda __str__ arity corrected).
+# Runtime test via the reddit_mocks submission stubs.
 # ---------------------------------------------------------------------------
 
 
 def test_reddit_fetcher_to_content_item_fetched_at_is_tz_aware() -> None:
     """INV-DEP-FETCH-2 (reddit): _to_content_item() fetched_at must have tzinfo.
 
-    Uses create_self_post_mock() after fixing the __str__ lambda arity bug in
-    reddit_mocks.py (was lambda: 'python', must be lambda self: 'python' so
-    Mock's method dispatch can pass self).
+    Uses the create_self_post_mock() submission stub from reddit_mocks.py.
     """
     from prismis_daemon.fetchers.reddit import RedditFetcher
     from tests.fixtures.reddit_mocks import create_self_post_mock
@@ -1,5 +1,9 @@
 """Unit tests for SourceValidator - protecting invariants."""
 
+import asyncio
+
+import pytest
+
 from prismis_daemon.validator import SourceValidator
 
 
@@ -67,3 +71,24 @@ def test_user_agent_configuration() -> None:
     assert "Prismis" in validator.user_agent, "User-Agent should identify as Prismis"
 
     # This prevents Reddit from blocking our requests
+
+
+@pytest.mark.asyncio
+async def test_async_validation_matches_sync_contract() -> None:
+    """
+    INVARIANT: avalidate_source returns exactly what validate_source returns
+    BREAKS: API handlers diverge from CLI validation results
+    """
+    validator = SourceValidator()
+
+    cases = [
+        ("http://example.com", "unknown"),
+        ("youtube://@veritasium", "youtube"),
+        ("https://youtube.com/watch?v=abc", "youtube"),
+    ]
+
+    results = await asyncio.gather(
+        *(validator.avalidate_source(url, kind) for url, kind in cases)
+    )
+
+    assert results == [validator.validate_source(url, kind) for url, kind in cases]